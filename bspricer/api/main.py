@@ -1,18 +1,24 @@
 from __future__ import annotations
 
+import math
 from typing import Annotated, Literal, Union
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel, Field
 
 from bspricer.instruments.vanilla import EquityOption, FXOption, RateOption, OptionType
+from bspricer.instruments.exotics import AsianOption, AverageType, BarrierOption, BarrierType, DigitalOption
 from bspricer.instruments.credit import CreditDefaultSwap
 from bspricer.pricing.analytics import (
     price_equity_option,
     price_fx_option,
     greeks_equity_option,
     greeks_fx_option,
+    price_asian_option,
+    price_barrier_option,
+    price_digital_option,
 )
 from bspricer.pricing.monte_carlo import (
+    _BGK_SHIFT,
     price_asian_option_mc,
     price_barrier_option_mc,
     price_digital_option_mc,
@@ -75,6 +81,7 @@ class AsianOptionRequest(BaseModel):
     dividend_yield: float = 0.0
     vol: float
     option_type: Literal["call", "put"] = "call"
+    average: Literal["arithmetic", "geometric"] = "arithmetic"
 
 
 class DigitalOptionRequest(BaseModel):
@@ -114,9 +121,12 @@ InstrumentRequest = Annotated[
 ]
 
 
+Engine = Literal["analytic", "mc", "auto"]
+
+
 class PriceRequest(BaseModel):
     request: InstrumentRequest
-    engine: Literal["analytic", "mc"] | None = None
+    engine: Engine | None = None
     n_paths: int = 50000
     n_steps: int = 252
     seed: int | None = None
@@ -128,7 +138,7 @@ class GreeksRequest(BaseModel):
 
 class BatchPriceRequest(BaseModel):
     requests: list[InstrumentRequest]
-    engine: Literal["analytic", "mc"] | None = None
+    engine: Engine | None = None
     n_paths: int = 50000
     n_steps: int = 252
     seed: int | None = None
@@ -150,8 +160,31 @@ def health() -> dict:
     return {"status": "ok"}
 
 
-def _price_single(req: InstrumentRequest, engine: str | None, n_paths: int, n_steps: int, seed: int | None) -> float:
+def _resolve_engine(engine: str | None, has_closed_form: bool, has_mc: bool = True) -> str:
+    # Instruments without a Monte Carlo engine are always analytic, so "mc" batches mixing them with
+    # exotics still price; asking for a closed form that does not exist is a client error.
+    engine = engine or "auto"
+    if engine == "auto" or (engine == "mc" and not has_mc):
+        return "analytic" if has_closed_form else "mc"
+    if engine == "analytic" and not has_closed_form:
+        raise HTTPException(status_code=422, detail="No closed-form engine for this instrument")
+    return engine
+
+
+def _discrete_barrier(barrier: float, barrier_type: str, vol: float, maturity: float, steps: int) -> float:
+    shift = math.exp(_BGK_SHIFT * vol * math.sqrt(maturity / steps))
+    return barrier * shift if barrier_type.startswith("up") else barrier / shift
+
+
+def _price_single(
+    req: InstrumentRequest,
+    engine: str | None,
+    n_paths: int,
+    n_steps: int,
+    seed: int | None,
+) -> tuple[float, str]:
     if isinstance(req, EquityOptionRequest):
+        used = _resolve_engine(engine, has_closed_form=True, has_mc=False)
         option = EquityOption(
             spot=req.spot,
             strike=req.strike,
@@ -161,8 +194,9 @@ def _price_single(req: InstrumentRequest, engine: str | None, n_paths: int, n_st
             vol=req.vol,
             option_type=OptionType(req.option_type),
         )
-        return price_equity_option(option)
+        return price_equity_option(option), used
     if isinstance(req, FXOptionRequest):
+        used = _resolve_engine(engine, has_closed_form=True, has_mc=False)
         option = FXOption(
             spot=req.spot,
             strike=req.strike,
@@ -172,8 +206,9 @@ def _price_single(req: InstrumentRequest, engine: str | None, n_paths: int, n_st
             vol=req.vol,
             option_type=OptionType(req.option_type),
         )
-        return price_fx_option(option)
+        return price_fx_option(option), used
     if isinstance(req, RateOptionRequest):
+        used = _resolve_engine(engine, has_closed_form=True, has_mc=False)
         option = RateOption(
             forward=req.forward,
             strike=req.strike,
@@ -182,8 +217,24 @@ def _price_single(req: InstrumentRequest, engine: str | None, n_paths: int, n_st
             vol=req.vol,
             option_type=OptionType(req.option_type),
         )
-        return price_rate_option(option)
+        return price_rate_option(option), used
     if isinstance(req, BarrierOptionRequest):
+        used = _resolve_engine(engine, has_closed_form=True)
+        if used == "analytic":
+            # Same n_steps monitoring dates as the Monte Carlo engine: the continuous formula on the
+            # barrier moved away from the spot by exp(0.5826 vol sqrt(dt)) (Broadie-Glasserman-Kou).
+            option = BarrierOption(
+                spot=req.spot,
+                strike=req.strike,
+                maturity=req.maturity,
+                rate=req.rate,
+                dividend_yield=req.dividend_yield,
+                vol=req.vol,
+                barrier=_discrete_barrier(req.barrier, req.barrier_type, req.vol, req.maturity, n_steps),
+                barrier_type=BarrierType(req.barrier_type),
+                option_type=OptionType(req.option_type),
+            )
+            return price_barrier_option(option), used
         return price_barrier_option_mc(
             spot=req.spot,
             strike=req.strike,
@@ -197,8 +248,22 @@ def _price_single(req: InstrumentRequest, engine: str | None, n_paths: int, n_st
             n_paths=n_paths,
             steps=n_steps,
             seed=seed,
-        )
+        ), used
     if isinstance(req, AsianOptionRequest):
+        used = _resolve_engine(engine, has_closed_form=req.average == "geometric")
+        if used == "analytic":
+            option = AsianOption(
+                spot=req.spot,
+                strike=req.strike,
+                maturity=req.maturity,
+                rate=req.rate,
+                dividend_yield=req.dividend_yield,
+                vol=req.vol,
+                option_type=OptionType(req.option_type),
+                average=AverageType(req.average),
+            )
+            # Same discrete fixings as the Monte Carlo engine.
+            return price_asian_option(option, steps=n_steps), used
         return price_asian_option_mc(
             spot=req.spot,
             strike=req.strike,
@@ -210,8 +275,22 @@ def _price_single(req: InstrumentRequest, engine: str | None, n_paths: int, n_st
             n_paths=n_paths,
             steps=n_steps,
             seed=seed,
-        )
+            average=req.average,
+        ), used
     if isinstance(req, DigitalOptionRequest):
+        used = _resolve_engine(engine, has_closed_form=True)
+        if used == "analytic":
+            option = DigitalOption(
+                spot=req.spot,
+                strike=req.strike,
+                maturity=req.maturity,
+                rate=req.rate,
+                dividend_yield=req.dividend_yield,
+                vol=req.vol,
+                payout=req.payout,
+                option_type=OptionType(req.option_type),
+            )
+            return price_digital_option(option), used
         return price_digital_option_mc(
             spot=req.spot,
             strike=req.strike,
@@ -224,8 +303,9 @@ def _price_single(req: InstrumentRequest, engine: str | None, n_paths: int, n_st
             n_paths=n_paths,
             steps=n_steps,
             seed=seed,
-        )
+        ), used
     if isinstance(req, CDSRequest):
+        used = _resolve_engine(engine, has_closed_form=True, has_mc=False)
         cds = CreditDefaultSwap(
             notional=req.notional,
             spread=req.spread,
@@ -235,25 +315,29 @@ def _price_single(req: InstrumentRequest, engine: str | None, n_paths: int, n_st
             recovery_rate=req.recovery_rate,
             discount_rate=req.discount_rate,
         )
-        return price_cds(cds)
+        return price_cds(cds), used
     raise ValueError("Unsupported instrument")
 
 
 @app.post("/price")
 def price(request: PriceRequest) -> dict:
-    used_engine = request.engine or "analytic"
-    price_value = _price_single(request.request, used_engine, request.n_paths, request.n_steps, request.seed)
+    price_value, used_engine = _price_single(
+        request.request, request.engine, request.n_paths, request.n_steps, request.seed
+    )
     return {"price": price_value, "engine": used_engine}
 
 
 @app.post("/batch")
 def batch_price(request: BatchPriceRequest) -> dict:
-    used_engine = request.engine or "analytic"
-    prices = [
-        _price_single(item, used_engine, request.n_paths, request.n_steps, request.seed)
+    results = [
+        _price_single(item, request.engine, request.n_paths, request.n_steps, request.seed)
         for item in request.requests
     ]
-    return {"prices": prices, "engine": used_engine}
+    return {
+        "prices": [value for value, _ in results],
+        "engine": request.engine or "auto",
+        "engines": [used for _, used in results],
+    }
 
 
 @app.post("/greeks")
@@ -1,3 +1,5 @@
-from .implied_vol import implied_vol_newton
+from .implied_vol import implied_vol_newton, implied_vol_many
+from .iv_table import ImpliedVolTable
+from .surface import SviParams, VolSurface, fit_svi_slice
 
-__all__ = ["implied_vol_newton"]
+__all__ = ["implied_vol_newton", "implied_vol_many", "ImpliedVolTable", "SviParams", "VolSurface", "fit_svi_slice"]
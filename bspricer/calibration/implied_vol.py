@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from bspricer.models.black_scholes import price as bs_price, greeks as bs_greeks
+import math
+
+import numpy as np
+
+from bspricer.models.black_scholes import _call_mask, _price_and_greeks_array, price_and_greeks as bs_price_and_greeks
 
 
 def implied_vol_newton(
@@ -16,14 +20,126 @@ def implied_vol_newton(
 ) -> float:
     vol = 0.2
     for _ in range(max_iter):
-        price = bs_price(spot, strike, maturity, rate, dividend_yield, vol, option_type)
-        diff = price - target_price
+        result = bs_price_and_greeks(spot, strike, maturity, rate, dividend_yield, vol, option_type)
+        diff = result["price"] - target_price
         if abs(diff) < tol:
             return max(vol, 1e-6)
-        vega = bs_greeks(spot, strike, maturity, rate, dividend_yield, vol, option_type)["vega"]
+        vega = result["vega"]
         if vega < 1e-8:
             break
         vol -= diff / vega
         if vol <= 0.0:
             vol = 1e-6
     return max(vol, 1e-6)
+
+
+def _initial_vol_guess(
+    call_price: np.ndarray,
+    fwd_spot: np.ndarray,
+    fwd_strike: np.ndarray,
+    maturity: np.ndarray,
+) -> np.ndarray:
+    # Corrado-Miller rational approximation on the call-equivalent price.
+    half_gap = 0.5 * (fwd_spot - fwd_strike)
+    excess = call_price - half_gap
+    radicand = np.maximum(excess * excess - (fwd_spot - fwd_strike) ** 2 / math.pi, 0.0)
+    total_vol = math.sqrt(2.0 * math.pi) / (fwd_spot + fwd_strike) * (excess + np.sqrt(radicand))
+    return np.clip(total_vol / np.sqrt(maturity), 0.01, 3.0)
+
+
+def _otm_quotes(
+    target_price: np.ndarray,
+    fwd_spot: np.ndarray,
+    fwd_strike: np.ndarray,
+    is_call: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    # Solve on the out-of-the-money side, where the quote carries all of its time value.
+    call_price = np.where(is_call, target_price, target_price + fwd_spot - fwd_strike)
+    otm_call = fwd_spot <= fwd_strike
+    return np.where(otm_call, call_price, call_price - fwd_spot + fwd_strike), otm_call
+
+
+def _log_price_halley_step(
+    model_price: np.ndarray,
+    target_price: np.ndarray,
+    vega: np.ndarray,
+    volga: np.ndarray,
+) -> np.ndarray:
+    # Newton/Halley on log-price keeps far out-of-the-money quotes well conditioned.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = vega / model_price
+        newton = (np.log(model_price) - np.log(target_price)) / slope
+        halley_denominator = 1.0 - 0.5 * newton * (volga / vega - slope)
+        return np.where(halley_denominator > 0.5, newton / halley_denominator, newton)
+
+
+def implied_vol_many(
+    target_price: np.ndarray,
+    spot: np.ndarray,
+    strike: np.ndarray,
+    maturity: np.ndarray,
+    rate: np.ndarray,
+    dividend_yield: np.ndarray,
+    option_type="call",
+    vol_tol: float = 1e-8,
+    max_iter: int = 50,
+    vol_upper: float = 10.0,
+) -> dict[str, np.ndarray]:
+    target_price, spot, strike, maturity, rate, dividend_yield, is_call = np.broadcast_arrays(
+        np.asarray(target_price, dtype=float),
+        np.asarray(spot, dtype=float),
+        np.asarray(strike, dtype=float),
+        np.asarray(maturity, dtype=float),
+        np.asarray(rate, dtype=float),
+        np.asarray(dividend_yield, dtype=float),
+        _call_mask(option_type),
+    )
+    shape = target_price.shape
+    target_price, spot, strike, maturity, rate, dividend_yield, is_call = (
+        a.reshape(-1) for a in (target_price, spot, strike, maturity, rate, dividend_yield, is_call)
+    )
+    n = target_price.shape[0]
+    fwd_spot = spot * np.exp(-dividend_yield * maturity)
+    fwd_strike = strike * np.exp(-rate * maturity)
+    otm_price, otm_call = _otm_quotes(target_price, fwd_spot, fwd_strike, is_call)
+    valid = (maturity > 0.0) & (otm_price > 0.0) & (otm_price < np.where(otm_call, fwd_spot, fwd_strike))
+
+    vol = np.full(n, np.nan)
+    converged = np.zeros(n, dtype=bool)
+    iterations = np.zeros(n, dtype=np.int64)
+    safe_maturity = np.where(valid, maturity, 1.0)
+    call_price = np.where(otm_call, otm_price, otm_price + fwd_spot - fwd_strike)
+    vol[valid] = _initial_vol_guess(call_price, fwd_spot, fwd_strike, safe_maturity)[valid]
+    lo = np.zeros(n)
+    hi = np.full(n, vol_upper)
+
+    active = np.flatnonzero(valid)
+    for iteration in range(1, max_iter + 1):
+        if active.size == 0:
+            break
+        sigma = vol[active]
+        result = _price_and_greeks_array(
+            spot[active], strike[active], maturity[active], rate[active], dividend_yield[active], sigma, otm_call[active]
+        )
+        model_price = result["price"]
+        diff = model_price - otm_price[active]
+        iterations[active] = iteration
+
+        above = diff > 0.0
+        hi[active] = np.where(above, np.minimum(hi[active], sigma), hi[active])
+        lo[active] = np.where(above, lo[active], np.maximum(lo[active], sigma))
+        vega = result["vega"]
+        step = _log_price_halley_step(model_price, otm_price[active], vega, result["volga"])
+        proposal = sigma - step
+        finite = np.isfinite(step) & (vega > 0.0) & (model_price > 0.0)
+        inside = finite & (proposal > lo[active]) & (proposal < hi[active])
+        done = (finite & (np.abs(step) < vol_tol)) | (hi[active] - lo[active] < vol_tol) | (diff == 0.0)
+        converged[active[done]] = True
+        bisect = 0.5 * (lo[active] + hi[active])
+        vol[active] = np.where(inside, proposal, np.where(done, sigma, bisect))
+        active = active[~done]
+    return {
+        "vol": vol.reshape(shape),
+        "converged": converged.reshape(shape),
+        "iterations": iterations.reshape(shape),
+    }
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from bspricer.calibration.implied_vol import _log_price_halley_step, _otm_quotes, implied_vol_many
+from bspricer.models.black_scholes import _call_mask, _price_and_greeks_array
+
+
+_MONEYNESS_SCALE = 1e-3
+
+
+def _log_normalized_price(abs_log_moneyness: float, total_vol: np.ndarray) -> np.ndarray:
+    # log of the out-of-the-money normalized Black price divided by its large-vol limit exp(-|x|/2).
+    erfc = np.vectorize(math.erfc, otypes=[float])
+    a = abs_log_moneyness
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        upper = 0.5 * erfc((a / total_vol - 0.5 * total_vol) / math.sqrt(2.0))
+        lower = 0.5 * erfc((a / total_vol + 0.5 * total_vol) / math.sqrt(2.0))
+        return np.log(upper - math.exp(a) * lower)
+
+
+@dataclass(frozen=True)
+class ImpliedVolTable:
+    log_total_vol: np.ndarray
+    max_log_moneyness: float
+    zeta_min: float
+    zeta_max: float
+
+    @classmethod
+    def build(
+        cls,
+        n_moneyness: int = 161,
+        n_price: int = 321,
+        max_log_moneyness: float = 4.0,
+        zeta_min: float = math.log(1e-3),
+        zeta_max: float = math.log(37.0),
+    ) -> ImpliedVolTable:
+        # Rows: |log(F/K)| on an asinh grid dense near the money. Columns: zeta = log(sqrt(-2 log u)),
+        # where u is the normalized price; deep out of the money zeta ~ log(|x| / total vol).
+        moneyness = _MONEYNESS_SCALE * np.sinh(
+            np.linspace(0.0, 1.0, n_moneyness) * math.asinh(max_log_moneyness / _MONEYNESS_SCALE)
+        )
+        zeta_grid = np.linspace(zeta_min, zeta_max, n_price)
+        total_vols = np.exp(np.linspace(math.log(1e-5), math.log(10.0), 8000))
+        table = np.empty((n_moneyness, n_price))
+        for i, a in enumerate(moneyness):
+            log_u = _log_normalized_price(a, total_vols)
+            ok = np.isfinite(log_u) & (log_u < 0.0)
+            zeta = np.log(np.sqrt(-2.0 * log_u[ok]))
+            table[i] = np.interp(zeta_grid, zeta[::-1], np.log(total_vols[ok])[::-1], left=np.nan, right=np.nan)
+        return cls(table, max_log_moneyness, zeta_min, zeta_max)
+
+    def save(self, path: str | Path) -> None:
+        path = Path(path)
+        np.save(path.with_suffix(".npy"), np.ascontiguousarray(self.log_total_vol))
+        meta = {
+            "max_log_moneyness": self.max_log_moneyness,
+            "zeta_min": self.zeta_min,
+            "zeta_max": self.zeta_max,
+        }
+        path.with_suffix(".json").write_text(json.dumps(meta))
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> ImpliedVolTable:
+        path = Path(path)
+        meta = json.loads(path.with_suffix(".json").read_text())
+        table = np.load(path.with_suffix(".npy"), mmap_mode="r" if mmap else None)
+        return cls(table, meta["max_log_moneyness"], meta["zeta_min"], meta["zeta_max"])
+
+    def _lookup(self, abs_log_moneyness: np.ndarray, zeta: np.ndarray) -> np.ndarray:
+        n_moneyness, n_price = self.log_total_vol.shape
+        fa = np.arcsinh(abs_log_moneyness / _MONEYNESS_SCALE) / math.asinh(self.max_log_moneyness / _MONEYNESS_SCALE)
+        fa = fa * (n_moneyness - 1)
+        fz = (zeta - self.zeta_min) / (self.zeta_max - self.zeta_min) * (n_price - 1)
+        i = np.clip(fa.astype(np.int64), 0, n_moneyness - 2)
+        j = np.clip(fz.astype(np.int64), 0, n_price - 2)
+        wa = fa - i
+        wz = fz - j
+        grid = self.log_total_vol
+        return (1.0 - wa) * ((1.0 - wz) * grid[i, j] + wz * grid[i, j + 1]) + wa * (
+            (1.0 - wz) * grid[i + 1, j] + wz * grid[i + 1, j + 1]
+        )
+
+    def implied_vol(
+        self,
+        target_price: np.ndarray,
+        spot: np.ndarray,
+        strike: np.ndarray,
+        maturity: np.ndarray,
+        rate: np.ndarray,
+        dividend_yield: np.ndarray,
+        option_type="call",
+    ) -> np.ndarray:
+        target_price, spot, strike, maturity, rate, dividend_yield, is_call = np.broadcast_arrays(
+            np.asarray(target_price, dtype=float),
+            np.asarray(spot, dtype=float),
+            np.asarray(strike, dtype=float),
+            np.asarray(maturity, dtype=float),
+            np.asarray(rate, dtype=float),
+            np.asarray(dividend_yield, dtype=float),
+            _call_mask(option_type),
+        )
+        shape = target_price.shape
+        target_price, spot, strike, maturity, rate, dividend_yield, is_call = (
+            a.reshape(-1) for a in (target_price, spot, strike, maturity, rate, dividend_yield, is_call)
+        )
+        df_r = np.exp(-rate * maturity)
+        fwd_spot = spot * np.exp(-dividend_yield * maturity)
+        fwd_strike = strike * df_r
+        otm_price, otm_call = _otm_quotes(target_price, fwd_spot, fwd_strike, is_call)
+        abs_log_moneyness = np.abs(np.log(fwd_spot / fwd_strike))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_u = np.log(otm_price / np.sqrt(fwd_spot * fwd_strike)) + 0.5 * abs_log_moneyness
+            zeta = np.log(np.sqrt(-2.0 * log_u))
+            sqrt_t = np.sqrt(maturity)
+            vol = np.exp(self._lookup(abs_log_moneyness, zeta)) / sqrt_t
+        in_table = (
+            (maturity > 0.0)
+            & (otm_price > 0.0)
+            & (abs_log_moneyness <= self.max_log_moneyness)
+            & (zeta >= self.zeta_min)
+            & (zeta <= self.zeta_max)
+            & np.isfinite(vol)
+        )
+
+        hit = np.flatnonzero(in_table)
+        result = _price_and_greeks_array(
+            spot[hit], strike[hit], maturity[hit], rate[hit], dividend_yield[hit], vol[hit], otm_call[hit]
+        )
+        step = _log_price_halley_step(result["price"], otm_price[hit], result["vega"], result["volga"])
+        vol[hit] = np.where(np.isfinite(step), vol[hit] - step, vol[hit])
+
+        miss = np.flatnonzero(~in_table)
+        if miss.size:
+            vol[miss] = implied_vol_many(
+                target_price[miss], spot[miss], strike[miss], maturity[miss], rate[miss], dividend_yield[miss], is_call[miss]
+            )["vol"]
+        return vol.reshape(shape)
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from bspricer.calibration.implied_vol import implied_vol_many
+
+
+@dataclass(frozen=True)
+class SviParams:
+    a: float
+    b: float
+    rho: float
+    m: float
+    sigma: float
+
+    def total_variance(self, log_moneyness: np.ndarray) -> np.ndarray:
+        k = np.asarray(log_moneyness, dtype=float) - self.m
+        return self.a + self.b * (self.rho * k + np.sqrt(k * k + self.sigma * self.sigma))
+
+
+def _svi_linear_fit(
+    log_moneyness: np.ndarray,
+    total_variance: np.ndarray,
+    weights: np.ndarray,
+    m: np.ndarray,
+    sigma: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    # Quasi-explicit SVI: for fixed (m, sigma), w = a + d*y + c*sqrt(y^2 + 1) is linear in (a, d, c).
+    y = (log_moneyness[None, :] - m[:, None]) / sigma[:, None]
+    z = np.sqrt(y * y + 1.0)
+    basis = np.stack([np.ones_like(y), y, z], axis=-1)
+    weighted = basis * weights[None, :, None]
+    normal = np.einsum("pni,pnj->pij", weighted, basis) + 1e-12 * np.eye(3)
+    rhs = np.einsum("pni,n->pi", weighted, total_variance)
+    coef = np.linalg.solve(normal, rhs[..., None])[..., 0]
+    residual = basis @ coef[..., None]
+    error = np.einsum("pn,n->p", (residual[..., 0] - total_variance[None, :]) ** 2, weights)
+    a, d, c = coef[:, 0], coef[:, 1], coef[:, 2]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        min_variance = a + c * np.sqrt(np.maximum(1.0 - (d / c) ** 2, 0.0))
+    admissible = (c > 0.0) & (np.abs(d) <= c) & (min_variance >= 0.0)
+    return coef, np.where(admissible, error, np.inf)
+
+
+def fit_svi_slice(
+    log_moneyness: np.ndarray,
+    total_variance: np.ndarray,
+    weights: np.ndarray | None = None,
+    initial: SviParams | None = None,
+    grid_size: int = 15,
+    n_rounds: int = 6,
+) -> SviParams:
+    log_moneyness = np.asarray(log_moneyness, dtype=float)
+    total_variance = np.asarray(total_variance, dtype=float)
+    weights = np.ones_like(total_variance) if weights is None else np.asarray(weights, dtype=float)
+    span = max(float(np.ptp(log_moneyness)), 0.05)
+    if initial is None:
+        m_center, m_width = float(np.median(log_moneyness)), span
+        log_sigma_center, log_sigma_width = np.log(0.1 * span + 1e-3), 3.0
+    else:
+        # Warm start: search a narrow window around the previous snapshot's parameters.
+        m_center, m_width = initial.m, 0.1 * span
+        log_sigma_center, log_sigma_width = np.log(initial.sigma), 0.5
+        n_rounds = max(n_rounds // 2, 2)
+    best = None
+    for _ in range(n_rounds):
+        m_axis = m_center + np.linspace(-m_width, m_width, grid_size)
+        sigma_axis = np.exp(log_sigma_center + np.linspace(-log_sigma_width, log_sigma_width, grid_size))
+        m_grid, sigma_grid = (g.ravel() for g in np.meshgrid(m_axis, sigma_axis, indexing="ij"))
+        coef, error = _svi_linear_fit(log_moneyness, total_variance, weights, m_grid, sigma_grid)
+        i = int(np.argmin(error))
+        if np.isfinite(error[i]) and (best is None or error[i] <= best[0]):
+            best = (error[i], coef[i], m_grid[i], sigma_grid[i])
+        if best is not None:
+            m_center, log_sigma_center = best[2], np.log(best[3])
+        m_width *= 0.35
+        log_sigma_width *= 0.35
+    if best is None:
+        raise ValueError("SVI fit found no admissible parameters for this slice")
+    _, (a, d, c), m, sigma = best
+    return SviParams(a=float(a), b=float(c / sigma), rho=float(d / c), m=float(m), sigma=float(sigma))
+
+
+class VolSurface:
+    def __init__(
+        self,
+        spot: float,
+        rate: float,
+        dividend_yield: float,
+        maturities: np.ndarray,
+        params: list[SviParams],
+    ) -> None:
+        order = np.argsort(maturities)
+        self.spot = spot
+        self.rate = rate
+        self.dividend_yield = dividend_yield
+        self.maturities = np.asarray(maturities, dtype=float)[order]
+        self.params = [params[i] for i in order]
+        self._param_matrix = np.array([[p.a, p.b, p.rho, p.m, p.sigma] for p in self.params])
+
+    @classmethod
+    def calibrate(
+        cls,
+        quotes: pd.DataFrame,
+        spot: float,
+        rate: float,
+        dividend_yield: float = 0.0,
+        previous: VolSurface | None = None,
+        workers: int | None = None,
+    ) -> VolSurface:
+        maturity = quotes["maturity"].to_numpy(dtype=float)
+        strike = quotes["strike"].to_numpy(dtype=float)
+        if "implied_vol" in quotes:
+            vol = quotes["implied_vol"].to_numpy(dtype=float)
+        else:
+            option_type = quotes["option_type"].to_numpy() if "option_type" in quotes else "call"
+            vol = implied_vol_many(
+                quotes["price"].to_numpy(dtype=float), spot, strike, maturity, rate, dividend_yield, option_type
+            )["vol"]
+        log_moneyness = np.log(strike / spot) - (rate - dividend_yield) * maturity
+        usable = np.isfinite(vol) & (maturity > 0.0)
+        slices = np.unique(maturity[usable])
+
+        def fit(t: float) -> SviParams:
+            mask = usable & (maturity == t)
+            initial = previous.params_for(t) if previous is not None else None
+            return fit_svi_slice(log_moneyness[mask], vol[mask] ** 2 * t, initial=initial)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            params = list(pool.map(fit, slices))
+        return cls(spot, rate, dividend_yield, slices, params)
+
+    def params_for(self, maturity: float) -> SviParams:
+        i = int(np.argmin(np.abs(self.maturities - maturity)))
+        return self.params[i]
+
+    def _slice_total_variance(self, index: np.ndarray, log_moneyness: np.ndarray) -> np.ndarray:
+        a, b, rho, m, sigma = self._param_matrix[index].T
+        k = log_moneyness - m
+        return a + b * (rho * k + np.sqrt(k * k + sigma * sigma))
+
+    def total_variance(self, strike: np.ndarray, maturity: np.ndarray) -> np.ndarray:
+        strike, maturity = np.broadcast_arrays(np.asarray(strike, dtype=float), np.asarray(maturity, dtype=float))
+        log_moneyness = np.log(strike / self.spot) - (self.rate - self.dividend_yield) * maturity
+        n = self.maturities.shape[0]
+        upper = np.clip(np.searchsorted(self.maturities, maturity), 1, max(n - 1, 1))
+        lower = upper - 1 if n > 1 else np.zeros_like(upper)
+        upper = np.minimum(upper, n - 1)
+        t0 = self.maturities[lower]
+        t1 = self.maturities[upper]
+        w0 = self._slice_total_variance(lower, log_moneyness)
+        w1 = self._slice_total_variance(upper, log_moneyness)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weight = np.where(t1 > t0, (maturity - t0) / (t1 - t0), 0.0)
+        inside = w0 + np.clip(weight, 0.0, 1.0) * (w1 - w0)
+        # Outside the quoted expiries, hold implied vol flat at the nearest slice.
+        before = w0 * maturity / t0
+        after = w1 * maturity / t1
+        return np.where(maturity < t0, before, np.where(maturity > t1, after, inside))
+
+    def vol(self, strike: np.ndarray, maturity: np.ndarray) -> np.ndarray:
+        maturity = np.asarray(maturity, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.sqrt(np.maximum(self.total_variance(strike, maturity), 0.0) / maturity)
@@ -6,3 +6,24 @@ class MarketEnvironment:
     rate: float
     dividend_yield: float = 0.0
     foreign_rate: float = 0.0
+
+
+@dataclass(frozen=True)
+class MonteCarloSettings:
+    chunk_size: int = 16384
+    sampler: str = "pseudo"
+    replicates: int = 8
+    brownian_bridge: bool = True
+    antithetic: bool = False
+    workers: int | None = None
+    dtype: str = "float64"
+    # "numba" prices single payoffs in one parallel kernel with in-kernel random numbers.
+    backend: str = "numpy"
+    # Importance sampling: shocks follow a defensive mixture of drift shifts chosen per payoff;
+    # paths carry likelihood-ratio weights.
+    importance_sampling: bool = False
+    # Adaptive stopping: simulate seed blocks until a target is met; n_paths becomes the path budget.
+    # max_seconds also caps runs without a target (after at least one batch of blocks).
+    target_stderr: float | None = None
+    target_rel_stderr: float | None = None
+    max_seconds: float | None = None
@@ -1,12 +1,14 @@
-from .vanilla import OptionType, EquityOption, FXOption, RateOption
-from .exotics import BarrierType, BarrierOption, AsianOption, DigitalOption
+from .vanilla import OptionType, ExerciseStyle, EquityOption, FXOption, RateOption
+from .exotics import AverageType, BarrierType, BarrierOption, AsianOption, DigitalOption
 from .credit import CreditDefaultSwap
 
 __all__ = [
     "OptionType",
+    "ExerciseStyle",
     "EquityOption",
     "FXOption",
     "RateOption",
+    "AverageType",
     "BarrierType",
     "BarrierOption",
     "AsianOption",
@@ -10,6 +10,11 @@ class BarrierType(str, Enum):
     DOWN_AND_IN = "down-and-in"
 
 
+class AverageType(str, Enum):
+    ARITHMETIC = "arithmetic"
+    GEOMETRIC = "geometric"
+
+
 @dataclass(frozen=True)
 class BarrierOption:
     spot: float
@@ -32,6 +37,7 @@ class AsianOption:
     dividend_yield: float
     vol: float
     option_type: OptionType = OptionType.CALL
+    average: AverageType = AverageType.ARITHMETIC
 
 
 @dataclass(frozen=True)
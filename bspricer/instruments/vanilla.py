@@ -7,6 +7,11 @@ class OptionType(str, Enum):
     PUT = "put"
 
 
+class ExerciseStyle(str, Enum):
+    EUROPEAN = "european"
+    AMERICAN = "american"
+
+
 @dataclass(frozen=True)
 class EquityOption:
     spot: float
@@ -16,6 +21,7 @@ class EquityOption:
     dividend_yield: float
     vol: float
     option_type: OptionType = OptionType.CALL
+    exercise: ExerciseStyle = ExerciseStyle.EUROPEAN
 
 
 @dataclass(frozen=True)
@@ -27,6 +33,7 @@ class FXOption:
     foreign_rate: float
     vol: float
     option_type: OptionType = OptionType.CALL
+    exercise: ExerciseStyle = ExerciseStyle.EUROPEAN
 
 
 @dataclass(frozen=True)
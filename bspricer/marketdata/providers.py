@@ -20,3 +20,9 @@ class CsvMarketDataProvider:
         df = pd.read_csv(path)
         df.columns = ["tenor", "rate"]
         return df
+
+    def load_option_quotes(self, symbol: str) -> pd.DataFrame:
+        path = self.root / f"{symbol}_options.csv"
+        df = pd.read_csv(path)
+        df.columns = ["maturity", "strike", "option_type", "price"]
+        return df
@@ -1,5 +1,26 @@
 from .black_scholes import price as bs_price, greeks as bs_greeks
-from .garman_kohlhagen import price as gk_price
-from .black_76 import price as black_76_price
+from .black_scholes import price_many as bs_price_many, greeks_many as bs_greeks_many
+from .black_scholes import price_and_greeks as bs_price_and_greeks
+from .garman_kohlhagen import price as gk_price, price_many as gk_price_many
+from .black_76 import price as black_76_price, price_many as black_76_price_many
+from .geometric_asian import price as geometric_asian_price
+from .barrier import price as barrier_price
+from .digital import price as digital_price
+from .characteristic import black_scholes_cf, heston_cf
 
-__all__ = ["bs_price", "bs_greeks", "gk_price", "black_76_price"]
+__all__ = [
+    "bs_price",
+    "bs_greeks",
+    "bs_price_many",
+    "bs_greeks_many",
+    "bs_price_and_greeks",
+    "gk_price",
+    "gk_price_many",
+    "black_76_price",
+    "black_76_price_many",
+    "geometric_asian_price",
+    "barrier_price",
+    "digital_price",
+    "black_scholes_cf",
+    "heston_cf",
+]
@@ -0,0 +1,66 @@
+import math
+
+from .black_scholes import _norm_cdf, price as bs_price
+
+
+def price(
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    barrier: float,
+    barrier_type: str,
+    option_type: str = "call",
+) -> float:
+    # Reiner-Rubinstein (1991) single barrier, continuously monitored, no rebate.
+    is_up = "up" in barrier_type
+    is_out = "out" in barrier_type
+    breached = spot >= barrier if is_up else spot <= barrier
+    if breached:
+        return 0.0 if is_out else bs_price(spot, strike, maturity, rate, dividend_yield, vol, option_type)
+    if maturity <= 0.0 or vol <= 0.0:
+        vanilla = bs_price(spot, strike, maturity, rate, dividend_yield, vol, option_type)
+        return vanilla if is_out else 0.0
+
+    phi = 1.0 if option_type == "call" else -1.0
+    eta = -1.0 if is_up else 1.0
+    vsqrt = vol * math.sqrt(maturity)
+    mu = (rate - dividend_yield - 0.5 * vol * vol) / (vol * vol)
+    df_q = math.exp(-dividend_yield * maturity)
+    df_r = math.exp(-rate * maturity)
+    shift = (1.0 + mu) * vsqrt
+    x1 = math.log(spot / strike) / vsqrt + shift
+    x2 = math.log(spot / barrier) / vsqrt + shift
+    y1 = math.log(barrier * barrier / (spot * strike)) / vsqrt + shift
+    y2 = math.log(barrier / spot) / vsqrt + shift
+    ratio = barrier / spot
+    reflect_spot = ratio ** (2.0 * (mu + 1.0))
+    reflect_strike = ratio ** (2.0 * mu)
+
+    a = phi * spot * df_q * _norm_cdf(phi * x1) - phi * strike * df_r * _norm_cdf(phi * (x1 - vsqrt))
+    b = phi * spot * df_q * _norm_cdf(phi * x2) - phi * strike * df_r * _norm_cdf(phi * (x2 - vsqrt))
+    c = phi * spot * df_q * reflect_spot * _norm_cdf(eta * y1) - phi * strike * df_r * reflect_strike * _norm_cdf(
+        eta * (y1 - vsqrt)
+    )
+    d = phi * spot * df_q * reflect_spot * _norm_cdf(eta * y2) - phi * strike * df_r * reflect_strike * _norm_cdf(
+        eta * (y2 - vsqrt)
+    )
+
+    above = strike > barrier
+    if option_type == "call":
+        if not is_up:
+            knock_in = c if above else a - b + d
+        else:
+            knock_in = a if above else b - c + d
+    else:
+        if not is_up:
+            knock_in = b - c + d if above else a
+        else:
+            knock_in = a - b + d if above else c
+    if not is_out:
+        return max(knock_in, 0.0)
+    # In-out parity: without rebates, knock-in plus knock-out is the vanilla option.
+    vanilla = bs_price(spot, strike, maturity, rate, dividend_yield, vol, option_type)
+    return max(vanilla - knock_in, 0.0)
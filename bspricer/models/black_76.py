@@ -1,5 +1,8 @@
 import math
-from .black_scholes import _norm_cdf
+
+import numpy as np
+
+from .black_scholes import _norm_cdf, _norm_cdf_array, _call_mask
 
 
 def price(
@@ -19,3 +22,30 @@ def price(
     if option_type == "call":
         return df * (forward * _norm_cdf(d1) - strike * _norm_cdf(d2))
     return df * (strike * _norm_cdf(-d2) - forward * _norm_cdf(-d1))
+
+
+def price_many(
+    forward: np.ndarray,
+    strike: np.ndarray,
+    maturity: np.ndarray,
+    discount_rate: np.ndarray,
+    vol: np.ndarray,
+    option_type="call",
+) -> np.ndarray:
+    forward, strike, maturity, discount_rate, vol, is_call = np.broadcast_arrays(
+        np.asarray(forward, dtype=float),
+        np.asarray(strike, dtype=float),
+        np.asarray(maturity, dtype=float),
+        np.asarray(discount_rate, dtype=float),
+        np.asarray(vol, dtype=float),
+        _call_mask(option_type),
+    )
+    live = (maturity > 0.0) & (vol > 0.0)
+    vsqrt = np.where(live, vol * np.sqrt(np.where(live, maturity, 1.0)), 1.0)
+    d1 = (np.log(forward / strike) + 0.5 * vsqrt * vsqrt) / vsqrt
+    d2 = d1 - vsqrt
+    df = np.exp(-discount_rate * maturity)
+    call = df * (forward * _norm_cdf_array(d1) - strike * _norm_cdf_array(d2))
+    put = df * (strike * _norm_cdf_array(-d2) - forward * _norm_cdf_array(-d1))
+    intrinsic = np.maximum(np.where(is_call, forward - strike, strike - forward), 0.0)
+    return np.where(live, np.where(is_call, call, put), intrinsic)
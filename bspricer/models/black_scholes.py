@@ -1,6 +1,11 @@
 import math
 from typing import Dict
 
+import numpy as np
+
+
+_FIRST_ORDER_GREEKS = ("delta", "gamma", "vega", "theta", "rho")
+
 
 def _norm_cdf(x: float) -> float:
     return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
@@ -10,6 +15,61 @@ def _norm_pdf(x: float) -> float:
     return (1.0 / math.sqrt(2.0 * math.pi)) * math.exp(-0.5 * x * x)
 
 
+def _norm_cdf_array(x: np.ndarray) -> np.ndarray:
+    # Hart (1968) rational approximation, double-precision accurate and fully vectorized.
+    x = np.asarray(x, dtype=float)
+    ax = np.abs(x)
+    expo = np.exp(-0.5 * ax * ax)
+    num = 3.52624965998911e-02 * ax + 0.700383064443688
+    num = num * ax + 6.37396220353165
+    num = num * ax + 33.912866078383
+    num = num * ax + 112.079291497871
+    num = num * ax + 221.213596169931
+    num = num * ax + 220.206867912376
+    den = 8.83883476483184e-02 * ax + 1.75566716318264
+    den = den * ax + 16.064177579207
+    den = den * ax + 86.7807322029461
+    den = den * ax + 296.564248779674
+    den = den * ax + 637.333633378831
+    den = den * ax + 793.826512519948
+    den = den * ax + 440.413735824752
+    tail = np.where(ax < 7.07106781186547, expo * num / den, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cf = ax + 0.65
+        cf = ax + 4.0 / cf
+        cf = ax + 3.0 / cf
+        cf = ax + 2.0 / cf
+        cf = ax + 1.0 / cf
+        far = expo / cf / 2.506628274631
+    tail = np.where(ax < 7.07106781186547, tail, np.where(ax > 37.0, 0.0, far))
+    return np.where(x > 0.0, 1.0 - tail, tail)
+
+
+def _norm_pdf_array(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / math.sqrt(2.0 * math.pi)
+
+
+def _call_mask(option_type) -> np.ndarray:
+    if isinstance(option_type, str):
+        return np.asarray(option_type == "call")
+    mask = np.asarray(option_type)
+    if mask.dtype == bool:
+        return mask
+    return mask == "call"
+
+
+def _broadcast_inputs(spot, strike, maturity, rate, dividend_yield, vol, option_type) -> tuple[np.ndarray, ...]:
+    return np.broadcast_arrays(
+        np.asarray(spot, dtype=float),
+        np.asarray(strike, dtype=float),
+        np.asarray(maturity, dtype=float),
+        np.asarray(rate, dtype=float),
+        np.asarray(dividend_yield, dtype=float),
+        np.asarray(vol, dtype=float),
+        _call_mask(option_type),
+    )
+
+
 def _d1_d2(spot: float, strike: float, maturity: float, rate: float, dividend_yield: float, vol: float) -> tuple[float, float]:
     if maturity <= 0.0 or vol <= 0.0:
         return 0.0, 0.0
@@ -36,41 +96,189 @@ def price(
     return strike * df_r * _norm_cdf(-d2) - spot * df_q * _norm_cdf(-d1)
 
 
-def greeks(
+def _price_and_greeks_scalar(
     spot: float,
     strike: float,
     maturity: float,
     rate: float,
     dividend_yield: float,
     vol: float,
-    option_type: str = "call",
+    option_type: str,
 ) -> Dict[str, float]:
-    d1, d2 = _d1_d2(spot, strike, maturity, rate, dividend_yield, vol)
     df_r = math.exp(-rate * maturity)
     df_q = math.exp(-dividend_yield * maturity)
+    is_call = option_type == "call"
+    if maturity <= 0.0 or vol <= 0.0:
+        forward_value = spot * df_q - strike * df_r
+        intrinsic = max(forward_value, 0.0) if is_call else max(-forward_value, 0.0)
+        delta = (df_q if forward_value > 0.0 else 0.0) if is_call else (-df_q if forward_value < 0.0 else 0.0)
+        return {
+            "price": intrinsic,
+            "delta": delta,
+            "gamma": 0.0,
+            "vega": 0.0,
+            "theta": 0.0,
+            "rho": 0.0,
+            "vanna": 0.0,
+            "volga": 0.0,
+            "charm": 0.0,
+        }
+    sqrt_t = math.sqrt(maturity)
+    vsqrt = vol * sqrt_t
+    d1 = (math.log(spot / strike) + (rate - dividend_yield + 0.5 * vol * vol) * maturity) / vsqrt
+    d2 = d1 - vsqrt
     pdf = _norm_pdf(d1)
-    if option_type == "call":
-        delta = df_q * _norm_cdf(d1)
-        theta = (
-            -(spot * df_q * pdf * vol) / (2.0 * math.sqrt(maturity))
-            - rate * strike * df_r * _norm_cdf(d2)
-            + dividend_yield * spot * df_q * _norm_cdf(d1)
-        )
-        rho = strike * maturity * df_r * _norm_cdf(d2)
+    nd1 = _norm_cdf(d1)
+    nd2 = _norm_cdf(d2)
+    decay = -(spot * df_q * pdf * vol) / (2.0 * sqrt_t)
+    vega = spot * df_q * pdf * sqrt_t
+    charm_common = df_q * pdf * (2.0 * (rate - dividend_yield) * maturity - d2 * vsqrt) / (2.0 * maturity * vsqrt)
+    if is_call:
+        value = spot * df_q * nd1 - strike * df_r * nd2
+        delta = df_q * nd1
+        theta = decay - rate * strike * df_r * nd2 + dividend_yield * spot * df_q * nd1
+        rho = strike * maturity * df_r * nd2
+        charm = dividend_yield * df_q * nd1 - charm_common
     else:
-        delta = df_q * (_norm_cdf(d1) - 1.0)
-        theta = (
-            -(spot * df_q * pdf * vol) / (2.0 * math.sqrt(maturity))
-            + rate * strike * df_r * _norm_cdf(-d2)
-            - dividend_yield * spot * df_q * _norm_cdf(-d1)
-        )
-        rho = -strike * maturity * df_r * _norm_cdf(-d2)
-    gamma = (df_q * pdf) / (spot * vol * math.sqrt(maturity)) if maturity > 0 else 0.0
-    vega = spot * df_q * pdf * math.sqrt(maturity)
+        value = strike * df_r * (1.0 - nd2) - spot * df_q * (1.0 - nd1)
+        delta = df_q * (nd1 - 1.0)
+        theta = decay + rate * strike * df_r * (1.0 - nd2) - dividend_yield * spot * df_q * (1.0 - nd1)
+        rho = -strike * maturity * df_r * (1.0 - nd2)
+        charm = -dividend_yield * df_q * (1.0 - nd1) - charm_common
     return {
+        "price": value,
         "delta": delta,
-        "gamma": gamma,
+        "gamma": df_q * pdf / (spot * vsqrt),
         "vega": vega,
         "theta": theta,
         "rho": rho,
+        "vanna": -df_q * pdf * d2 / vol,
+        "volga": vega * d1 * d2 / vol,
+        "charm": charm,
     }
+
+
+def _price_and_greeks_array(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    maturity: np.ndarray,
+    rate: np.ndarray,
+    dividend_yield: np.ndarray,
+    vol: np.ndarray,
+    option_type,
+) -> Dict[str, np.ndarray]:
+    spot, strike, maturity, rate, dividend_yield, vol, is_call = _broadcast_inputs(
+        spot, strike, maturity, rate, dividend_yield, vol, option_type
+    )
+    live = (maturity > 0.0) & (vol > 0.0)
+    t = np.where(live, maturity, 1.0)
+    sigma = np.where(live, vol, 1.0)
+    sqrt_t = np.sqrt(t)
+    vsqrt = sigma * sqrt_t
+    d1 = (np.log(spot / strike) + (rate - dividend_yield + 0.5 * sigma * sigma) * t) / vsqrt
+    d2 = d1 - vsqrt
+    df_r = np.exp(-rate * maturity)
+    df_q = np.exp(-dividend_yield * maturity)
+    pdf = _norm_pdf_array(d1)
+    nd1 = _norm_cdf_array(d1)
+    nd2 = _norm_cdf_array(d2)
+    fwd_spot = spot * df_q
+    fwd_strike = strike * df_r
+    decay = -(fwd_spot * pdf * sigma) / (2.0 * sqrt_t)
+    vega = fwd_spot * pdf * sqrt_t
+    charm_common = df_q * pdf * (2.0 * (rate - dividend_yield) * t - d2 * vsqrt) / (2.0 * t * vsqrt)
+    value = np.where(is_call, fwd_spot * nd1 - fwd_strike * nd2, fwd_strike * (1.0 - nd2) - fwd_spot * (1.0 - nd1))
+    delta = np.where(is_call, df_q * nd1, df_q * (nd1 - 1.0))
+    theta = np.where(
+        is_call,
+        decay - rate * fwd_strike * nd2 + dividend_yield * fwd_spot * nd1,
+        decay + rate * fwd_strike * (1.0 - nd2) - dividend_yield * fwd_spot * (1.0 - nd1),
+    )
+    rho = np.where(is_call, fwd_strike * t * nd2, -fwd_strike * t * (1.0 - nd2))
+    charm = np.where(is_call, dividend_yield * df_q * nd1, -dividend_yield * df_q * (1.0 - nd1)) - charm_common
+    forward_value = fwd_spot - fwd_strike
+    intrinsic = np.maximum(np.where(is_call, forward_value, -forward_value), 0.0)
+    expired_delta = np.where(
+        is_call,
+        np.where(forward_value > 0.0, df_q, 0.0),
+        np.where(forward_value < 0.0, -df_q, 0.0),
+    )
+    return {
+        "price": np.where(live, value, intrinsic),
+        "delta": np.where(live, delta, expired_delta),
+        "gamma": np.where(live, df_q * pdf / (spot * vsqrt), 0.0),
+        "vega": np.where(live, vega, 0.0),
+        "theta": np.where(live, theta, 0.0),
+        "rho": np.where(live, rho, 0.0),
+        "vanna": np.where(live, -df_q * pdf * d2 / sigma, 0.0),
+        "volga": np.where(live, vega * d1 * d2 / sigma, 0.0),
+        "charm": np.where(live, charm, 0.0),
+    }
+
+
+def price_and_greeks(
+    spot,
+    strike,
+    maturity,
+    rate,
+    dividend_yield,
+    vol,
+    option_type="call",
+) -> Dict:
+    args = (spot, strike, maturity, rate, dividend_yield, vol)
+    if isinstance(option_type, str) and all(np.ndim(arg) == 0 for arg in args):
+        return _price_and_greeks_scalar(*(float(arg) for arg in args), option_type)
+    return _price_and_greeks_array(*args, option_type)
+
+
+def greeks(
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    option_type: str = "call",
+) -> Dict[str, float]:
+    result = _price_and_greeks_scalar(spot, strike, maturity, rate, dividend_yield, vol, option_type)
+    return {name: result[name] for name in _FIRST_ORDER_GREEKS}
+
+
+def price_many(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    maturity: np.ndarray,
+    rate: np.ndarray,
+    dividend_yield: np.ndarray,
+    vol: np.ndarray,
+    option_type="call",
+) -> np.ndarray:
+    spot, strike, maturity, rate, dividend_yield, vol, is_call = _broadcast_inputs(
+        spot, strike, maturity, rate, dividend_yield, vol, option_type
+    )
+    live = (maturity > 0.0) & (vol > 0.0)
+    t = np.where(live, maturity, 1.0)
+    sigma = np.where(live, vol, 1.0)
+    vsqrt = sigma * np.sqrt(t)
+    d1 = (np.log(spot / strike) + (rate - dividend_yield + 0.5 * sigma * sigma) * t) / vsqrt
+    d2 = d1 - vsqrt
+    fwd_spot = spot * np.exp(-dividend_yield * maturity)
+    fwd_strike = strike * np.exp(-rate * maturity)
+    call = fwd_spot * _norm_cdf_array(d1) - fwd_strike * _norm_cdf_array(d2)
+    put = fwd_strike * _norm_cdf_array(-d2) - fwd_spot * _norm_cdf_array(-d1)
+    value = np.where(is_call, call, put)
+    intrinsic = np.maximum(np.where(is_call, fwd_spot - fwd_strike, fwd_strike - fwd_spot), 0.0)
+    return np.where(live, value, intrinsic)
+
+
+def greeks_many(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    maturity: np.ndarray,
+    rate: np.ndarray,
+    dividend_yield: np.ndarray,
+    vol: np.ndarray,
+    option_type="call",
+) -> Dict[str, np.ndarray]:
+    result = _price_and_greeks_array(spot, strike, maturity, rate, dividend_yield, vol, option_type)
+    return {name: result[name] for name in _FIRST_ORDER_GREEKS}
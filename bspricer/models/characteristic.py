@@ -0,0 +1,41 @@
+from typing import Callable
+
+import numpy as np
+
+
+# Characteristic functions of x = log(S_T / S_0) under the risk-neutral measure: phi(u, maturity),
+# vectorized over complex u and broadcasting maturities.
+CharacteristicFunction = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+def black_scholes_cf(rate: float, dividend_yield: float, vol: float) -> CharacteristicFunction:
+    def phi(u: np.ndarray, maturity: np.ndarray) -> np.ndarray:
+        drift = (rate - dividend_yield - 0.5 * vol * vol) * maturity
+        return np.exp(1j * u * drift - 0.5 * vol * vol * u * u * maturity)
+
+    return phi
+
+
+def heston_cf(
+    rate: float,
+    dividend_yield: float,
+    v0: float,
+    kappa: float,
+    theta: float,
+    sigma: float,
+    rho: float,
+) -> CharacteristicFunction:
+    # Albrecher et al. "little Heston trap" form: continuous in u for long maturities.
+    def phi(u: np.ndarray, maturity: np.ndarray) -> np.ndarray:
+        beta = kappa - 1j * rho * sigma * u
+        d = np.sqrt(beta * beta + sigma * sigma * (1j * u + u * u))
+        g = (beta - d) / (beta + d)
+        decay = np.exp(-d * maturity)
+        variance_term = (beta - d) / (sigma * sigma) * (1.0 - decay) / (1.0 - g * decay)
+        mean_term = kappa * theta / (sigma * sigma) * (
+            (beta - d) * maturity - 2.0 * np.log((1.0 - g * decay) / (1.0 - g))
+        )
+        drift = 1j * u * (rate - dividend_yield) * maturity
+        return np.exp(drift + mean_term + variance_term * v0)
+
+    return phi
@@ -0,0 +1,26 @@
+import math
+
+from .black_scholes import _norm_cdf
+
+
+def price(
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    payout: float = 1.0,
+    option_type: str = "call",
+) -> float:
+    # Cash-or-nothing: pays `payout` at expiry if the option finishes in the money.
+    df = math.exp(-rate * maturity)
+    forward = spot * math.exp((rate - dividend_yield) * maturity)
+    if maturity <= 0.0 or vol <= 0.0:
+        in_the_money = forward > strike if option_type == "call" else forward < strike
+        return df * payout if in_the_money else 0.0
+    vsqrt = vol * math.sqrt(maturity)
+    d2 = (math.log(forward / strike) - 0.5 * vol * vol * maturity) / vsqrt
+    if option_type == "call":
+        return df * payout * _norm_cdf(d2)
+    return df * payout * _norm_cdf(-d2)
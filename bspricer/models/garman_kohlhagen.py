@@ -1,4 +1,6 @@
-from .black_scholes import price as bs_price
+import numpy as np
+
+from .black_scholes import price as bs_price, price_many as bs_price_many
 
 
 def price(
@@ -19,3 +21,15 @@ def price(
         vol=vol,
         option_type=option_type,
     )
+
+
+def price_many(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    maturity: np.ndarray,
+    domestic_rate: np.ndarray,
+    foreign_rate: np.ndarray,
+    vol: np.ndarray,
+    option_type="call",
+) -> np.ndarray:
+    return bs_price_many(spot, strike, maturity, domestic_rate, foreign_rate, vol, option_type)
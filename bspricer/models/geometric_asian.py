@@ -0,0 +1,33 @@
+import math
+
+from .black_scholes import _norm_cdf
+
+
+def price(
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    option_type: str = "call",
+    steps: int | None = None,
+) -> float:
+    # Geometric average of S(t_i), t_i = i * T / steps (continuous averaging when steps is None).
+    if steps is None:
+        time_factor, variance_factor = 0.5, 1.0 / 3.0
+    else:
+        time_factor = (steps + 1) / (2.0 * steps)
+        variance_factor = (steps + 1) * (2.0 * steps + 1) / (6.0 * steps * steps)
+    df = math.exp(-rate * maturity)
+    mean = math.log(spot) + (rate - dividend_yield - 0.5 * vol * vol) * maturity * time_factor
+    variance = vol * vol * maturity * variance_factor
+    forward = math.exp(mean + 0.5 * variance)
+    if maturity <= 0.0 or vol <= 0.0:
+        return df * (max(0.0, forward - strike) if option_type == "call" else max(0.0, strike - forward))
+    std = math.sqrt(variance)
+    d1 = (mean - math.log(strike) + variance) / std
+    d2 = d1 - std
+    if option_type == "call":
+        return df * (forward * _norm_cdf(d1) - strike * _norm_cdf(d2))
+    return df * (strike * _norm_cdf(-d2) - forward * _norm_cdf(-d1))
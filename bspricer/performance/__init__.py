@@ -1,5 +1,36 @@
-from .numba_kernels import gbm_paths_numba, numba_available
-from .cpp_wrapper import black_scholes_price_cpp
-from .benchmarks import run_pricing_benchmarks
+from .numba_kernels import (
+    gbm_paths_numba,
+    mc_price_numba,
+    tridiagonal_solve_numba,
+    numba_available,
+    bs_price_numba,
+    bs_greeks_numba,
+    gk_price_numba,
+    black_76_price_numba,
+)
+from .cpp_wrapper import (
+    cpp_available,
+    black_scholes_price_cpp,
+    black_scholes_price_batch_cpp,
+    black_scholes_greeks_batch_cpp,
+    black_76_price_batch_cpp,
+)
+from .benchmarks import run_precision_check, run_pricing_benchmarks
 
-__all__ = ["gbm_paths_numba", "numba_available", "black_scholes_price_cpp", "run_pricing_benchmarks"]
+__all__ = [
+    "gbm_paths_numba",
+    "mc_price_numba",
+    "tridiagonal_solve_numba",
+    "numba_available",
+    "bs_price_numba",
+    "bs_greeks_numba",
+    "gk_price_numba",
+    "black_76_price_numba",
+    "cpp_available",
+    "black_scholes_price_cpp",
+    "black_scholes_price_batch_cpp",
+    "black_scholes_greeks_batch_cpp",
+    "black_76_price_batch_cpp",
+    "run_pricing_benchmarks",
+    "run_precision_check",
+]
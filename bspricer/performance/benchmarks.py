@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import time
 
-from bspricer.models.black_scholes import price as bs_price
-from bspricer.performance.numba_kernels import numba_available
+import numpy as np
+
+from bspricer.config import MonteCarloSettings
+from bspricer.models.black_scholes import price as bs_price, price_many as bs_price_many
+from bspricer.performance.numba_kernels import bs_price_numba, numba_available
 
 
 def _time_it(fn, runs: int) -> dict:
@@ -23,6 +26,7 @@ def run_pricing_benchmarks(
     mc_runs: int = 5,
     mc_paths: int = 20000,
     mc_steps: int = 100,
+    batch_size: int = 100000,
 ) -> dict:
     from bspricer.pricing.monte_carlo import price_asian_option_mc
 
@@ -53,6 +57,16 @@ def run_pricing_benchmarks(
         runs,
     )
 
+    rng = np.random.default_rng(7)
+    strikes = rng.uniform(50.0, 150.0, batch_size)
+    maturities = rng.uniform(0.1, 3.0, batch_size)
+    batch_pricer = bs_price_numba if numba_available() else bs_price_many
+    batch_pricer(100.0, strikes[:10], maturities[:10], 0.03, 0.0, 0.2, "call")
+    batch_stats = _time_it(
+        lambda: batch_pricer(100.0, strikes, maturities, 0.03, 0.0, 0.2, "call"),
+        max(runs // 20, 1),
+    )
+
     mc_stats = _time_it(
         lambda: price_asian_option_mc(
             spot=100.0,
@@ -69,10 +83,87 @@ def run_pricing_benchmarks(
         mc_runs,
     )
 
+    mc_float32_stats = _time_it(
+        lambda: price_asian_option_mc(
+            spot=100.0,
+            strike=100.0,
+            maturity=1.0,
+            rate=0.03,
+            dividend_yield=0.0,
+            vol=0.2,
+            option_type="call",
+            n_paths=mc_paths,
+            steps=mc_steps,
+            seed=42,
+            settings=MonteCarloSettings(dtype="float32"),
+        ),
+        mc_runs,
+    )
+
+    mc_kernel_stats = None
+    if numba_available():
+        kernel_settings = MonteCarloSettings(backend="numba")
+        asian_kernel = lambda n_paths: price_asian_option_mc(  # noqa: E731
+            spot=100.0,
+            strike=100.0,
+            maturity=1.0,
+            rate=0.03,
+            dividend_yield=0.0,
+            vol=0.2,
+            option_type="call",
+            n_paths=n_paths,
+            steps=mc_steps,
+            seed=42,
+            settings=kernel_settings,
+        )
+        asian_kernel(100)
+        mc_kernel_stats = _time_it(lambda: asian_kernel(mc_paths), mc_runs)
+
     return {
         "numba_enabled": numba_available(),
         "black_scholes": bs_stats,
+        "black_scholes_batch": batch_stats,
+        "batch_size": batch_size,
         "asian_mc": mc_stats,
+        "asian_mc_float32": mc_float32_stats,
+        "asian_mc_numba_kernel": mc_kernel_stats,
         "mc_paths": mc_paths,
         "mc_steps": mc_steps,
     }
+
+
+def run_precision_check(n_paths: int = 100000, steps: int = 252, seed: int = 7) -> dict:
+    # Prices the same normal draws with float64 and float32 paths, so the differences are
+    # rounding error only and can be compared with the Monte Carlo standard error.
+    from bspricer.pricing.monte_carlo import (
+        AsianPayoff,
+        BarrierPayoff,
+        DigitalPayoff,
+        _accumulate,
+        _normal_chunks,
+        _payoff_matrix,
+    )
+
+    payoffs = {
+        "asian": AsianPayoff(100.0),
+        "barrier": BarrierPayoff(100.0, 120.0, "up-and-out"),
+        "digital": DigitalPayoff(100.0),
+    }
+    evaluate = _payoff_matrix(list(payoffs.values()))
+    market = (100.0, 0.03, 0.0, 0.2, 1.0)
+    chunks = list(_normal_chunks(n_paths, steps, seed, MonteCarloSettings().chunk_size))
+    double = _accumulate(evaluate, None, iter(chunks), *market, False)
+    single = _accumulate(evaluate, None, (c.astype(np.float32) for c in chunks), *market, False)
+    discount = np.exp(-0.03)
+    price64 = discount * double.mean(None, 0.0)
+    price32 = discount * single.mean(None, 0.0)
+    stderr = discount * np.sqrt(double.unit_variance(None, 0.0) / double.units)
+    return {
+        name: {
+            "float64": float(price64[i]),
+            "float32": float(price32[i]),
+            "abs_diff": float(abs(price32[i] - price64[i])),
+            "stderr": float(stderr[i]),
+        }
+        for i, name in enumerate(payoffs)
+    }
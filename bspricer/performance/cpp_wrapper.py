@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import numpy as np
+
+from bspricer.models.black_76 import price_many as black_76_price_many
+from bspricer.models.black_scholes import _call_mask, price_and_greeks as bs_price_and_greeks, price_many as bs_price_many
+
 
 try:
     import bspricer_cpp  # type: ignore
@@ -7,6 +12,13 @@ except Exception:
     bspricer_cpp = None
 
 
+_GREEK_ROWS = ("price", "delta", "gamma", "vega", "theta", "rho")
+
+
+def cpp_available() -> bool:
+    return bspricer_cpp is not None
+
+
 def black_scholes_price_cpp(
     spot: float,
     strike: float,
@@ -27,3 +39,77 @@ def black_scholes_price_cpp(
         vol,
         option_type,
     )
+
+
+def _batch_buffers(*arrays) -> tuple[tuple, tuple[np.ndarray, ...]]:
+    # Already-contiguous float64 inputs of full length pass through without a copy.
+    *values, is_call = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in arrays[:-1]), arrays[-1])
+    shape = is_call.shape
+    flat = tuple(np.ascontiguousarray(v, dtype=np.float64).reshape(-1) for v in values)
+    return shape, flat + (np.ascontiguousarray(is_call, dtype=np.bool_).reshape(-1),)
+
+
+def _output_buffer(out: np.ndarray | None, shape: tuple) -> np.ndarray:
+    if out is None:
+        return np.empty(shape, dtype=np.float64)
+    if out.dtype != np.float64 or not out.flags.c_contiguous or out.shape != shape:
+        raise ValueError(f"out must be a C-contiguous float64 array of shape {shape}")
+    return out
+
+
+def black_scholes_price_batch_cpp(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    maturity: np.ndarray,
+    rate: np.ndarray,
+    dividend_yield: np.ndarray,
+    vol: np.ndarray,
+    option_type="call",
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    shape, flat = _batch_buffers(spot, strike, maturity, rate, dividend_yield, vol, _call_mask(option_type))
+    out = _output_buffer(out, shape)
+    if bspricer_cpp is None:
+        out[...] = bs_price_many(*flat).reshape(shape)
+        return out
+    bspricer_cpp.black_scholes_price_batch(*flat, out.reshape(-1))
+    return out
+
+
+def black_scholes_greeks_batch_cpp(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    maturity: np.ndarray,
+    rate: np.ndarray,
+    dividend_yield: np.ndarray,
+    vol: np.ndarray,
+    option_type="call",
+    out: np.ndarray | None = None,
+) -> dict[str, np.ndarray]:
+    shape, flat = _batch_buffers(spot, strike, maturity, rate, dividend_yield, vol, _call_mask(option_type))
+    out = _output_buffer(out, (len(_GREEK_ROWS),) + shape)
+    if bspricer_cpp is None:
+        result = bs_price_and_greeks(*flat)
+        for k, name in enumerate(_GREEK_ROWS):
+            out[k] = result[name].reshape(shape)
+    else:
+        bspricer_cpp.black_scholes_greeks_batch(*flat, out.reshape(len(_GREEK_ROWS), -1))
+    return {name: out[k] for k, name in enumerate(_GREEK_ROWS)}
+
+
+def black_76_price_batch_cpp(
+    forward: np.ndarray,
+    strike: np.ndarray,
+    maturity: np.ndarray,
+    discount_rate: np.ndarray,
+    vol: np.ndarray,
+    option_type="call",
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    shape, flat = _batch_buffers(forward, strike, maturity, discount_rate, vol, _call_mask(option_type))
+    out = _output_buffer(out, shape)
+    if bspricer_cpp is None:
+        out[...] = black_76_price_many(*flat).reshape(shape)
+        return out
+    bspricer_cpp.black_76_price_batch(*flat, out.reshape(-1))
+    return out
@@ -3,13 +3,20 @@ from __future__ import annotations
 import math
 import numpy as np
 
+from bspricer.models.black_scholes import _call_mask
+
 
 try:
-    from numba import njit
+    from numba import njit, prange
     _NUMBA = True
 except Exception:
     _NUMBA = False
     njit = None
+    prange = range
+
+
+# Paths per partial sum in the Monte Carlo kernel; a global, so Numba freezes it as a constant.
+_MC_SUM_BLOCK = 4096
 
 
 def numba_available() -> bool:
@@ -20,7 +27,7 @@ if _NUMBA:
     @njit(cache=True)
     def _gbm_paths_numba(spot, rate, dividend_yield, vol, maturity, steps, normals):
         n_paths = normals.shape[0]
-        paths = np.empty((n_paths, steps + 1))
+        paths = np.empty((n_paths, steps + 1), dtype=normals.dtype)
         paths[:, 0] = spot
         dt = maturity / steps
         drift = (rate - dividend_yield - 0.5 * vol * vol) * dt
@@ -29,10 +36,294 @@ if _NUMBA:
             for i in range(n_paths):
                 paths[i, t] = paths[i, t - 1] * math.exp(drift + diffusion * normals[i, t - 1])
         return paths
+
+    @njit(cache=True)
+    def _norm_cdf_nb(x):
+        return 0.5 * math.erfc(-x / math.sqrt(2.0))
+
+    @njit(cache=True)
+    def _norm_pdf_nb(x):
+        return math.exp(-0.5 * x * x) / math.sqrt(2.0 * math.pi)
+
+    @njit(cache=True, parallel=True)
+    def _bs_price_numba(spot, strike, maturity, rate, dividend_yield, vol, is_call, out):
+        for i in prange(spot.shape[0]):
+            df_r = math.exp(-rate[i] * maturity[i])
+            df_q = math.exp(-dividend_yield[i] * maturity[i])
+            fwd_spot = spot[i] * df_q
+            fwd_strike = strike[i] * df_r
+            if maturity[i] <= 0.0 or vol[i] <= 0.0:
+                intrinsic = fwd_spot - fwd_strike if is_call[i] else fwd_strike - fwd_spot
+                out[i] = max(intrinsic, 0.0)
+                continue
+            vsqrt = vol[i] * math.sqrt(maturity[i])
+            d1 = (math.log(spot[i] / strike[i]) + (rate[i] - dividend_yield[i] + 0.5 * vol[i] * vol[i]) * maturity[i]) / vsqrt
+            d2 = d1 - vsqrt
+            if is_call[i]:
+                out[i] = fwd_spot * _norm_cdf_nb(d1) - fwd_strike * _norm_cdf_nb(d2)
+            else:
+                out[i] = fwd_strike * _norm_cdf_nb(-d2) - fwd_spot * _norm_cdf_nb(-d1)
+
+    @njit(cache=True, parallel=True)
+    def _bs_greeks_numba(spot, strike, maturity, rate, dividend_yield, vol, is_call, out):
+        for i in prange(spot.shape[0]):
+            df_r = math.exp(-rate[i] * maturity[i])
+            df_q = math.exp(-dividend_yield[i] * maturity[i])
+            fwd_spot = spot[i] * df_q
+            fwd_strike = strike[i] * df_r
+            if maturity[i] <= 0.0 or vol[i] <= 0.0:
+                forward_value = fwd_spot - fwd_strike
+                out[0, i] = max(forward_value if is_call[i] else -forward_value, 0.0)
+                if is_call[i]:
+                    out[1, i] = df_q if forward_value > 0.0 else 0.0
+                else:
+                    out[1, i] = -df_q if forward_value < 0.0 else 0.0
+                for k in range(2, 6):
+                    out[k, i] = 0.0
+                continue
+            sqrt_t = math.sqrt(maturity[i])
+            vsqrt = vol[i] * sqrt_t
+            d1 = (math.log(spot[i] / strike[i]) + (rate[i] - dividend_yield[i] + 0.5 * vol[i] * vol[i]) * maturity[i]) / vsqrt
+            d2 = d1 - vsqrt
+            pdf = _norm_pdf_nb(d1)
+            nd1 = _norm_cdf_nb(d1)
+            nd2 = _norm_cdf_nb(d2)
+            decay = -(fwd_spot * pdf * vol[i]) / (2.0 * sqrt_t)
+            if is_call[i]:
+                out[0, i] = fwd_spot * nd1 - fwd_strike * nd2
+                out[1, i] = df_q * nd1
+                out[4, i] = decay - rate[i] * fwd_strike * nd2 + dividend_yield[i] * fwd_spot * nd1
+                out[5, i] = fwd_strike * maturity[i] * nd2
+            else:
+                out[0, i] = fwd_strike * (1.0 - nd2) - fwd_spot * (1.0 - nd1)
+                out[1, i] = df_q * (nd1 - 1.0)
+                out[4, i] = decay + rate[i] * fwd_strike * (1.0 - nd2) - dividend_yield[i] * fwd_spot * (1.0 - nd1)
+                out[5, i] = -fwd_strike * maturity[i] * (1.0 - nd2)
+            out[2, i] = df_q * pdf / (spot[i] * vsqrt)
+            out[3, i] = fwd_spot * pdf * sqrt_t
+
+    @njit(cache=True, parallel=True)
+    def _black_76_price_numba(forward, strike, maturity, discount_rate, vol, is_call, out):
+        for i in prange(forward.shape[0]):
+            df = math.exp(-discount_rate[i] * maturity[i])
+            if maturity[i] <= 0.0 or vol[i] <= 0.0:
+                intrinsic = forward[i] - strike[i] if is_call[i] else strike[i] - forward[i]
+                out[i] = max(intrinsic, 0.0)
+                continue
+            vsqrt = vol[i] * math.sqrt(maturity[i])
+            d1 = (math.log(forward[i] / strike[i]) + 0.5 * vol[i] * vol[i] * maturity[i]) / vsqrt
+            d2 = d1 - vsqrt
+            if is_call[i]:
+                out[i] = df * (forward[i] * _norm_cdf_nb(d1) - strike[i] * _norm_cdf_nb(d2))
+            else:
+                out[i] = df * (strike[i] * _norm_cdf_nb(-d2) - forward[i] * _norm_cdf_nb(-d1))
+
+    @njit(cache=True)
+    def _splitmix64(state):
+        state = state + np.uint64(0x9E3779B97F4A7C15)
+        z = state
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return state, z ^ (z >> np.uint64(31))
+
+    @njit(cache=True)
+    def _mc_path_payoff_numba(
+        state, log_spot, drift, diffusion, steps,
+        kind, strike, log_strike, is_call, log_barrier, is_up, is_out, payout,
+    ):
+        # Walk in log space; only the arithmetic average needs the level at every step.
+        log_level = log_spot
+        log_max = log_spot
+        log_min = log_spot
+        running_sum = 0.0
+        spare = 0.0
+        has_spare = False
+        for _ in range(steps):
+            if has_spare:
+                z = spare
+                has_spare = False
+            else:
+                # Marsaglia polar method on 53-bit uniforms; both normals are used.
+                radius_sq = 0.0
+                v1 = 0.0
+                v2 = 0.0
+                while radius_sq >= 1.0 or radius_sq == 0.0:
+                    state, a = _splitmix64(state)
+                    state, b = _splitmix64(state)
+                    v1 = float(a >> np.uint64(11)) * 2.220446049250313e-16 - 1.0
+                    v2 = float(b >> np.uint64(11)) * 2.220446049250313e-16 - 1.0
+                    radius_sq = v1 * v1 + v2 * v2
+                scale = math.sqrt(-2.0 * math.log(radius_sq) / radius_sq)
+                z = v1 * scale
+                spare = v2 * scale
+                has_spare = True
+            log_level += drift + diffusion * z
+            if kind == 0:
+                running_sum += math.exp(log_level)
+            elif kind == 1:
+                log_max = max(log_max, log_level)
+                log_min = min(log_min, log_level)
+        if kind == 0:
+            average = running_sum / steps
+            return max(average - strike if is_call else strike - average, 0.0)
+        if kind == 2:
+            in_the_money = log_level > log_strike if is_call else log_level < log_strike
+            return payout if in_the_money else 0.0
+        touched = log_max >= log_barrier if is_up else log_min <= log_barrier
+        if touched == is_out:
+            return 0.0
+        terminal = math.exp(log_level)
+        return max(terminal - strike if is_call else strike - terminal, 0.0)
+
+    @njit(cache=True, parallel=True)
+    def _mc_payoff_sums_numba(
+        spot, rate, dividend_yield, vol, maturity, steps, n_paths, seed,
+        kind, strike, is_call, barrier, is_up, is_out, payout,
+    ):
+        dt = maturity / steps
+        drift = (rate - dividend_yield - 0.5 * vol * vol) * dt
+        diffusion = vol * math.sqrt(dt)
+        log_spot = math.log(spot)
+        log_strike = math.log(strike) if strike > 0.0 else -np.inf
+        log_barrier = math.log(barrier) if barrier > 0.0 else np.nan
+        # Fixed path blocks summed in path order, then partials summed in block order: the
+        # floating-point reduction is the same for any thread count or scheduling.
+        n_blocks = (n_paths + _MC_SUM_BLOCK - 1) // _MC_SUM_BLOCK
+        partial = np.zeros(n_blocks)
+        partial_sq = np.zeros(n_blocks)
+        for b in prange(n_blocks):
+            block_total = 0.0
+            block_sq = 0.0
+            for i in range(b * _MC_SUM_BLOCK, min((b + 1) * _MC_SUM_BLOCK, n_paths)):
+                # Counter-based streams: path i draws from a state hashed from (seed, i) only.
+                state, _ = _splitmix64(seed ^ (np.uint64(i) * np.uint64(0xD1B54A32D192ED03)))
+                value = _mc_path_payoff_numba(
+                    state, log_spot, drift, diffusion, steps,
+                    kind, strike, log_strike, is_call, log_barrier, is_up, is_out, payout,
+                )
+                block_total += value
+                block_sq += value * value
+            partial[b] = block_total
+            partial_sq[b] = block_sq
+        total = 0.0
+        total_sq = 0.0
+        for b in range(n_blocks):
+            total += partial[b]
+            total_sq += partial_sq[b]
+        return total, total_sq
+
+    @njit(cache=True, parallel=True)
+    def _thomas_numba(lower, diag, upper, rhs, obstacle, out):
+        # One LU factorization shared by every right-hand-side column; the obstacle is applied
+        # during back substitution (Brennan-Schwartz), exact when exercise sits at the high end.
+        n, m = rhs.shape
+        upper_factor = np.empty(n)
+        pivot = np.empty(n)
+        pivot[0] = diag[0]
+        upper_factor[0] = upper[0] / pivot[0]
+        for i in range(1, n):
+            pivot[i] = diag[i] - lower[i] * upper_factor[i - 1]
+            upper_factor[i] = upper[i] / pivot[i]
+        for j in prange(m):
+            forward = np.empty(n)
+            forward[0] = rhs[0, j] / pivot[0]
+            for i in range(1, n):
+                forward[i] = (rhs[i, j] - lower[i] * forward[i - 1]) / pivot[i]
+            out[n - 1, j] = max(forward[n - 1], obstacle[n - 1, j])
+            for i in range(n - 2, -1, -1):
+                out[i, j] = max(forward[i] - upper_factor[i] * out[i + 1, j], obstacle[i, j])
+
+    @njit(cache=True)
+    def _bs_scalar_nb(spot, strike, maturity, rate, dividend_yield, vol, is_call):
+        vsqrt = vol * math.sqrt(maturity)
+        d1 = (math.log(spot / strike) + (rate - dividend_yield + 0.5 * vol * vol) * maturity) / vsqrt
+        d2 = d1 - vsqrt
+        fwd_spot = spot * math.exp(-dividend_yield * maturity)
+        fwd_strike = strike * math.exp(-rate * maturity)
+        if is_call:
+            return fwd_spot * _norm_cdf_nb(d1) - fwd_strike * _norm_cdf_nb(d2)
+        return fwd_strike * _norm_cdf_nb(-d2) - fwd_spot * _norm_cdf_nb(-d1)
+
+    @njit(cache=True, parallel=True)
+    def _binomial_numba(spot, maturity, rate, dividend_yield, vol, group, strike, is_call, american, steps, smooth, out):
+        # CRR trees: node spots S u^j (j = -steps..steps) are built once per market group and shared
+        # by every option on it. Level i, node k (k up-moves) sits at index steps + 2k - i.
+        n_groups = spot.shape[0]
+        levels = np.empty((n_groups, 2 * steps + 1))
+        for g in prange(n_groups):
+            up = math.exp(vol[g] * math.sqrt(maturity[g] / steps))
+            for j in range(2 * steps + 1):
+                levels[g, j] = spot[g] * up ** (j - steps)
+        for o in prange(strike.shape[0]):
+            g = group[o]
+            dt = maturity[g] / steps
+            up = math.exp(vol[g] * math.sqrt(dt))
+            down = 1.0 / up
+            p = (math.exp((rate[g] - dividend_yield[g]) * dt) - down) / (up - down)
+            disc = math.exp(-rate[g] * dt)
+            sign = 1.0 if is_call[o] else -1.0
+            k_o = strike[o]
+            values = np.empty(steps + 1)
+            # BBS: the last step is replaced by the Black-Scholes price over one interval.
+            last = steps - 1 if smooth else steps
+            for k in range(last + 1):
+                s = levels[g, steps + 2 * k - last]
+                if smooth:
+                    v = _bs_scalar_nb(s, k_o, dt, rate[g], dividend_yield[g], vol[g], is_call[o])
+                else:
+                    v = 0.0
+                if american[o] or not smooth:
+                    v = max(v, sign * (s - k_o))
+                values[k] = v
+            v2 = np.empty(3)
+            v1 = np.empty(2)
+            for i in range(last - 1, -1, -1):
+                for k in range(i + 1):
+                    v = disc * (p * values[k + 1] + (1.0 - p) * values[k])
+                    if american[o]:
+                        v = max(v, sign * (levels[g, steps + 2 * k - i] - k_o))
+                    values[k] = v
+                if i == 2:
+                    v2[:] = values[:3]
+                elif i == 1:
+                    v1[:] = values[:2]
+            s_up = levels[g, steps + 1]
+            s_down = levels[g, steps - 1]
+            s_uu = levels[g, steps + 2]
+            s_dd = levels[g, steps - 2]
+            s0 = spot[g]
+            out[o, 0] = values[0]
+            out[o, 1] = (v1[1] - v1[0]) / (s_up - s_down)
+            out[o, 2] = ((v2[2] - v2[1]) / (s_uu - s0) - (v2[1] - v2[0]) / (s0 - s_dd)) / (0.5 * (s_uu - s_dd))
 else:
     def _gbm_paths_numba(*args, **kwargs):
         raise RuntimeError("Numba is not available")
 
+    def _thomas_numba(*args, **kwargs):
+        raise RuntimeError("Numba is not available")
+
+    def _binomial_numba(*args, **kwargs):
+        raise RuntimeError("Numba is not available")
+
+    def _mc_payoff_sums_numba(*args, **kwargs):
+        raise RuntimeError("Numba is not available")
+
+    def _bs_price_numba(*args, **kwargs):
+        raise RuntimeError("Numba is not available")
+
+    def _bs_greeks_numba(*args, **kwargs):
+        raise RuntimeError("Numba is not available")
+
+    def _black_76_price_numba(*args, **kwargs):
+        raise RuntimeError("Numba is not available")
+
+
+def _flat_inputs(*arrays) -> tuple[tuple, tuple[np.ndarray, ...]]:
+    *values, is_call = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in arrays[:-1]), arrays[-1])
+    shape = is_call.shape
+    flat = tuple(np.ascontiguousarray(v).ravel() for v in values)
+    return shape, flat + (np.ascontiguousarray(is_call, dtype=np.bool_).ravel(),)
+
 
 def gbm_paths_numba(
     spot: float,
@@ -43,9 +334,185 @@ def gbm_paths_numba(
     steps: int,
     n_paths: int,
     seed: int | None = None,
+    normals: np.ndarray | None = None,
+    dtype: str = "float64",
 ) -> np.ndarray:
     if not _NUMBA:
         raise RuntimeError("Numba is not available")
-    rng = np.random.default_rng(seed)
-    normals = rng.standard_normal((n_paths, steps))
+    if normals is None:
+        normals = np.random.default_rng(seed).standard_normal((n_paths, steps), dtype=dtype)
     return _gbm_paths_numba(spot, rate, dividend_yield, vol, maturity, steps, normals)
+
+
+_MC_PAYOFF_KINDS = {"asian": 0, "barrier": 1, "digital": 2}
+
+
+def mc_price_numba(
+    payoff: str,
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    option_type: str = "call",
+    n_paths: int = 50000,
+    steps: int = 252,
+    seed: int | None = None,
+    barrier: float = math.nan,
+    barrier_type: str = "up-and-out",
+    payout: float = 1.0,
+) -> tuple[float, float]:
+    if not _NUMBA:
+        raise RuntimeError("Numba is not available")
+    if payoff not in _MC_PAYOFF_KINDS:
+        raise ValueError(f"Unknown payoff for the Numba Monte Carlo kernel: {payoff}")
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+    total, total_sq = _mc_payoff_sums_numba(
+        float(spot), float(rate), float(dividend_yield), float(vol), float(maturity), int(steps), int(n_paths),
+        np.uint64(int(seed) & 0xFFFFFFFFFFFFFFFF),
+        _MC_PAYOFF_KINDS[payoff], float(strike), option_type == "call",
+        float(barrier), "up" in barrier_type, "out" in barrier_type, float(payout),
+    )
+    mean = total / n_paths
+    variance = max(total_sq / n_paths - mean * mean, 0.0) * n_paths / max(n_paths - 1, 1)
+    discount = math.exp(-rate * maturity)
+    return discount * mean, discount * math.sqrt(variance / n_paths)
+
+
+def tridiagonal_solve_numba(
+    lower: np.ndarray,
+    diag: np.ndarray,
+    upper: np.ndarray,
+    rhs: np.ndarray,
+    obstacle: np.ndarray | None = None,
+) -> np.ndarray:
+    # Solves one tridiagonal system for every column of rhs (n, m); out = max(solution, obstacle).
+    if not _NUMBA:
+        raise RuntimeError("Numba is not available")
+    rhs = np.ascontiguousarray(rhs, dtype=np.float64)
+    if obstacle is None:
+        obstacle = np.full_like(rhs, -np.inf)
+    out = np.empty_like(rhs)
+    _thomas_numba(
+        np.ascontiguousarray(lower, dtype=np.float64),
+        np.ascontiguousarray(diag, dtype=np.float64),
+        np.ascontiguousarray(upper, dtype=np.float64),
+        rhs,
+        np.ascontiguousarray(obstacle, dtype=np.float64),
+        out,
+    )
+    return out
+
+
+def binomial_numba(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    maturity: np.ndarray,
+    rate: np.ndarray,
+    dividend_yield: np.ndarray,
+    vol: np.ndarray,
+    option_type="call",
+    american=True,
+    steps: int = 128,
+    smooth: bool = True,
+) -> np.ndarray:
+    # Returns (..., 3): price, delta, gamma. Options with identical market inputs share one tree.
+    if not _NUMBA:
+        raise RuntimeError("Numba is not available")
+    if steps < 4:
+        raise ValueError("steps must be at least 4")
+    shape, flat = _flat_inputs(spot, strike, maturity, rate, dividend_yield, vol, _call_mask(option_type))
+    spot, strike, maturity, rate, dividend_yield, vol, is_call = flat
+    american = np.broadcast_to(np.asarray(american, dtype=np.bool_), shape).ravel()
+    live = maturity > 0.0
+    if np.any(live & (vol <= 0.0)):
+        raise ValueError("Lattice pricing needs a positive vol")
+    # Expired options are worth their intrinsic value.
+    sign = np.where(is_call, 1.0, -1.0)
+    in_the_money = sign * (spot - strike) > 0.0
+    out = np.stack([np.where(in_the_money, sign * (spot - strike), 0.0), np.where(in_the_money, sign, 0.0), np.zeros_like(spot)], axis=1)
+    if np.any(live):
+        market = np.stack([spot[live], maturity[live], rate[live], dividend_yield[live], vol[live]], axis=1)
+        if market.shape[0] == 1:
+            # Single trades skip the row-wise unique, which dominates their call overhead.
+            trees, group = market, np.zeros(1, dtype=np.int64)
+        else:
+            trees, group = np.unique(market, axis=0, return_inverse=True)
+        tree_out = np.empty((market.shape[0], 3))
+        _binomial_numba(
+            *(np.ascontiguousarray(column) for column in trees.T),
+            group.reshape(-1).astype(np.int64),
+            np.ascontiguousarray(strike[live]),
+            np.ascontiguousarray(is_call[live]),
+            np.ascontiguousarray(american[live]),
+            steps,
+            smooth,
+            tree_out,
+        )
+        out[live] = tree_out
+    return out.reshape(shape + (3,))
+
+
+def bs_price_numba(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    maturity: np.ndarray,
+    rate: np.ndarray,
+    dividend_yield: np.ndarray,
+    vol: np.ndarray,
+    option_type="call",
+) -> np.ndarray:
+    if not _NUMBA:
+        raise RuntimeError("Numba is not available")
+    shape, flat = _flat_inputs(spot, strike, maturity, rate, dividend_yield, vol, _call_mask(option_type))
+    out = np.empty(flat[0].shape[0])
+    _bs_price_numba(*flat, out)
+    return out.reshape(shape)
+
+
+def bs_greeks_numba(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    maturity: np.ndarray,
+    rate: np.ndarray,
+    dividend_yield: np.ndarray,
+    vol: np.ndarray,
+    option_type="call",
+) -> dict[str, np.ndarray]:
+    if not _NUMBA:
+        raise RuntimeError("Numba is not available")
+    shape, flat = _flat_inputs(spot, strike, maturity, rate, dividend_yield, vol, _call_mask(option_type))
+    out = np.empty((6, flat[0].shape[0]))
+    _bs_greeks_numba(*flat, out)
+    names = ("price", "delta", "gamma", "vega", "theta", "rho")
+    return {name: out[k].reshape(shape) for k, name in enumerate(names)}
+
+
+def gk_price_numba(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    maturity: np.ndarray,
+    domestic_rate: np.ndarray,
+    foreign_rate: np.ndarray,
+    vol: np.ndarray,
+    option_type="call",
+) -> np.ndarray:
+    return bs_price_numba(spot, strike, maturity, domestic_rate, foreign_rate, vol, option_type)
+
+
+def black_76_price_numba(
+    forward: np.ndarray,
+    strike: np.ndarray,
+    maturity: np.ndarray,
+    discount_rate: np.ndarray,
+    vol: np.ndarray,
+    option_type="call",
+) -> np.ndarray:
+    if not _NUMBA:
+        raise RuntimeError("Numba is not available")
+    shape, flat = _flat_inputs(forward, strike, maturity, discount_rate, vol, _call_mask(option_type))
+    out = np.empty(flat[0].shape[0])
+    _black_76_price_numba(*flat, out)
+    return out.reshape(shape)
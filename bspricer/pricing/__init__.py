@@ -1,5 +1,37 @@
-from .analytics import price_equity_option, price_fx_option, greeks_equity_option, greeks_fx_option
-from .monte_carlo import price_asian_option_mc, price_barrier_option_mc, price_digital_option_mc
+from .analytics import (
+    price_equity_option,
+    price_fx_option,
+    greeks_equity_option,
+    greeks_fx_option,
+    price_barrier_option,
+    price_digital_option,
+    price_asian_option,
+)
+from .monte_carlo import (
+    AsianPayoff,
+    BarrierPayoff,
+    DigitalPayoff,
+    bump_greeks_mc,
+    greeks_asian_option_mc,
+    greeks_barrier_option_mc,
+    greeks_digital_option_mc,
+    price_asian_option_mc,
+    price_barrier_option_mc,
+    price_digital_option_mc,
+    price_mlmc,
+    price_payoffs_mc,
+)
+from .fourier import price_fft
+from .lattice import price_lattice, price_equity_option_lattice, price_fx_option_lattice
+from .multi_asset import (
+    BasketPayoff,
+    BestOfPayoff,
+    WorstOfPayoff,
+    correlation_factor,
+    price_multi_asset_mc,
+    simulate_correlated_gbm,
+)
+from .pde import price_pde, price_barrier_option_pde, price_equity_option_pde
 from .rates import price_rate_option, price_zero_coupon, par_swap_rate, price_fixed_floating_swap
 from .credit import price_cds, fair_cds_spread
 
@@ -8,9 +40,34 @@ __all__ = [
     "price_fx_option",
     "greeks_equity_option",
     "greeks_fx_option",
+    "price_barrier_option",
+    "price_digital_option",
+    "price_asian_option",
     "price_asian_option_mc",
     "price_barrier_option_mc",
     "price_digital_option_mc",
+    "price_payoffs_mc",
+    "price_mlmc",
+    "greeks_asian_option_mc",
+    "greeks_barrier_option_mc",
+    "greeks_digital_option_mc",
+    "bump_greeks_mc",
+    "price_fft",
+    "price_lattice",
+    "price_equity_option_lattice",
+    "price_fx_option_lattice",
+    "price_pde",
+    "price_multi_asset_mc",
+    "simulate_correlated_gbm",
+    "correlation_factor",
+    "BasketPayoff",
+    "BestOfPayoff",
+    "WorstOfPayoff",
+    "price_barrier_option_pde",
+    "price_equity_option_pde",
+    "AsianPayoff",
+    "BarrierPayoff",
+    "DigitalPayoff",
     "price_rate_option",
     "price_zero_coupon",
     "par_swap_rate",
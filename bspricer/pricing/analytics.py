@@ -1,11 +1,125 @@
 from __future__ import annotations
 
-from bspricer.instruments.vanilla import EquityOption, FXOption
-from bspricer.models.black_scholes import price as bs_price, greeks as bs_greeks
+from dataclasses import replace
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
+
+from bspricer.instruments.exotics import AsianOption, AverageType, BarrierOption, DigitalOption
+from bspricer.instruments.vanilla import EquityOption, ExerciseStyle, FXOption, OptionType
+from bspricer.models.barrier import price as barrier_price
+from bspricer.models.black_scholes import (
+    price as bs_price,
+    greeks as bs_greeks,
+    price_many as bs_price_many,
+    greeks_many as bs_greeks_many,
+)
+from bspricer.models.digital import price as digital_price
 from bspricer.models.garman_kohlhagen import price as gk_price
+from bspricer.models.geometric_asian import price as geometric_asian_price
+from bspricer.performance.numba_kernels import bs_greeks_numba, bs_price_numba, numba_available
+from bspricer.pricing.lattice import price_lattice
+from bspricer.pricing.pde import price_pde
+
+if TYPE_CHECKING:
+    from bspricer.calibration.surface import VolSurface
+
+
+def _bs_price_batch(**inputs) -> np.ndarray:
+    if numba_available():
+        return bs_price_numba(**inputs)
+    return bs_price_many(**inputs)
+
+
+def _bs_greeks_batch(**inputs) -> dict:
+    if numba_available():
+        result = bs_greeks_numba(**inputs)
+        result.pop("price")
+        return result
+    return bs_greeks_many(**inputs)
+
+
+# Greeks read off the early-exercise tree (or PDE grid); the European vega, theta and rho would be
+# wrong for American trades, so their greeks carry only these.
+_TREE_GREEKS = ("delta", "gamma")
+
+
+def _american_batch(**inputs) -> dict:
+    # Early exercise has no closed form: BBS-Richardson lattice, or the NumPy PDE grid without Numba.
+    if numba_available():
+        return price_lattice(**inputs, american=True)
+    is_call = inputs.pop("option_type")
+    result = {name: np.empty(is_call.shape[0]) for name in ("price",) + _TREE_GREEKS}
+    for i in range(is_call.shape[0]):
+        values = {name: float(value[i]) for name, value in inputs.items()}
+        if values["maturity"] <= 0.0:
+            # Expired trades are worth intrinsic value, as on the lattice.
+            moneyness = (1.0 if is_call[i] else -1.0) * (values["spot"] - values["strike"])
+            solved = {
+                "price": max(moneyness, 0.0),
+                "delta": (1.0 if is_call[i] else -1.0) * float(moneyness > 0.0),
+                "gamma": 0.0,
+            }
+        else:
+            solved = price_pde(**values, option_type="call" if is_call[i] else "put", exercise="american")
+        for name in result:
+            result[name][i] = solved[name]
+    return result
+
+
+def _american_mask(options: Sequence) -> np.ndarray:
+    return np.array([o.exercise == ExerciseStyle.AMERICAN for o in options], dtype=bool)
+
 
+def _with_early_exercise(prices: np.ndarray, options: Sequence, inputs: dict) -> np.ndarray:
+    american = _american_mask(options)
+    if american.any():
+        prices[american] = _american_batch(**{name: value[american] for name, value in inputs.items()})["price"]
+    return prices
 
-def price_equity_option(option: EquityOption) -> float:
+
+def _greeks_with_early_exercise(greeks: dict, options: Sequence, inputs: dict) -> dict:
+    american = _american_mask(options)
+    if not american.any():
+        return greeks
+    tree = _american_batch(**{name: value[american] for name, value in inputs.items()})
+    result = {name: np.array(greeks[name], dtype=float) for name in _TREE_GREEKS}
+    for name in _TREE_GREEKS:
+        result[name][american] = tree[name]
+    return result
+
+
+def _equity_option_arrays(options: Sequence[EquityOption], surface: VolSurface | None = None) -> dict:
+    inputs = {
+        "spot": np.array([o.spot for o in options], dtype=float),
+        "strike": np.array([o.strike for o in options], dtype=float),
+        "maturity": np.array([o.maturity for o in options], dtype=float),
+        "rate": np.array([o.rate for o in options], dtype=float),
+        "dividend_yield": np.array([o.dividend_yield for o in options], dtype=float),
+        "vol": np.array([o.vol for o in options], dtype=float),
+        "option_type": np.array([o.option_type == OptionType.CALL for o in options], dtype=bool),
+    }
+    if surface is not None:
+        inputs["vol"] = surface.vol(inputs["strike"], inputs["maturity"])
+    return inputs
+
+
+def _surface_option(option: EquityOption, surface: VolSurface | None) -> EquityOption:
+    if surface is None:
+        return option
+    return replace(option, vol=float(surface.vol(option.strike, option.maturity)))
+
+
+def price_equity_option(
+    option: EquityOption | Sequence[EquityOption],
+    surface: VolSurface | None = None,
+) -> float | np.ndarray:
+    if not isinstance(option, EquityOption):
+        inputs = _equity_option_arrays(option, surface)
+        return _with_early_exercise(_bs_price_batch(**inputs), option, inputs)
+    if option.exercise == ExerciseStyle.AMERICAN:
+        return float(_american_batch(**_equity_option_arrays([option], surface))["price"][0])
+    option = _surface_option(option, surface)
     return bs_price(
         spot=option.spot,
         strike=option.strike,
@@ -17,7 +131,17 @@ def price_equity_option(option: EquityOption) -> float:
     )
 
 
-def greeks_equity_option(option: EquityOption) -> dict:
+def greeks_equity_option(
+    option: EquityOption | Sequence[EquityOption],
+    surface: VolSurface | None = None,
+) -> dict:
+    if not isinstance(option, EquityOption):
+        inputs = _equity_option_arrays(option, surface)
+        return _greeks_with_early_exercise(_bs_greeks_batch(**inputs), option, inputs)
+    if option.exercise == ExerciseStyle.AMERICAN:
+        tree = _american_batch(**_equity_option_arrays([option], surface))
+        return {name: float(tree[name][0]) for name in _TREE_GREEKS}
+    option = _surface_option(option, surface)
     return bs_greeks(
         spot=option.spot,
         strike=option.strike,
@@ -29,7 +153,24 @@ def greeks_equity_option(option: EquityOption) -> dict:
     )
 
 
-def price_fx_option(option: FXOption) -> float:
+def _fx_option_arrays(options: Sequence[FXOption]) -> dict:
+    return {
+        "spot": np.array([o.spot for o in options], dtype=float),
+        "strike": np.array([o.strike for o in options], dtype=float),
+        "maturity": np.array([o.maturity for o in options], dtype=float),
+        "rate": np.array([o.domestic_rate for o in options], dtype=float),
+        "dividend_yield": np.array([o.foreign_rate for o in options], dtype=float),
+        "vol": np.array([o.vol for o in options], dtype=float),
+        "option_type": np.array([o.option_type == OptionType.CALL for o in options], dtype=bool),
+    }
+
+
+def price_fx_option(option: FXOption | Sequence[FXOption]) -> float | np.ndarray:
+    if not isinstance(option, FXOption):
+        inputs = _fx_option_arrays(option)
+        return _with_early_exercise(_bs_price_batch(**inputs), option, inputs)
+    if option.exercise == ExerciseStyle.AMERICAN:
+        return float(_american_batch(**_fx_option_arrays([option]))["price"][0])
     return gk_price(
         spot=option.spot,
         strike=option.strike,
@@ -41,7 +182,13 @@ def price_fx_option(option: FXOption) -> float:
     )
 
 
-def greeks_fx_option(option: FXOption) -> dict:
+def greeks_fx_option(option: FXOption | Sequence[FXOption]) -> dict:
+    if not isinstance(option, FXOption):
+        inputs = _fx_option_arrays(option)
+        return _greeks_with_early_exercise(_bs_greeks_batch(**inputs), option, inputs)
+    if option.exercise == ExerciseStyle.AMERICAN:
+        tree = _american_batch(**_fx_option_arrays([option]))
+        return {name: float(tree[name][0]) for name in _TREE_GREEKS}
     return bs_greeks(
         spot=option.spot,
         strike=option.strike,
@@ -51,3 +198,45 @@ def greeks_fx_option(option: FXOption) -> dict:
         vol=option.vol,
         option_type=option.option_type.value,
     )
+
+
+def price_barrier_option(option: BarrierOption) -> float:
+    return barrier_price(
+        spot=option.spot,
+        strike=option.strike,
+        maturity=option.maturity,
+        rate=option.rate,
+        dividend_yield=option.dividend_yield,
+        vol=option.vol,
+        barrier=option.barrier,
+        barrier_type=option.barrier_type.value,
+        option_type=option.option_type.value,
+    )
+
+
+def price_digital_option(option: DigitalOption) -> float:
+    return digital_price(
+        spot=option.spot,
+        strike=option.strike,
+        maturity=option.maturity,
+        rate=option.rate,
+        dividend_yield=option.dividend_yield,
+        vol=option.vol,
+        payout=option.payout,
+        option_type=option.option_type.value,
+    )
+
+
+def price_asian_option(option: AsianOption, steps: int | None = None) -> float:
+    if option.average != AverageType.GEOMETRIC:
+        raise ValueError("No closed form for arithmetic-average Asian options")
+    return geometric_asian_price(
+        spot=option.spot,
+        strike=option.strike,
+        maturity=option.maturity,
+        rate=option.rate,
+        dividend_yield=option.dividend_yield,
+        vol=option.vol,
+        option_type=option.option_type.value,
+        steps=steps,
+    )
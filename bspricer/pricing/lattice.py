@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from bspricer.instruments.vanilla import EquityOption, ExerciseStyle, FXOption
+from bspricer.performance.numba_kernels import binomial_numba
+
+
+def price_lattice(
+    spot,
+    strike,
+    maturity,
+    rate,
+    dividend_yield,
+    vol,
+    option_type="call",
+    american=True,
+    steps: int = 128,
+    smoothing: bool = True,
+    richardson: bool = True,
+) -> dict:
+    # Binomial Black-Scholes with Richardson extrapolation (BBSR): 2 V(n) - V(n/2) on smoothed trees.
+    if steps < (8 if richardson else 4):
+        raise ValueError(
+            "steps must be at least 8 with Richardson extrapolation (the half-step tree needs 4)"
+            if richardson
+            else "steps must be at least 4"
+        )
+    inputs = (spot, strike, maturity, rate, dividend_yield, vol, option_type, american)
+    tree = binomial_numba(*inputs, steps=steps, smooth=smoothing)
+    if richardson:
+        tree = 2.0 * tree - binomial_numba(*inputs, steps=steps // 2, smooth=smoothing)
+    if tree.ndim == 1:
+        return {"price": float(tree[0]), "delta": float(tree[1]), "gamma": float(tree[2])}
+    return {"price": tree[..., 0], "delta": tree[..., 1], "gamma": tree[..., 2]}
+
+
+def _lattice_options(options: Sequence[EquityOption | FXOption], steps: int, greeks: bool) -> np.ndarray | dict:
+    fx = [isinstance(o, FXOption) for o in options]
+    result = price_lattice(
+        spot=np.array([o.spot for o in options], dtype=float),
+        strike=np.array([o.strike for o in options], dtype=float),
+        maturity=np.array([o.maturity for o in options], dtype=float),
+        rate=np.array([o.domestic_rate if f else o.rate for o, f in zip(options, fx)], dtype=float),
+        dividend_yield=np.array([o.foreign_rate if f else o.dividend_yield for o, f in zip(options, fx)], dtype=float),
+        vol=np.array([o.vol for o in options], dtype=float),
+        option_type=np.array([o.option_type.value for o in options]),
+        american=np.array([o.exercise == ExerciseStyle.AMERICAN for o in options], dtype=bool),
+        steps=steps,
+    )
+    return result if greeks else result["price"]
+
+
+def price_equity_option_lattice(
+    option: EquityOption | Sequence[EquityOption],
+    steps: int = 128,
+    greeks: bool = False,
+) -> float | np.ndarray | dict:
+    if isinstance(option, EquityOption):
+        result = _lattice_options([option], steps, greeks=True)
+        result = {name: float(value[0]) for name, value in result.items()}
+        return result if greeks else result["price"]
+    return _lattice_options(option, steps, greeks)
+
+
+def price_fx_option_lattice(
+    option: FXOption | Sequence[FXOption],
+    steps: int = 128,
+    greeks: bool = False,
+) -> float | np.ndarray | dict:
+    if isinstance(option, FXOption):
+        result = _lattice_options([option], steps, greeks=True)
+        result = {name: float(value[0]) for name, value in result.items()}
+        return result if greeks else result["price"]
+    return _lattice_options(option, steps, greeks)
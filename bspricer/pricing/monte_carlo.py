@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+import itertools
 import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Callable, Iterator, Sequence
+
 import numpy as np
-from bspricer.performance.numba_kernels import gbm_paths_numba, numba_available
+from bspricer.config import MonteCarloSettings
+from bspricer.models.geometric_asian import price as geometric_asian_price
+from bspricer.performance.numba_kernels import gbm_paths_numba, mc_price_numba, numba_available
+from bspricer.pricing.qmc import sobol_normal_chunks
+
+if TYPE_CHECKING:
+    from bspricer.calibration.surface import VolSurface
 
 
 def _gbm_paths_numpy(
@@ -14,16 +26,19 @@ def _gbm_paths_numpy(
     steps: int,
     n_paths: int,
     seed: int | None = None,
+    normals: np.ndarray | None = None,
+    dtype: str = "float64",
 ) -> np.ndarray:
-    rng = np.random.default_rng(seed)
+    if normals is None:
+        # Same path-major draw order as the Numba kernel, so a seed gives the same paths on both backends.
+        normals = np.random.default_rng(seed).standard_normal((n_paths, steps), dtype=dtype)
     dt = maturity / steps
-    drift = (rate - dividend_yield - 0.5 * vol * vol) * dt
-    diffusion = vol * math.sqrt(dt)
-    paths = np.empty((n_paths, steps + 1))
+    drift = normals.dtype.type((rate - dividend_yield - 0.5 * vol * vol) * dt)
+    diffusion = normals.dtype.type(vol * math.sqrt(dt))
+    paths = np.empty((n_paths, steps + 1), dtype=normals.dtype)
     paths[:, 0] = spot
     for t in range(1, steps + 1):
-        z = rng.standard_normal(n_paths)
-        paths[:, t] = paths[:, t - 1] * np.exp(drift + diffusion * z)
+        paths[:, t] = paths[:, t - 1] * np.exp(drift + diffusion * normals[:, t - 1])
     return paths
 
 
@@ -36,10 +51,1020 @@ def simulate_gbm_paths(
     steps: int,
     n_paths: int,
     seed: int | None = None,
+    workers: int | None = None,
+    dtype: str = "float64",
 ) -> np.ndarray:
+    # Normals always come from the fixed seed blocks, so paths do not depend on `workers`
+    # and match the draws of the pricers at the default chunk size.
+    normals = np.empty((n_paths, steps), dtype=dtype)
+    blocks = _path_blocks(n_paths, seed)
+
+    def fill(block: tuple[int, int, np.random.SeedSequence]) -> None:
+        start, stop, child = block
+        np.random.default_rng(child).standard_normal(out=normals[start:stop], dtype=dtype)
+
+    with ThreadPoolExecutor(max_workers=workers or 1) as pool:
+        list(pool.map(fill, blocks))
     if numba_available():
-        return gbm_paths_numba(spot, rate, dividend_yield, vol, maturity, steps, n_paths, seed)
-    return _gbm_paths_numpy(spot, rate, dividend_yield, vol, maturity, steps, n_paths, seed)
+        return gbm_paths_numba(spot, rate, dividend_yield, vol, maturity, steps, n_paths, seed, normals, dtype)
+    return _gbm_paths_numpy(spot, rate, dividend_yield, vol, maturity, steps, n_paths, seed, normals, dtype)
+
+
+_SEED_BLOCK = 16384
+
+
+def _path_blocks(
+    n_paths: int,
+    seed: int | None,
+    block_size: int = _SEED_BLOCK,
+) -> Iterator[tuple[int, int, np.random.SeedSequence]]:
+    # Fixed-size blocks with one spawned stream each: the random numbers depend only on the seed
+    # and block size, never on how many workers consume the blocks or how many are consumed.
+    root = np.random.SeedSequence(seed)
+    for start in range(0, n_paths, block_size):
+        yield start, min(start + block_size, n_paths), root.spawn(1)[0]
+
+
+def _block_normals(
+    child: np.random.SeedSequence,
+    n_paths: int,
+    steps: int,
+    chunk_size: int,
+    dtype: str = "float64",
+) -> Iterator[np.ndarray]:
+    # One seed block streamed in chunk_size pieces; consecutive draws continue the block's stream,
+    # so the normals do not depend on chunk_size. Time-major: each step reads a contiguous row.
+    rng = np.random.default_rng(child)
+    for start in range(0, n_paths, chunk_size):
+        yield np.ascontiguousarray(rng.standard_normal((min(chunk_size, n_paths - start), steps), dtype=dtype).T)
+
+
+@dataclass(frozen=True)
+class _PathStatistics:
+    terminal: np.ndarray
+    average: np.ndarray
+    maximum: np.ndarray
+    minimum: np.ndarray
+    geometric_average: np.ndarray | None = None
+    survival: np.ndarray | None = None
+    # Sensitivity statistics: shocks for likelihood-ratio weights, and time- and
+    # log-weighted averages of the monitored levels for pathwise derivatives.
+    first_shock: np.ndarray | None = None
+    shock_sum: np.ndarray | None = None
+    shock_square_sum: np.ndarray | None = None
+    time_weighted_average: np.ndarray | None = None
+    log_weighted_average: np.ndarray | None = None
+
+
+def _normal_chunks(
+    n_paths: int,
+    steps: int,
+    seed: int | None,
+    chunk_size: int,
+    dtype: str = "float64",
+) -> Iterator[np.ndarray]:
+    # The normals of the pricers and simulate_gbm_paths, in chunk_size pieces.
+    for start, stop, child in _path_blocks(n_paths, seed):
+        yield from _block_normals(child, stop - start, steps, chunk_size, dtype)
+
+
+def _walk_gbm(
+    spot: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    maturity: float,
+    normals: np.ndarray,
+    geometric: bool = False,
+    monitored: tuple[np.ndarray, np.ndarray] | None = None,
+    sensitivities: bool = False,
+) -> _PathStatistics:
+    # Market inputs may be (scenarios, 1) columns: every scenario then reuses the same shocks.
+    # Paths run in the dtype of the normals (float32 halves memory traffic).
+    steps, n = normals.shape
+    dtype = normals.dtype
+    dt = maturity / steps
+    drift = np.asarray((rate - dividend_yield - 0.5 * vol * vol) * dt, dtype=dtype)
+    diffusion = np.asarray(vol * np.sqrt(dt), dtype=dtype)
+    shape = np.broadcast_shapes(np.shape(spot), drift.shape, diffusion.shape, (n,))
+    level = np.full(shape, spot, dtype=dtype)
+    running_sum = np.zeros(shape, dtype=dtype)
+    running_max = level.copy()
+    running_min = level.copy()
+    log_level = np.zeros(shape, dtype=dtype) if geometric or sensitivities else None
+    log_sum = np.zeros(shape, dtype=dtype) if geometric else None
+    if sensitivities:
+        shock_sum = np.zeros(n, dtype=dtype)
+        shock_square_sum = np.zeros(n, dtype=dtype)
+        time_weighted = np.zeros(shape, dtype=dtype)
+        log_weighted = np.zeros(shape, dtype=dtype)
+    if monitored is not None:
+        # Brownian-bridge survival: between two monitoring dates on the safe side of barrier B,
+        # the log-path crosses with probability exp(-2 log(B/S_t) log(B/S_t+dt) / (vol^2 dt)).
+        barrier, is_up = monitored
+        distance = np.broadcast_to(np.log(barrier / spot), (barrier.shape[0], n))
+        survival = np.ones((barrier.shape[0], n))
+        bridge_scale = -2.0 / (vol * vol * dt)
+    for t in range(steps):
+        increment = drift + diffusion * normals[t]
+        level = level * np.exp(increment)
+        running_sum += level
+        np.maximum(running_max, level, out=running_max)
+        np.minimum(running_min, level, out=running_min)
+        if geometric or sensitivities:
+            log_level += increment
+        if geometric:
+            log_sum += log_level
+        if sensitivities:
+            shock_sum += normals[t]
+            shock_square_sum += normals[t] * normals[t]
+            time_weighted += level * ((t + 1) * dt)
+            log_weighted += level * log_level
+        if monitored is not None:
+            next_distance = distance - increment
+            safe = np.where(is_up, (distance > 0.0) & (next_distance > 0.0), (distance < 0.0) & (next_distance < 0.0))
+            crossing = np.exp(bridge_scale * np.where(safe, distance * next_distance, 0.0))
+            survival *= np.where(safe, 1.0 - crossing, 0.0)
+            distance = next_distance
+    geometric_average = spot * np.exp(log_sum / steps) if geometric else None
+    stats = _PathStatistics(
+        level,
+        running_sum / steps,
+        running_max,
+        running_min,
+        geometric_average,
+        survival if monitored is not None else None,
+    )
+    if not sensitivities:
+        return stats
+    return replace(
+        stats,
+        first_shock=normals[0].copy(),
+        shock_sum=shock_sum,
+        shock_square_sum=shock_square_sum,
+        time_weighted_average=time_weighted / steps,
+        log_weighted_average=log_weighted / steps,
+    )
+
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    price: float
+    stderr: float
+    n_paths: int
+    variance_reduction: float = 1.0
+
+    def confidence_interval(self, z: float = 1.959963984540054) -> tuple[float, float]:
+        return self.price - z * self.stderr, self.price + z * self.stderr
+
+
+@dataclass(frozen=True)
+class _ControlVariate:
+    payoff: Callable[[_PathStatistics], np.ndarray]
+    expectation: float
+
+
+class _MomentAccumulator:
+    # Sums over sampling units (single paths, or antithetic pairs) of the payoffs y (one row per
+    # payoff) and the control x, plus per-path payoff moments that serve as the plain baseline.
+    def __init__(self) -> None:
+        self.units = 0
+        self.sum_y = 0.0
+        self.sum_yy = 0.0
+        self.sum_x = 0.0
+        self.sum_xx = 0.0
+        self.sum_xy = 0.0
+        self.paths = 0
+        self.sum_path = 0.0
+        self.sum_path_sq = 0.0
+
+    def add(
+        self,
+        y: np.ndarray,
+        x: np.ndarray | None,
+        path_values: np.ndarray,
+        path_weights: np.ndarray | None = None,
+    ) -> None:
+        # Payoffs may be evaluated in single precision; the sums are always accumulated in float64.
+        # Under importance sampling the plain baseline reweights raw path payoffs by their likelihood ratios.
+        y = y.astype(np.float64, copy=False)
+        x = None if x is None else x.astype(np.float64, copy=False)
+        path_values = path_values.astype(np.float64, copy=False)
+        self.units += y.shape[-1]
+        self.sum_y = self.sum_y + y.sum(axis=-1)
+        self.sum_yy = self.sum_yy + np.einsum("pi,pi->p", y, y)
+        if x is not None:
+            self.sum_x += float(np.sum(x))
+            self.sum_xx += float(np.dot(x, x))
+            self.sum_xy = self.sum_xy + y @ x
+        self.paths += path_values.shape[-1]
+        weighted = path_values if path_weights is None else path_values * path_weights
+        self.sum_path = self.sum_path + weighted.sum(axis=-1)
+        self.sum_path_sq = self.sum_path_sq + np.einsum("pi,pi->p", weighted, path_values)
+
+    def merge(self, other: _MomentAccumulator) -> None:
+        for name, value in vars(other).items():
+            setattr(self, name, getattr(self, name) + value)
+
+    def _covariances(self) -> tuple[np.ndarray, float, np.ndarray]:
+        n = self.units
+        mean_y = self.sum_y / n
+        mean_x = self.sum_x / n
+        scale = n / max(n - 1, 1)
+        var_y = np.maximum(self.sum_yy / n - mean_y * mean_y, 0.0) * scale
+        var_x = max(self.sum_xx / n - mean_x * mean_x, 0.0) * scale
+        cov_xy = (self.sum_xy / n - mean_x * mean_y) * scale
+        return var_y, var_x, cov_xy
+
+    def beta(self) -> np.ndarray:
+        _, var_x, cov_xy = self._covariances()
+        return cov_xy / var_x if var_x > 0.0 else np.zeros_like(cov_xy)
+
+    def mean(self, control: _ControlVariate | None, beta: np.ndarray) -> np.ndarray:
+        mean_y = self.sum_y / self.units
+        if control is None:
+            return mean_y
+        return mean_y - beta * (self.sum_x / self.units - control.expectation)
+
+    def unit_variance(self, control: _ControlVariate | None, beta: np.ndarray) -> np.ndarray:
+        var_y, var_x, cov_xy = self._covariances()
+        if control is None:
+            return var_y
+        return np.maximum(var_y - 2.0 * beta * cov_xy + beta * beta * var_x, 0.0)
+
+    def path_variance(self) -> np.ndarray:
+        n = self.paths
+        mean = self.sum_path / n
+        return np.maximum(self.sum_path_sq / n - mean * mean, 0.0) * n / max(n - 1, 1)
+
+
+def _accumulate(
+    payoff: Callable[[_PathStatistics], np.ndarray],
+    control: _ControlVariate | None,
+    chunks: Iterator[np.ndarray],
+    spot: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    maturity: float,
+    antithetic: bool,
+    monitored: tuple[np.ndarray, np.ndarray] | None = None,
+    sensitivities: bool = False,
+    geometric: bool = False,
+    shifts: np.ndarray | None = None,
+) -> _MomentAccumulator:
+    # Payoffs may return one value per path or a (payoffs, paths) matrix evaluated in one pass.
+    moments = _MomentAccumulator()
+    geometric = geometric or control is not None
+
+    def sample(noise: np.ndarray) -> tuple[np.ndarray, np.ndarray | None, np.ndarray | None]:
+        # Defensive mixture: every _IS_DEFENSIVE-th path keeps the plain shocks, the others cycle
+        # through the shifts. Each path carries phi(z) / g(z) for the mixture g of the plain and
+        # shifted normals in this chunk's proportions (balance heuristic), bounded by _IS_DEFENSIVE.
+        weight = None
+        if shifts is not None:
+            index = np.arange(noise.shape[1])
+            slot = index - index // _IS_DEFENSIVE - 1
+            component = np.where(index % _IS_DEFENSIVE == 0, 0, slot % shifts.shape[0] + 1)
+            means = np.vstack([np.zeros(shifts.shape[1]), shifts])
+            noise = noise + means[component].T.astype(noise.dtype)
+            share = np.bincount(component, minlength=means.shape[0]) / noise.shape[1]
+            with np.errstate(divide="ignore"):
+                log_mix = np.log(share)[:, None] + means @ noise.astype(np.float64, copy=False)
+            log_mix -= 0.5 * np.sum(means * means, axis=1)[:, None]
+            top = log_mix.max(axis=0)
+            weight = np.exp(-top - np.log(np.exp(log_mix - top).sum(axis=0)))
+        stats = _walk_gbm(spot, rate, dividend_yield, vol, maturity, noise, geometric, monitored, sensitivities)
+        y = np.atleast_2d(payoff(stats))
+        x = control.payoff(stats) if control is not None else None
+        return y, x, weight
+
+    def weighted(value: np.ndarray | None, weight: np.ndarray | None) -> np.ndarray | None:
+        return value if value is None or weight is None else value * weight
+
+    for normals in chunks:
+        y, x, weight = sample(normals)
+        if not antithetic:
+            moments.add(weighted(y, weight), weighted(x, weight), y, weight)
+            continue
+        y_mirror, x_mirror, weight_mirror = sample(-normals)
+        y_pair = 0.5 * (weighted(y, weight) + weighted(y_mirror, weight_mirror))
+        x_pair = 0.5 * (weighted(x, weight) + weighted(x_mirror, weight_mirror)) if control is not None else None
+        weights = None if shifts is None else np.concatenate([weight, weight_mirror])
+        moments.add(y_pair, x_pair, np.concatenate([y, y_mirror], axis=-1), weights)
+    return moments
+
+
+# One path in _IS_DEFENSIVE keeps the unshifted shocks under importance sampling.
+_IS_DEFENSIVE = 4
+
+
+def _importance_shifts(
+    payoff: Callable[[_PathStatistics], np.ndarray],
+    spot: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    maturity: float,
+    steps: int,
+    monitored: tuple[np.ndarray, np.ndarray] | None,
+    sensitivities: bool,
+    geometric: bool,
+) -> np.ndarray | None:
+    # Drift shifts from the mode of the zero-variance density restricted to piecewise-constant
+    # shifts that switch once: for each switch time, maximize log|payoff| - |shift|^2 / 2 over a
+    # grid of deterministic shifted paths (u = shift in units of each piece's standard deviation).
+    # Knock-ins can cross at any time, so every switch time whose best shift is not negligible
+    # becomes a mixture component. Returns (components, steps).
+    grid = np.linspace(-6.0, 6.0, 49)
+    first, second = (u.ravel() for u in np.meshgrid(grid, grid, indexing="ij"))
+    candidates = []
+    for switch in sorted({max(round(steps * k / 16), 1) for k in range(1, 17)}):
+        shifts = np.empty((steps, first.shape[0]))
+        shifts[:switch] = first / math.sqrt(switch)
+        shifts[switch:] = second / math.sqrt(max(steps - switch, 1))
+        stats = _walk_gbm(spot, rate, dividend_yield, vol, maturity, shifts, geometric, monitored, sensitivities)
+        values = np.abs(np.atleast_2d(payoff(stats))).reshape(-1, shifts.shape[1]).sum(axis=0)
+        with np.errstate(divide="ignore"):
+            objective = np.log(values) - 0.5 * np.sum(shifts * shifts, axis=0)
+        best = int(np.argmax(objective))
+        if np.isfinite(objective[best]):
+            candidates.append((float(objective[best]), shifts[:, best]))
+    if not candidates:
+        return None
+    top = max(value for value, _ in candidates)
+    kept = np.array([shift for value, shift in candidates if value > top - 10.0])
+    return np.unique(np.round(kept, 12), axis=0)
+
+
+def _target_met(price: np.ndarray, stderr: np.ndarray, discount: float, settings: MonteCarloSettings) -> bool:
+    if settings.target_stderr is not None and np.any(discount * stderr > settings.target_stderr):
+        return False
+    if settings.target_rel_stderr is not None and np.any(stderr > settings.target_rel_stderr * np.abs(price)):
+        return False
+    return True
+
+
+def _mc_results(
+    payoff: Callable[[_PathStatistics], np.ndarray],
+    spot: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    maturity: float,
+    steps: int,
+    n_paths: int,
+    seed: int | None,
+    settings: MonteCarloSettings | None,
+    control: _ControlVariate | None = None,
+    monitored: tuple[np.ndarray, np.ndarray] | None = None,
+    sensitivities: bool = False,
+    geometric: bool = False,
+    contrasts: np.ndarray | None = None,
+) -> list[MonteCarloResult]:
+    settings = settings or MonteCarloSettings()
+    # The single-payoff pricers dispatch to the Numba kernel before reaching here.
+    if settings.backend != "numpy":
+        raise ValueError(f"Backend {settings.backend!r} is not supported here; use backend='numpy'")
+    shifts = None
+    if settings.importance_sampling:
+        shifts = _importance_shifts(
+            payoff, spot, rate, dividend_yield, vol, maturity, steps, monitored, sensitivities, geometric or control is not None
+        )
+    # One discount factor per payoff row when the market inputs are scenario columns.
+    discount = np.exp(-np.multiply(rate, maturity)).reshape(-1)
+    if contrasts is not None:
+        # Extra rows: fixed combinations of the discounted rows, formed path by path, so their
+        # standard errors are those of the paired differences.
+        scenario_payoff = payoff
+        combine = contrasts * discount
+
+        def payoff(stats: _PathStatistics) -> np.ndarray:
+            y = scenario_payoff(stats)
+            return np.concatenate([y, combine.astype(y.dtype) @ y])
+
+        discount = np.concatenate([np.broadcast_to(discount, contrasts.shape[1:]), np.ones(contrasts.shape[0])])
+    # With antithetic sampling each drawn normal vector drives a path and its mirror.
+    draws = -(-n_paths // 2) if settings.antithetic else n_paths
+    market = (spot, rate, dividend_yield, vol, maturity)
+    adaptive = settings.target_stderr is not None or settings.target_rel_stderr is not None
+    if (adaptive or settings.max_seconds is not None) and settings.sampler != "pseudo":
+        raise ValueError("Target standard errors and max_seconds require the pseudo-random sampler")
+    if settings.sampler == "sobol":
+        # Randomized QMC: independent scrambles give an unbiased error estimate across replicates.
+        replicates = max(settings.replicates, 2)
+        per_replicate = 1 << max(math.ceil(math.log2(max(draws / replicates, 1.0))), 0)
+
+        def replicate(child: np.random.SeedSequence) -> _MomentAccumulator:
+            chunks = sobol_normal_chunks(
+                per_replicate, steps, child, settings.chunk_size, settings.brownian_bridge, settings.dtype
+            )
+            return _accumulate(payoff, control, chunks, *market, settings.antithetic, monitored, sensitivities, geometric, shifts)
+
+        with ThreadPoolExecutor(max_workers=settings.workers or 1) as pool:
+            parts = list(pool.map(replicate, np.random.SeedSequence(seed).spawn(replicates)))
+        pooled = _MomentAccumulator()
+        for part in parts:
+            pooled.merge(part)
+        beta = pooled.beta() if control is not None else 0.0
+        means = np.array([part.mean(control, beta) for part in parts])
+        price = means.mean(axis=0)
+        stderr = means.std(axis=0, ddof=1) / math.sqrt(replicates)
+    elif settings.sampler == "pseudo":
+        # Every pseudo-random run draws the same fixed seed blocks, whatever the worker count.
+        def block(item: tuple[int, int, np.random.SeedSequence]) -> _MomentAccumulator:
+            start, stop, child = item
+            chunks = _block_normals(child, stop - start, steps, settings.chunk_size, settings.dtype)
+            return _accumulate(payoff, control, chunks, *market, settings.antithetic, monitored, sensitivities, geometric, shifts)
+
+        def estimate() -> tuple[np.ndarray, np.ndarray]:
+            beta = pooled.beta() if control is not None else 0.0
+            return pooled.mean(control, beta), np.sqrt(pooled.unit_variance(control, beta) / pooled.units)
+
+        width = settings.workers or 1
+        deadline = None if settings.max_seconds is None else time.perf_counter() + settings.max_seconds
+        blocks = _path_blocks(draws, seed)
+        pooled = _MomentAccumulator()
+        done = False
+        with ThreadPoolExecutor(max_workers=width) as pool:
+            while not done:
+                batch = list(itertools.islice(blocks, width))
+                if not batch:
+                    break
+                # Merge and test block by block in seed order, so the stopping point and the
+                # estimate do not depend on the worker count.
+                for part in pool.map(block, batch):
+                    pooled.merge(part)
+                    if adaptive and _target_met(*estimate(), discount, settings):
+                        done = True
+                        break
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+        price, stderr = estimate()
+    else:
+        raise ValueError(f"Unknown Monte Carlo sampler: {settings.sampler}")
+    plain_variance = pooled.path_variance() / pooled.paths
+    discount = np.broadcast_to(discount, np.shape(price))
+    return [
+        MonteCarloResult(
+            price=float(d * p),
+            stderr=float(d * e),
+            n_paths=pooled.paths,
+            variance_reduction=float(v / (e * e)) if e > 0.0 else math.inf,
+        )
+        for d, p, e, v in zip(discount, price, stderr, plain_variance)
+    ]
+
+
+def _mc_price(*args, **kwargs) -> MonteCarloResult:
+    return _mc_results(*args, **kwargs)[0]
+
+
+def _numba_backend(settings: MonteCarloSettings | None, extras: bool = False) -> bool:
+    if settings is None or settings.backend == "numpy":
+        return False
+    if settings.backend != "numba":
+        raise ValueError(f"Unknown Monte Carlo backend: {settings.backend}")
+    plain = (
+        settings.sampler == "pseudo"
+        and not settings.antithetic
+        and settings.workers is None
+        and settings.dtype == "float64"
+        and settings.target_stderr is None
+        and settings.target_rel_stderr is None
+        and settings.max_seconds is None
+        and not settings.importance_sampling
+        and not extras
+    )
+    if not plain:
+        raise ValueError("The Numba backend supports plain pseudo-random pricing only")
+    return True
+
+
+def _numba_mc(payoff: str, n_paths: int, **kwargs) -> MonteCarloResult:
+    price, stderr = mc_price_numba(payoff, n_paths=n_paths, **kwargs)
+    return MonteCarloResult(price=price, stderr=stderr, n_paths=n_paths)
+
+
+def _asian_payoff(
+    strike: float,
+    option_type: str,
+    average: str = "arithmetic",
+) -> Callable[[_PathStatistics], np.ndarray]:
+    def payoff(stats: _PathStatistics) -> np.ndarray:
+        mean = stats.geometric_average if average == "geometric" else stats.average
+        if option_type == "call":
+            return np.maximum(mean - strike, 0.0)
+        return np.maximum(strike - mean, 0.0)
+
+    return payoff
+
+
+def _geometric_asian_control(
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    option_type: str,
+    steps: int,
+) -> _ControlVariate:
+    def payoff(stats: _PathStatistics) -> np.ndarray:
+        if option_type == "call":
+            return np.maximum(stats.geometric_average - strike, 0.0)
+        return np.maximum(strike - stats.geometric_average, 0.0)
+
+    exact = geometric_asian_price(spot, strike, maturity, rate, dividend_yield, vol, option_type, steps)
+    return _ControlVariate(payoff, exact * math.exp(rate * maturity))
+
+
+_BGK_SHIFT = 0.5826
+
+
+def _corrected_barrier(barrier: float, barrier_type: str, vol: float, maturity: float, steps: int) -> float:
+    # Broadie-Glasserman-Kou: a discretely monitored barrier behaves like a continuous one moved
+    # away from the spot by exp(0.5826 vol sqrt(dt)), so monitor a barrier moved towards the spot.
+    shift = math.exp(_BGK_SHIFT * vol * math.sqrt(maturity / steps))
+    return barrier / shift if "up" in barrier_type else barrier * shift
+
+
+def _bridge_monitor(barriers: list[float], barrier_types: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    return np.array(barriers, dtype=float)[:, None], np.array(["up" in b for b in barrier_types])[:, None]
+
+
+def _barrier_payoff(
+    strike: float,
+    barrier: float,
+    barrier_type: str,
+    option_type: str,
+    bridge: bool = False,
+) -> Callable[[_PathStatistics], np.ndarray]:
+    def payoff(stats: _PathStatistics) -> np.ndarray:
+        if bridge:
+            survival = stats.survival[0]
+            active = survival if "out" in barrier_type else 1.0 - survival
+        else:
+            if "up" in barrier_type:
+                touched = stats.maximum >= barrier
+            else:
+                touched = stats.minimum <= barrier
+            active = ~touched if "out" in barrier_type else touched
+        if option_type == "call":
+            vanilla = np.maximum(stats.terminal - strike, 0.0)
+        else:
+            vanilla = np.maximum(strike - stats.terminal, 0.0)
+        return vanilla * active
+
+    return payoff
+
+
+def _digital_payoff(strike: float, payout: float, option_type: str) -> Callable[[_PathStatistics], np.ndarray]:
+    def payoff(stats: _PathStatistics) -> np.ndarray:
+        if option_type == "call":
+            return (stats.terminal > strike).astype(float) * payout
+        return (stats.terminal < strike).astype(float) * payout
+
+    return payoff
+
+
+_GREEK_ROWS = ("price", "delta", "vega", "rho")
+
+
+def _asian_pathwise(
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    option_type: str,
+) -> Callable[[_PathStatistics], np.ndarray]:
+    # Pathwise derivatives of each monitored level with the shocks held fixed:
+    # dS_i/dS0 = S_i/S0, dS_i/dvol = S_i (log(S_i/S0) - (r - q + vol^2/2) t_i) / vol, dS_i/dr = S_i t_i.
+    sign = 1.0 if option_type == "call" else -1.0
+
+    def payoff(stats: _PathStatistics) -> np.ndarray:
+        moneyness = sign * (stats.average - strike)
+        value = np.maximum(moneyness, 0.0)
+        slope = sign * (moneyness > 0.0)
+        d_vol = (stats.log_weighted_average - (rate - dividend_yield + 0.5 * vol * vol) * stats.time_weighted_average) / vol
+        return np.stack(
+            [
+                value,
+                slope * stats.average / spot,
+                slope * d_vol,
+                slope * stats.time_weighted_average - maturity * value,
+            ]
+        )
+
+    return payoff
+
+
+def _likelihood_ratio(
+    payoff: Callable[[_PathStatistics], np.ndarray],
+    spot: float,
+    maturity: float,
+    vol: float,
+    steps: int,
+    terminal_only: bool,
+) -> Callable[[_PathStatistics], np.ndarray]:
+    # Score-function weights need no payoff derivative, so they suit discontinuous payoffs.
+    # Terminal payoffs use the density of S_T; path-dependent ones the density of every shock.
+    dt = maturity / steps
+    sqrt_t = math.sqrt(maturity)
+
+    def weighted(stats: _PathStatistics) -> np.ndarray:
+        value = payoff(stats)
+        brownian = stats.shock_sum * math.sqrt(dt)
+        if terminal_only:
+            z = brownian / sqrt_t
+            d_spot = z / (spot * vol * sqrt_t)
+            d_vol = (z * z - 1.0) / vol - z * sqrt_t
+        else:
+            d_spot = stats.first_shock / (spot * vol * math.sqrt(dt))
+            d_vol = (stats.shock_square_sum - steps) / vol - brownian
+        d_rate = brownian / vol - maturity
+        return np.stack([value, value * d_spot, value * d_vol, value * d_rate])
+
+    return weighted
+
+
+def _greeks_mc(
+    payoff: Callable[[_PathStatistics], np.ndarray],
+    spot: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    maturity: float,
+    steps: int,
+    n_paths: int,
+    seed: int | None,
+    settings: MonteCarloSettings | None,
+    detailed: bool,
+) -> dict[str, float] | dict[str, MonteCarloResult]:
+    results = _mc_results(
+        payoff, spot, rate, dividend_yield, vol, maturity, steps, n_paths, seed, settings, sensitivities=True
+    )
+    return {name: result if detailed else result.price for name, result in zip(_GREEK_ROWS, results)}
+
+
+def greeks_asian_option_mc(
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    option_type: str = "call",
+    n_paths: int = 50000,
+    steps: int = 252,
+    seed: int | None = None,
+    surface: VolSurface | None = None,
+    settings: MonteCarloSettings | None = None,
+    detailed: bool = False,
+) -> dict[str, float] | dict[str, MonteCarloResult]:
+    if surface is not None:
+        vol = float(surface.vol(strike, maturity))
+    return _greeks_mc(
+        _asian_pathwise(spot, strike, maturity, rate, dividend_yield, vol, option_type),
+        spot, rate, dividend_yield, vol, maturity, steps, n_paths, seed, settings, detailed,
+    )
+
+
+def greeks_barrier_option_mc(
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    barrier: float,
+    barrier_type: str,
+    option_type: str = "call",
+    n_paths: int = 50000,
+    steps: int = 252,
+    seed: int | None = None,
+    surface: VolSurface | None = None,
+    settings: MonteCarloSettings | None = None,
+    detailed: bool = False,
+) -> dict[str, float] | dict[str, MonteCarloResult]:
+    if surface is not None:
+        vol = float(surface.vol(strike, maturity))
+    return _greeks_mc(
+        _likelihood_ratio(_barrier_payoff(strike, barrier, barrier_type, option_type), spot, maturity, vol, steps, False),
+        spot, rate, dividend_yield, vol, maturity, steps, n_paths, seed, settings, detailed,
+    )
+
+
+def greeks_digital_option_mc(
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    payout: float = 1.0,
+    option_type: str = "call",
+    n_paths: int = 50000,
+    steps: int = 252,
+    seed: int | None = None,
+    surface: VolSurface | None = None,
+    settings: MonteCarloSettings | None = None,
+    detailed: bool = False,
+) -> dict[str, float] | dict[str, MonteCarloResult]:
+    if surface is not None:
+        vol = float(surface.vol(strike, maturity))
+    return _greeks_mc(
+        _likelihood_ratio(_digital_payoff(strike, payout, option_type), spot, maturity, vol, steps, True),
+        spot, rate, dividend_yield, vol, maturity, steps, n_paths, seed, settings, detailed,
+    )
+
+
+def _bump_size(payoff: PayoffSpec, spot: float) -> float:
+    # Relative spot bump (= log-move). Discontinuous payoffs only respond to paths that the bump
+    # carries across the strike or barrier, so they move a tenth of that distance, at least 1%.
+    if isinstance(payoff, AsianPayoff):
+        return 0.01
+    level = payoff.barrier if isinstance(payoff, BarrierPayoff) else payoff.strike
+    return min(max(0.1 * abs(math.log(level / spot)), 0.01), 0.05)
+
+
+def bump_greeks_mc(
+    payoff: PayoffSpec,
+    spot: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    n_paths: int = 50000,
+    steps: int = 252,
+    seed: int | None = None,
+    settings: MonteCarloSettings | None = None,
+    spot_bump: float | None = None,
+    vol_bump: float | None = None,
+    rate_bump: float | None = None,
+    time_bump: float = 1.0 / 365.0,
+    barrier_correction: str | None = None,
+    detailed: bool = False,
+) -> dict[str, float] | dict[str, MonteCarloResult]:
+    # Every bumped market is a scenario column walked with the same normals (common random
+    # numbers), so all bumps cost one simulation and the Monte Carlo noise cancels in differences.
+    # Default bumps move log(S_T) by the same amount: spot_bump, vol_bump sqrt(T) and rate_bump T.
+    size = _bump_size(payoff, spot)
+    spot_bump = size if spot_bump is None else spot_bump
+    if vol_bump is None:
+        vol_bump = 0.01 if isinstance(payoff, AsianPayoff) else size / math.sqrt(maturity)
+    if rate_bump is None:
+        rate_bump = 1e-4 if isinstance(payoff, AsianPayoff) else size / maturity
+    h = spot * spot_bump
+    scenarios = np.array(
+        [
+            (spot, vol, rate, maturity),
+            (spot + h, vol, rate, maturity),
+            (spot - h, vol, rate, maturity),
+            (spot, vol + vol_bump, rate, maturity),
+            (spot, vol - vol_bump, rate, maturity),
+            (spot, vol, rate + rate_bump, maturity),
+            (spot, vol, rate - rate_bump, maturity),
+            (spot, vol, rate, maturity - time_bump),
+        ]
+    )
+    # Finite-difference weights on the discounted scenario prices, one row per greek.
+    contrasts = np.array(
+        [
+            [0.0, 1.0, -1.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+            [-2.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0, 1.0, -1.0, 0.0, 0.0, 0.0],
+            [-1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0],
+            [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, -1.0, 0.0],
+        ]
+    ) / np.array([2.0 * h, h * h, 2.0 * vol_bump, time_bump, 2.0 * rate_bump])[:, None]
+    monitored = None
+    if barrier_correction == "bridge" and isinstance(payoff, BarrierPayoff):
+        monitored = _bridge_monitor([payoff.barrier] * len(scenarios), [payoff.barrier_type] * len(scenarios))
+    elif barrier_correction not in (None, "bridge"):
+        raise ValueError(f"Unknown barrier correction for bumped greeks: {barrier_correction}")
+    spots, vols, rates, maturities = (column[:, None] for column in scenarios.T)
+    results = _mc_results(
+        _payoff_matrix([payoff], monitored is not None),
+        spots, rates, dividend_yield, vols, maturities, steps, n_paths, seed, settings,
+        monitored=monitored, contrasts=contrasts,
+    )
+    names = ("price", "delta", "gamma", "vega", "theta", "rho")
+    picked = [results[0]] + results[len(scenarios):]
+    return {name: result if detailed else result.price for name, result in zip(names, picked)}
+
+
+@dataclass(frozen=True)
+class AsianPayoff:
+    strike: float
+    option_type: str = "call"
+
+
+@dataclass(frozen=True)
+class BarrierPayoff:
+    strike: float
+    barrier: float
+    barrier_type: str
+    option_type: str = "call"
+
+
+@dataclass(frozen=True)
+class DigitalPayoff:
+    strike: float
+    payout: float = 1.0
+    option_type: str = "call"
+
+
+PayoffSpec = AsianPayoff | BarrierPayoff | DigitalPayoff
+
+
+def _payoff_matrix(payoffs: Sequence[PayoffSpec], bridge: bool = False) -> Callable[[_PathStatistics], np.ndarray]:
+    # One row per payoff: every spec is evaluated against the same paths in a single broadcast pass.
+    def column(values: list) -> np.ndarray:
+        return np.array(values)[:, None]
+
+    strike = column([p.strike for p in payoffs])
+    sign = column([1.0 if p.option_type == "call" else -1.0 for p in payoffs])
+    is_asian = column([isinstance(p, AsianPayoff) for p in payoffs])
+    is_digital = column([isinstance(p, DigitalPayoff) for p in payoffs])
+    payout = column([p.payout if isinstance(p, DigitalPayoff) else 1.0 for p in payoffs])
+    is_barrier = column([isinstance(p, BarrierPayoff) for p in payoffs])
+    barrier = column([p.barrier if isinstance(p, BarrierPayoff) else np.nan for p in payoffs])
+    is_up = column([isinstance(p, BarrierPayoff) and "up" in p.barrier_type for p in payoffs])
+    is_out = column([isinstance(p, BarrierPayoff) and "out" in p.barrier_type for p in payoffs])
+
+    def payoff(stats: _PathStatistics) -> np.ndarray:
+        underlying = np.where(is_asian, stats.average, stats.terminal)
+        moneyness = sign * (underlying - strike)
+        value = np.where(is_digital, payout * (moneyness > 0.0), np.maximum(moneyness, 0.0))
+        if bridge:
+            # Survival rows line up with the payoff rows; non-barrier rows are masked out below.
+            active = np.where(is_out, stats.survival, 1.0 - stats.survival)
+        else:
+            active = np.where(is_up, stats.maximum >= barrier, stats.minimum <= barrier) != is_out
+        return value * np.where(is_barrier, active, 1.0)
+
+    return payoff
+
+
+def price_payoffs_mc(
+    payoffs: Sequence[PayoffSpec],
+    spot: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    n_paths: int = 50000,
+    steps: int = 252,
+    seed: int | None = None,
+    settings: MonteCarloSettings | None = None,
+    detailed: bool = False,
+    barrier_correction: str | None = None,
+) -> list[float] | list[MonteCarloResult]:
+    if not payoffs:
+        return []
+    monitored = None
+    if barrier_correction == "bgk":
+        payoffs = [
+            replace(p, barrier=_corrected_barrier(p.barrier, p.barrier_type, vol, maturity, steps))
+            if isinstance(p, BarrierPayoff)
+            else p
+            for p in payoffs
+        ]
+    elif barrier_correction == "bridge":
+        monitored = _bridge_monitor(
+            [p.barrier if isinstance(p, BarrierPayoff) else math.nan for p in payoffs],
+            [p.barrier_type if isinstance(p, BarrierPayoff) else "" for p in payoffs],
+        )
+    elif barrier_correction is not None:
+        raise ValueError(f"Unknown barrier correction: {barrier_correction}")
+    results = _mc_results(
+        _payoff_matrix(payoffs, monitored is not None),
+        spot, rate, dividend_yield, vol, maturity, steps, n_paths, seed, settings, monitored=monitored,
+    )
+    return results if detailed else [result.price for result in results]
+
+
+def _mlmc_level(
+    payoff: Callable[[_PathStatistics], np.ndarray],
+    level: int,
+    n_paths: int,
+    rng: np.random.Generator,
+    market: tuple,
+    base_steps: int,
+    chunk_size: int,
+    monitored: tuple[np.ndarray, np.ndarray] | None,
+) -> tuple[float, float]:
+    # Level l samples P_l - P_{l-1}: the coarse path sums pairs of the fine shocks, so both
+    # discretizations follow the same Brownian path and the difference has small variance.
+    steps = base_steps << level
+    block = max(chunk_size * base_steps // steps, 1)
+    total = square = 0.0
+    for start in range(0, n_paths, block):
+        normals = rng.standard_normal((steps, min(block, n_paths - start)))
+        sample = payoff(_walk_gbm(*market, normals, monitored=monitored))[0]
+        if level:
+            coarse = (normals[0::2] + normals[1::2]) / math.sqrt(2.0)
+            sample = sample - payoff(_walk_gbm(*market, coarse, monitored=monitored))[0]
+        total += float(sample.sum())
+        square += float(np.dot(sample, sample))
+    return total, square
+
+
+def price_mlmc(
+    payoff: PayoffSpec,
+    spot: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    tolerance: float = 0.01,
+    seed: int | None = None,
+    base_steps: int = 2,
+    min_levels: int = 3,
+    max_levels: int = 10,
+    warmup_paths: int = 2000,
+    settings: MonteCarloSettings | None = None,
+) -> MonteCarloResult:
+    # Giles multilevel Monte Carlo targeting the continuous-time price with RMS error `tolerance`:
+    # half the squared error budget goes to variance, half to the bias of the finest level.
+    # Barriers are monitored with the Brownian-bridge survival so every level targets the continuous barrier;
+    # Asians average over every grid point, so the target is the continuously averaged Asian, not a
+    # contract with discrete fixings (252 daily fixings price about 0.02 higher at 25% vol).
+    settings = settings or MonteCarloSettings()
+    unsupported = [
+        name
+        for name, used in (
+            ("backend", settings.backend != "numpy"),
+            ("sampler", settings.sampler != "pseudo"),
+            ("antithetic", settings.antithetic),
+            ("workers", settings.workers is not None),
+            ("dtype", settings.dtype != "float64"),
+            ("importance_sampling", settings.importance_sampling),
+            ("target_stderr", settings.target_stderr is not None),
+            ("target_rel_stderr", settings.target_rel_stderr is not None),
+            ("max_seconds", settings.max_seconds is not None),
+        )
+        if used
+    ]
+    if unsupported:
+        # Only chunk_size applies; the levels stop on `tolerance`.
+        raise ValueError(f"Multilevel Monte Carlo does not support these settings: {', '.join(unsupported)}")
+    monitored = None
+    if isinstance(payoff, BarrierPayoff):
+        monitored = _bridge_monitor([payoff.barrier], [payoff.barrier_type])
+    evaluate = _payoff_matrix([payoff], monitored is not None)
+    market = (spot, rate, dividend_yield, vol, maturity)
+    rngs = [np.random.default_rng(child) for child in np.random.SeedSequence(seed).spawn(max_levels + 1)]
+    n_levels = max(min(min_levels, max_levels + 1), 2)
+    paths = np.zeros(max_levels + 1, dtype=np.int64)
+    sums = np.zeros(max_levels + 1)
+    squares = np.zeros(max_levels + 1)
+    variance = np.zeros(max_levels + 1)
+    # Cost of one sample: fine steps plus the coupled coarse steps.
+    cost = np.array([base_steps << l for l in range(max_levels + 1)], dtype=float)
+    cost[1:] *= 1.5
+    extra = np.zeros(max_levels + 1, dtype=np.int64)
+    extra[:n_levels] = warmup_paths
+    while True:
+        for l in np.flatnonzero(extra):
+            total, square = _mlmc_level(
+                evaluate, int(l), int(extra[l]), rngs[l], market, base_steps, settings.chunk_size, monitored
+            )
+            paths[l] += extra[l]
+            sums[l] += total
+            squares[l] += square
+        sampled = paths[:n_levels] > 0
+        mean = np.where(sampled, sums[:n_levels] / np.maximum(paths[:n_levels], 1), 0.0)
+        variance[:n_levels] = np.where(
+            sampled, np.maximum(squares[:n_levels] / np.maximum(paths[:n_levels], 1) - mean * mean, 0.0), variance[:n_levels]
+        )
+        # Optimal allocation N_l proportional to sqrt(V_l / C_l) for a variance of tolerance^2 / 2.
+        root = np.sqrt(variance[:n_levels] * cost[:n_levels])
+        optimal = np.ceil(2.0 / tolerance**2 * np.sqrt(variance[:n_levels] / cost[:n_levels]) * root.sum())
+        extra[:n_levels] = np.maximum(optimal.astype(np.int64) - paths[:n_levels], 0)
+        if np.any(extra[:n_levels] > 0.01 * paths[:n_levels]):
+            continue
+        # Weak order from the decay of the level corrections (at least 1/2), then the remaining bias.
+        corrections = np.abs(mean[1:])
+        slope = -np.polyfit(np.arange(1, n_levels), np.log2(np.maximum(corrections, 1e-300)), 1)[0]
+        alpha = max(slope, 0.5) if n_levels > 2 else 1.0
+        bias = max(corrections[-1], corrections[-2] / 2.0**alpha if n_levels > 2 else 0.0) / (2.0**alpha - 1.0)
+        if bias <= tolerance / math.sqrt(2.0) or n_levels > max_levels:
+            break
+        # Add a level; its variance is extrapolated until it has samples.
+        variance[n_levels] = variance[n_levels - 1] / 2.0
+        n_levels += 1
+        root = np.sqrt(variance[:n_levels] * cost[:n_levels])
+        optimal = np.ceil(2.0 / tolerance**2 * np.sqrt(variance[:n_levels] / cost[:n_levels]) * root.sum())
+        extra[:n_levels] = np.maximum(optimal.astype(np.int64) - paths[:n_levels], 0)
+    discount = math.exp(-rate * maturity)
+    used = paths[:n_levels]
+    price = discount * float(np.sum(sums[:n_levels] / used))
+    stderr = discount * math.sqrt(float(np.sum(variance[:n_levels] / used)))
+    return MonteCarloResult(price=price, stderr=stderr, n_paths=int(used.sum()))
 
 
 def price_asian_option_mc(
@@ -53,14 +1078,29 @@ def price_asian_option_mc(
     n_paths: int = 50000,
     steps: int = 252,
     seed: int | None = None,
-) -> float:
-    paths = simulate_gbm_paths(spot, rate, dividend_yield, vol, maturity, steps, n_paths, seed)
-    avg_price = paths[:, 1:].mean(axis=1)
-    if option_type == "call":
-        payoff = np.maximum(avg_price - strike, 0.0)
-    else:
-        payoff = np.maximum(strike - avg_price, 0.0)
-    return math.exp(-rate * maturity) * float(np.mean(payoff))
+    surface: VolSurface | None = None,
+    settings: MonteCarloSettings | None = None,
+    detailed: bool = False,
+    control_variate: bool = False,
+    average: str = "arithmetic",
+) -> float | MonteCarloResult:
+    if surface is not None:
+        vol = float(surface.vol(strike, maturity))
+    if _numba_backend(settings, control_variate or average != "arithmetic"):
+        result = _numba_mc(
+            "asian", n_paths, spot=spot, strike=strike, maturity=maturity, rate=rate,
+            dividend_yield=dividend_yield, vol=vol, option_type=option_type, steps=steps, seed=seed,
+        )
+        return result if detailed else result.price
+    control = None
+    if control_variate:
+        control = _geometric_asian_control(spot, strike, maturity, rate, dividend_yield, vol, option_type, steps)
+    result = _mc_price(
+        _asian_payoff(strike, option_type, average),
+        spot, rate, dividend_yield, vol, maturity, steps, n_paths, seed, settings, control,
+        geometric=average == "geometric",
+    )
+    return result if detailed else result.price
 
 
 def price_barrier_option_mc(
@@ -76,23 +1116,32 @@ def price_barrier_option_mc(
     n_paths: int = 50000,
     steps: int = 252,
     seed: int | None = None,
-) -> float:
-    paths = simulate_gbm_paths(spot, rate, dividend_yield, vol, maturity, steps, n_paths, seed)
-    if "up" in barrier_type:
-        touched = paths.max(axis=1) >= barrier
-    else:
-        touched = paths.min(axis=1) <= barrier
-    if "out" in barrier_type:
-        active = ~touched
-    else:
-        active = touched
-    terminal = paths[:, -1]
-    if option_type == "call":
-        payoff = np.maximum(terminal - strike, 0.0)
-    else:
-        payoff = np.maximum(strike - terminal, 0.0)
-    payoff = payoff * active
-    return math.exp(-rate * maturity) * float(np.mean(payoff))
+    surface: VolSurface | None = None,
+    settings: MonteCarloSettings | None = None,
+    detailed: bool = False,
+    barrier_correction: str | None = None,
+) -> float | MonteCarloResult:
+    if surface is not None:
+        vol = float(surface.vol(strike, maturity))
+    if _numba_backend(settings, barrier_correction is not None):
+        result = _numba_mc(
+            "barrier", n_paths, spot=spot, strike=strike, maturity=maturity, rate=rate,
+            dividend_yield=dividend_yield, vol=vol, option_type=option_type, steps=steps, seed=seed,
+            barrier=barrier, barrier_type=barrier_type,
+        )
+        return result if detailed else result.price
+    monitored = None
+    if barrier_correction == "bgk":
+        barrier = _corrected_barrier(barrier, barrier_type, vol, maturity, steps)
+    elif barrier_correction == "bridge":
+        monitored = _bridge_monitor([barrier], [barrier_type])
+    elif barrier_correction is not None:
+        raise ValueError(f"Unknown barrier correction: {barrier_correction}")
+    result = _mc_price(
+        _barrier_payoff(strike, barrier, barrier_type, option_type, monitored is not None),
+        spot, rate, dividend_yield, vol, maturity, steps, n_paths, seed, settings, monitored=monitored,
+    )
+    return result if detailed else result.price
 
 
 def price_digital_option_mc(
@@ -107,11 +1156,20 @@ def price_digital_option_mc(
     n_paths: int = 50000,
     steps: int = 252,
     seed: int | None = None,
-) -> float:
-    paths = simulate_gbm_paths(spot, rate, dividend_yield, vol, maturity, steps, n_paths, seed)
-    terminal = paths[:, -1]
-    if option_type == "call":
-        payoff = (terminal > strike).astype(float) * payout
-    else:
-        payoff = (terminal < strike).astype(float) * payout
-    return math.exp(-rate * maturity) * float(np.mean(payoff))
+    surface: VolSurface | None = None,
+    settings: MonteCarloSettings | None = None,
+    detailed: bool = False,
+) -> float | MonteCarloResult:
+    if surface is not None:
+        vol = float(surface.vol(strike, maturity))
+    if _numba_backend(settings):
+        result = _numba_mc(
+            "digital", n_paths, spot=spot, strike=strike, maturity=maturity, rate=rate,
+            dividend_yield=dividend_yield, vol=vol, option_type=option_type, steps=steps, seed=seed, payout=payout,
+        )
+        return result if detailed else result.price
+    result = _mc_price(
+        _digital_payoff(strike, payout, option_type),
+        spot, rate, dividend_yield, vol, maturity, steps, n_paths, seed, settings,
+    )
+    return result if detailed else result.price
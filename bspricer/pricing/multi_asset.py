@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Sequence
+
+import numpy as np
+
+from bspricer.config import MonteCarloSettings
+from bspricer.pricing.monte_carlo import MonteCarloResult, _MomentAccumulator, _path_blocks
+
+
+@lru_cache(maxsize=16)
+def _cholesky_cached(data: bytes, n_assets: int) -> np.ndarray:
+    correlation = np.frombuffer(data, dtype=np.float64).reshape(n_assets, n_assets)
+    if not np.allclose(correlation, correlation.T) or not np.allclose(np.diag(correlation), 1.0):
+        raise ValueError("Correlation matrix must be symmetric with a unit diagonal")
+    try:
+        factor = np.linalg.cholesky(correlation)
+    except np.linalg.LinAlgError:
+        raise ValueError("Correlation matrix is not positive definite") from None
+    factor.setflags(write=False)
+    return factor
+
+
+def correlation_factor(correlation: np.ndarray) -> np.ndarray:
+    # Lower Cholesky factor L (C = L L^T), factorized once per distinct matrix and cached.
+    correlation = np.ascontiguousarray(correlation, dtype=np.float64)
+    return _cholesky_cached(correlation.tobytes(), correlation.shape[0])
+
+
+@dataclass(frozen=True)
+class _AssetMarket:
+    log_spot: np.ndarray
+    drift: np.ndarray
+    diffusion: np.ndarray
+    factor: np.ndarray
+
+    def terminal(self, normals: np.ndarray) -> np.ndarray:
+        # normals (paths, assets) -> correlated terminal levels, one BLAS product per block.
+        shocks = normals @ self.factor.T.astype(normals.dtype)
+        return np.exp(self.log_spot + self.drift + self.diffusion * shocks)
+
+
+def _asset_market(spot, maturity, rate, dividend_yield, vol, correlation, dtype: str = "float64") -> _AssetMarket:
+    # One entry per asset; scalar inputs are shared by every asset of the correlation matrix.
+    factor = correlation_factor(correlation)
+    try:
+        spot, dividend_yield, vol = (
+            np.broadcast_to(np.asarray(value, dtype=float), (factor.shape[0],)) for value in (spot, dividend_yield, vol)
+        )
+    except ValueError:
+        raise ValueError("Correlation matrix size does not match the number of assets") from None
+    # GBM terminal values are exact in one step, so no time grid is walked for European payoffs.
+    drift = (rate - dividend_yield - 0.5 * vol * vol) * maturity
+    return _AssetMarket(
+        np.log(spot).astype(dtype),
+        drift.astype(dtype),
+        (vol * math.sqrt(maturity)).astype(dtype),
+        factor,
+    )
+
+
+def simulate_correlated_gbm(
+    spot,
+    maturity: float,
+    rate: float,
+    dividend_yield,
+    vol,
+    correlation: np.ndarray,
+    n_paths: int,
+    seed: int | None = None,
+    dtype: str = "float64",
+) -> np.ndarray:
+    # Terminal levels (n_paths, n_assets); drawn in the same blocks as the pricer.
+    market = _asset_market(spot, maturity, rate, dividend_yield, vol, correlation, dtype)
+    out = np.empty((n_paths, market.factor.shape[0]), dtype=dtype)
+    for start, stop, child in _path_blocks(n_paths, seed, MonteCarloSettings().chunk_size):
+        normals = np.random.default_rng(child).standard_normal((stop - start, out.shape[1]), dtype=dtype)
+        out[start:stop] = market.terminal(normals)
+    return out
+
+
+@dataclass(frozen=True)
+class BasketPayoff:
+    strike: float
+    weights: tuple[float, ...]
+    option_type: str = "call"
+
+
+@dataclass(frozen=True)
+class BestOfPayoff:
+    strike: float
+    option_type: str = "call"
+
+
+@dataclass(frozen=True)
+class WorstOfPayoff:
+    strike: float
+    option_type: str = "call"
+
+
+MultiAssetPayoff = BasketPayoff | BestOfPayoff | WorstOfPayoff
+
+
+def _multi_asset_matrix(payoffs: Sequence[MultiAssetPayoff], n_assets: int) -> Callable[[np.ndarray], np.ndarray]:
+    # One row per payoff evaluated on terminal levels (paths, assets) in one broadcast pass.
+    def column(values: list) -> np.ndarray:
+        return np.array(values)[:, None]
+
+    weights = np.array([p.weights if isinstance(p, BasketPayoff) else np.zeros(n_assets) for p in payoffs], dtype=float)
+    if weights.shape[1] != n_assets:
+        raise ValueError("Basket weights do not match the number of assets")
+    strike = column([p.strike for p in payoffs])
+    sign = column([1.0 if p.option_type == "call" else -1.0 for p in payoffs])
+    is_best = column([isinstance(p, BestOfPayoff) for p in payoffs])
+    is_worst = column([isinstance(p, WorstOfPayoff) for p in payoffs])
+
+    def payoff(terminal: np.ndarray) -> np.ndarray:
+        basket = weights.astype(terminal.dtype) @ terminal.T
+        underlying = np.where(is_best, terminal.max(axis=1), np.where(is_worst, terminal.min(axis=1), basket))
+        return np.maximum(sign * (underlying - strike), 0.0)
+
+    return payoff
+
+
+def price_multi_asset_mc(
+    payoffs: Sequence[MultiAssetPayoff],
+    spot,
+    maturity: float,
+    rate: float,
+    dividend_yield,
+    vol,
+    correlation: np.ndarray,
+    n_paths: int = 100000,
+    seed: int | None = None,
+    settings: MonteCarloSettings | None = None,
+    detailed: bool = False,
+) -> list[float] | list[MonteCarloResult]:
+    # Streams fixed path blocks (paths x assets, never paths x steps x assets) through the shared
+    # payoff matrix; blocks merge in seed order, so results do not depend on the worker count.
+    if not payoffs:
+        return []
+    settings = settings or MonteCarloSettings()
+    if settings.sampler != "pseudo":
+        raise ValueError("Multi-asset Monte Carlo supports the pseudo-random sampler only")
+    if settings.backend != "numpy":
+        raise ValueError(f"Backend {settings.backend!r} is not supported here; use backend='numpy'")
+    if settings.target_stderr is not None or settings.target_rel_stderr is not None or settings.max_seconds is not None:
+        raise ValueError("Multi-asset Monte Carlo does not support targets or max_seconds")
+    market = _asset_market(spot, maturity, rate, dividend_yield, vol, correlation, settings.dtype)
+    n_assets = market.factor.shape[0]
+    payoff = _multi_asset_matrix(payoffs, n_assets)
+    draws = -(-n_paths // 2) if settings.antithetic else n_paths
+
+    def block(item: tuple[int, int, np.random.SeedSequence]) -> _MomentAccumulator:
+        start, stop, child = item
+        normals = np.random.default_rng(child).standard_normal((stop - start, n_assets), dtype=settings.dtype)
+        moments = _MomentAccumulator()
+        y = payoff(market.terminal(normals))
+        if settings.antithetic:
+            y_mirror = payoff(market.terminal(-normals))
+            moments.add(0.5 * (y + y_mirror), None, np.concatenate([y, y_mirror], axis=-1))
+        else:
+            moments.add(y, None, y)
+        return moments
+
+    pooled = _MomentAccumulator()
+    with ThreadPoolExecutor(max_workers=settings.workers or 1) as pool:
+        for part in pool.map(block, _path_blocks(draws, seed, settings.chunk_size)):
+            pooled.merge(part)
+    discount = math.exp(-rate * maturity)
+    price = pooled.mean(None, 0.0)
+    stderr = np.sqrt(pooled.unit_variance(None, 0.0) / pooled.units)
+    plain_variance = pooled.path_variance() / pooled.paths
+    results = [
+        MonteCarloResult(
+            price=float(discount * p),
+            stderr=float(discount * e),
+            n_paths=pooled.paths,
+            variance_reduction=float(v / (e * e)) if e > 0.0 else math.inf,
+        )
+        for p, e, v in zip(price, stderr, plain_variance)
+    ]
+    return results if detailed else [result.price for result in results]
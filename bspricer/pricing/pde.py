@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from typing import Sequence
+
+import numpy as np
+
+from bspricer.instruments.exotics import BarrierOption
+from bspricer.instruments.vanilla import EquityOption
+from bspricer.models.black_scholes import price_and_greeks as bs_price_and_greeks
+from bspricer.performance.numba_kernels import numba_available, tridiagonal_solve_numba
+
+
+def _tridiagonal_solve_numpy(
+    lower: np.ndarray,
+    diag: np.ndarray,
+    upper: np.ndarray,
+    rhs: np.ndarray,
+    obstacle: np.ndarray,
+) -> np.ndarray:
+    n = diag.shape[0]
+    upper_factor = np.empty(n)
+    pivot = np.empty(n)
+    forward = np.empty_like(rhs)
+    pivot[0] = diag[0]
+    upper_factor[0] = upper[0] / pivot[0]
+    forward[0] = rhs[0] / pivot[0]
+    for i in range(1, n):
+        pivot[i] = diag[i] - lower[i] * upper_factor[i - 1]
+        upper_factor[i] = upper[i] / pivot[i]
+        forward[i] = (rhs[i] - lower[i] * forward[i - 1]) / pivot[i]
+    out = np.empty_like(rhs)
+    out[-1] = np.maximum(forward[-1], obstacle[-1])
+    for i in range(n - 2, -1, -1):
+        out[i] = np.maximum(forward[i] - upper_factor[i] * out[i + 1], obstacle[i])
+    return out
+
+
+def _tridiagonal_solve(
+    lower: np.ndarray,
+    diag: np.ndarray,
+    upper: np.ndarray,
+    rhs: np.ndarray,
+    obstacle: np.ndarray,
+    reverse: bool = False,
+) -> np.ndarray:
+    # Brennan-Schwartz is exact when elimination sweeps in from the continuation region,
+    # so puts (exercised at low spots) solve the index-reversed system.
+    if reverse:
+        lower, diag, upper = upper[::-1], diag[::-1], lower[::-1]
+        rhs, obstacle = rhs[::-1], obstacle[::-1]
+    solve = tridiagonal_solve_numba if numba_available() else _tridiagonal_solve_numpy
+    out = solve(lower, diag, upper, rhs, obstacle)
+    return out[::-1] if reverse else out
+
+
+def _stretched_grid(lower: float, upper: float, centers: np.ndarray, n_space: int, concentration: float) -> np.ndarray:
+    # Sum of asinh maps (Tavella-Randall): uniform in the mapped variable, dense around each center.
+    fine = np.linspace(lower, upper, 64 * n_space + 1)
+    mapped = (fine - lower) / (upper - lower)
+    for center in centers:
+        width = concentration * center
+        mapped = mapped + np.arcsinh((fine - center) / width)
+    nodes = np.interp(np.linspace(mapped[0], mapped[-1], n_space + 1), mapped, fine)
+    nodes[0], nodes[-1] = lower, upper
+    return nodes
+
+
+def _spot_weights(nodes: np.ndarray, spot: float) -> tuple[int, np.ndarray]:
+    # Quadratic Lagrange interpolation through the three nodes around the spot: value, first, second derivative.
+    i = int(np.clip(np.searchsorted(nodes, spot), 1, nodes.shape[0] - 2))
+    if spot - nodes[i - 1] < nodes[i] - spot:
+        i = max(i - 1, 1)
+    x0, x1, x2 = nodes[i - 1 : i + 2]
+    d0 = (x0 - x1) * (x0 - x2)
+    d1 = (x1 - x0) * (x1 - x2)
+    d2 = (x2 - x0) * (x2 - x1)
+    weights = np.array([
+        [(spot - x1) * (spot - x2) / d0, (spot - x0) * (spot - x2) / d1, (spot - x0) * (spot - x1) / d2],
+        [(2.0 * spot - x1 - x2) / d0, (2.0 * spot - x0 - x2) / d1, (2.0 * spot - x0 - x1) / d2],
+        [2.0 / d0, 2.0 / d1, 2.0 / d2],
+    ])
+    return i, weights
+
+
+def _solve_grid(
+    spot: float,
+    strike: np.ndarray,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    is_call: bool,
+    american: bool,
+    lower_barrier: float | None,
+    upper_barrier: float | None,
+    n_space: int,
+    n_time: int,
+    rannacher_steps: int,
+    concentration: float,
+) -> np.ndarray:
+    top = max(spot, float(strike.max())) * math.exp(max(6.0 * vol * math.sqrt(maturity), 0.25))
+    lo = 0.0 if lower_barrier is None else lower_barrier
+    hi = top if upper_barrier is None else upper_barrier
+    centers = [c for c in (strike.min(), np.median(strike), strike.max()) if lo < c < hi]
+    centers = np.unique(np.array(centers + [b for b in (lower_barrier, upper_barrier) if b is not None]))
+    nodes = _stretched_grid(lo, hi, centers if centers.size else np.array([spot]), n_space, concentration)
+
+    # Non-uniform central differences for L V = 0.5 vol^2 S^2 V_SS + (r - q) S V_S - r V.
+    h = np.diff(nodes)
+    hm, hp = h[:-1], h[1:]
+    s = nodes[1:-1]
+    drift = (rate - dividend_yield) * s
+    diffusion = 0.5 * vol * vol * s * s
+    op_lower = (2.0 * diffusion - drift * hp) / (hm * (hm + hp))
+    op_upper = (2.0 * diffusion + drift * hm) / (hp * (hm + hp))
+    op_diag = -(2.0 * diffusion - drift * (hp - hm)) / (hm * hp) - rate
+
+    sign = 1.0 if is_call else -1.0
+    intrinsic = np.maximum(sign * (nodes[:, None] - strike[None, :]), 0.0)
+    obstacle = intrinsic if american else np.full_like(intrinsic, -np.inf)
+
+    def boundaries(tau: float) -> tuple[np.ndarray, np.ndarray]:
+        zero = np.zeros_like(strike)
+        if lower_barrier is not None or is_call:
+            low = zero
+        else:
+            low = strike if american else strike * math.exp(-rate * tau)
+        if upper_barrier is not None or not is_call:
+            high = zero
+        else:
+            high = hi * math.exp(-dividend_yield * tau) - strike * math.exp(-rate * tau)
+            if american:
+                high = np.maximum(high, hi - strike)
+        return low, high
+
+    values = intrinsic.copy()
+    values[0], values[-1] = boundaries(0.0)
+    dt = maturity / n_time
+    # Rannacher start-up: the first steps are split into implicit half-steps to damp the payoff kink.
+    schedule = [(0.5 * dt, 1.0)] * (2 * min(rannacher_steps, n_time)) + [(dt, 0.5)] * (n_time - min(rannacher_steps, n_time))
+    tau = 0.0
+    for step, theta in schedule:
+        tau += step
+        rhs = values.copy()
+        if theta < 1.0:
+            rhs[1:-1] += (1.0 - theta) * step * (
+                op_lower[:, None] * values[:-2] + op_diag[:, None] * values[1:-1] + op_upper[:, None] * values[2:]
+            )
+        rhs[0], rhs[-1] = boundaries(tau)
+        lower = np.concatenate(([0.0], -theta * step * op_lower, [0.0]))
+        diag = np.concatenate(([1.0], 1.0 - theta * step * op_diag, [1.0]))
+        upper = np.concatenate(([0.0], -theta * step * op_upper, [0.0]))
+        values = _tridiagonal_solve(lower, diag, upper, rhs, obstacle, reverse=not is_call)
+
+    i, weights = _spot_weights(nodes, spot)
+    return weights @ values[i - 1 : i + 2]
+
+
+def price_pde(
+    spot: float,
+    strike: float | np.ndarray,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    vol: float,
+    option_type: str = "call",
+    exercise: str = "european",
+    barrier: float | None = None,
+    barrier_type: str | None = None,
+    n_space: int = 400,
+    n_time: int = 200,
+    rannacher_steps: int = 2,
+    concentration: float = 0.1,
+) -> dict:
+    # Crank-Nicolson on one spot grid; every strike is a right-hand-side column of the same solve.
+    if maturity <= 0.0 or vol <= 0.0:
+        raise ValueError("PDE pricing needs a positive maturity and vol")
+    american = exercise == "american"
+    if american and barrier is not None:
+        raise ValueError("American barrier options are not supported")
+    strikes = np.atleast_1d(np.asarray(strike, dtype=float))
+    vanilla = None
+    lower_barrier = upper_barrier = None
+    grid = None
+    if barrier is not None:
+        is_up = barrier_type.startswith("up")
+        if barrier_type.endswith("in"):
+            # Knock-ins by in-out parity against the closed-form vanilla.
+            bs = bs_price_and_greeks(spot, strikes, maturity, rate, dividend_yield, vol, option_type)
+            vanilla = np.array([bs["price"], bs["delta"], bs["gamma"]])
+        if spot >= barrier if is_up else spot <= barrier:
+            grid = np.zeros((3, strikes.shape[0]))
+        lower_barrier, upper_barrier = (None, barrier) if is_up else (barrier, None)
+    if grid is None:
+        grid = _solve_grid(
+            spot, strikes, maturity, rate, dividend_yield, vol, option_type == "call", american,
+            lower_barrier, upper_barrier, n_space, n_time, rannacher_steps, concentration,
+        )
+    if vanilla is not None:
+        grid = vanilla - grid
+    if np.ndim(strike) == 0:
+        return {"price": float(grid[0, 0]), "delta": float(grid[1, 0]), "gamma": float(grid[2, 0])}
+    return {"price": grid[0], "delta": grid[1], "gamma": grid[2]}
+
+
+def price_barrier_option_pde(
+    option: BarrierOption,
+    n_space: int = 400,
+    n_time: int = 200,
+    greeks: bool = False,
+) -> float | dict:
+    result = price_pde(
+        spot=option.spot,
+        strike=option.strike,
+        maturity=option.maturity,
+        rate=option.rate,
+        dividend_yield=option.dividend_yield,
+        vol=option.vol,
+        option_type=option.option_type.value,
+        barrier=option.barrier,
+        barrier_type=option.barrier_type.value,
+        n_space=n_space,
+        n_time=n_time,
+    )
+    return result if greeks else result["price"]
+
+
+def price_equity_option_pde(
+    option: EquityOption | Sequence[EquityOption],
+    n_space: int = 400,
+    n_time: int = 200,
+    greeks: bool = False,
+) -> float | np.ndarray | dict:
+    if isinstance(option, EquityOption):
+        result = price_pde(
+            spot=option.spot,
+            strike=option.strike,
+            maturity=option.maturity,
+            rate=option.rate,
+            dividend_yield=option.dividend_yield,
+            vol=option.vol,
+            option_type=option.option_type.value,
+            exercise=option.exercise.value,
+            n_space=n_space,
+            n_time=n_time,
+        )
+        return result if greeks else result["price"]
+    # Options differing only by strike share a grid.
+    groups = defaultdict(list)
+    for i, o in enumerate(option):
+        key = (o.spot, o.maturity, o.rate, o.dividend_yield, o.vol, o.option_type, o.exercise)
+        groups[key].append(i)
+    result = {name: np.empty(len(option)) for name in ("price", "delta", "gamma")}
+    for (spot, maturity, rate, dividend_yield, vol, option_type, exercise), index in groups.items():
+        solved = price_pde(
+            spot=spot,
+            strike=np.array([option[i].strike for i in index]),
+            maturity=maturity,
+            rate=rate,
+            dividend_yield=dividend_yield,
+            vol=vol,
+            option_type=option_type.value,
+            exercise=exercise.value,
+            n_space=n_space,
+            n_time=n_time,
+        )
+        for name in result:
+            result[name][index] = solved[name]
+    return result if greeks else result["price"]
+
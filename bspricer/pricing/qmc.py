@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from typing import Iterator
+
+import numpy as np
+
+
+try:
+    from scipy.special import ndtri
+    from scipy.stats import qmc
+    _SCIPY = True
+except Exception:
+    _SCIPY = False
+    ndtri = None
+    qmc = None
+
+
+def sobol_available() -> bool:
+    return _SCIPY
+
+
+@lru_cache(maxsize=32)
+def _bridge_schedule(steps: int) -> tuple[np.ndarray, ...]:
+    # Bisection order: the first Sobol coordinate sets W(T), the next ones fill midpoints,
+    # so the low (best-distributed) dimensions carry most of the path variance.
+    times = np.arange(steps + 1, dtype=float)
+    target = [steps]
+    left = [0]
+    right = [0]
+    left_weight = [0.0]
+    right_weight = [0.0]
+    std = [math.sqrt(times[steps])]
+    queue = [(0, steps)]
+    while queue:
+        lo, hi = queue.pop(0)
+        if hi - lo < 2:
+            continue
+        mid = (lo + hi) // 2
+        span = times[hi] - times[lo]
+        target.append(mid)
+        left.append(lo)
+        right.append(hi)
+        left_weight.append((times[hi] - times[mid]) / span)
+        right_weight.append((times[mid] - times[lo]) / span)
+        std.append(math.sqrt((times[mid] - times[lo]) * (times[hi] - times[mid]) / span))
+        queue.append((lo, mid))
+        queue.append((mid, hi))
+    return (
+        np.array(target),
+        np.array(left),
+        np.array(right),
+        np.array(left_weight),
+        np.array(right_weight),
+        np.array(std),
+    )
+
+
+def brownian_bridge_increments(normals: np.ndarray) -> np.ndarray:
+    # normals: (n, steps) in bridge order. Returns time-major (steps, n) unit-variance increments.
+    n, steps = normals.shape
+    target, left, right, left_weight, right_weight, std = _bridge_schedule(steps)
+    walk = np.zeros((steps + 1, n))
+    for k in range(steps):
+        walk[target[k]] = left_weight[k] * walk[left[k]] + right_weight[k] * walk[right[k]] + std[k] * normals[:, k]
+    return np.diff(walk, axis=0)
+
+
+def sobol_normal_chunks(
+    n_paths: int,
+    steps: int,
+    seed: np.random.SeedSequence,
+    chunk_size: int,
+    bridge: bool = True,
+    dtype: str = "float64",
+) -> Iterator[np.ndarray]:
+    if not _SCIPY:
+        raise RuntimeError("SciPy is required for Sobol sampling")
+    sampler = qmc.Sobol(d=steps, scramble=True, seed=np.random.default_rng(seed))
+    # Powers of two keep the Sobol' balance properties for every chunk.
+    chunk_size = 1 << max(int(chunk_size).bit_length() - 1, 0)
+    drawn = 0
+    while drawn < n_paths:
+        m = min(chunk_size, n_paths - drawn)
+        uniforms = np.clip(sampler.random(m), 1e-16, 1.0 - 1e-16)
+        normals = ndtri(uniforms)
+        if bridge:
+            yield brownian_bridge_increments(normals).astype(dtype, copy=False)
+        else:
+            yield np.ascontiguousarray(normals.T, dtype=dtype)
+        drawn += m
@@ -1,13 +1,32 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Iterable, Sequence
 
-from bspricer.instruments.vanilla import RateOption
+import numpy as np
+
+from bspricer.instruments.vanilla import OptionType, RateOption
 from bspricer.marketdata.curves import FlatCurve
-from bspricer.models.black_76 import price as black_76_price
+from bspricer.models.black_76 import price as black_76_price, price_many as black_76_price_many
+from bspricer.performance.numba_kernels import black_76_price_numba, numba_available
+
+
+def _price_rate_options(options: Sequence[RateOption]) -> np.ndarray:
+    inputs = {
+        "forward": np.array([o.forward for o in options], dtype=float),
+        "strike": np.array([o.strike for o in options], dtype=float),
+        "maturity": np.array([o.maturity for o in options], dtype=float),
+        "discount_rate": np.array([o.discount_rate for o in options], dtype=float),
+        "vol": np.array([o.vol for o in options], dtype=float),
+        "option_type": np.array([o.option_type == OptionType.CALL for o in options], dtype=bool),
+    }
+    if numba_available():
+        return black_76_price_numba(**inputs)
+    return black_76_price_many(**inputs)
 
 
-def price_rate_option(option: RateOption) -> float:
+def price_rate_option(option: RateOption | Sequence[RateOption]) -> float | np.ndarray:
+    if not isinstance(option, RateOption):
+        return _price_rate_options(option)
     return black_76_price(
         forward=option.forward,
         strike=option.strike,
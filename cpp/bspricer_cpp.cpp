@@ -1,38 +1,268 @@
 #include <cmath>
+#include <cstddef>
+#include <stdexcept>
 #include <string>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 
 namespace py = pybind11;
 
+using DoubleArray = py::array_t<double, py::array::c_style>;
+using MaskArray = py::array_t<bool, py::array::c_style>;
+
 double norm_cdf(double x) {
-    return 0.5 * (1.0 + std::erf(x / std::sqrt(2.0)));
+    return 0.5 * std::erfc(-x / std::sqrt(2.0));
 }
 
-double black_scholes_price(
+double norm_pdf(double x) {
+    return std::exp(-0.5 * x * x) / std::sqrt(2.0 * M_PI);
+}
+
+inline double black_scholes_price_one(
     double spot,
     double strike,
     double maturity,
     double rate,
     double dividend_yield,
     double vol,
-    const std::string& option_type
+    bool is_call
 ) {
+    double fwd_spot = spot * std::exp(-dividend_yield * maturity);
+    double fwd_strike = strike * std::exp(-rate * maturity);
     if (maturity <= 0.0 || vol <= 0.0) {
-        double intrinsic = option_type == "call" ? spot - strike : strike - spot;
+        double intrinsic = is_call ? fwd_spot - fwd_strike : fwd_strike - fwd_spot;
         return intrinsic > 0.0 ? intrinsic : 0.0;
     }
     double vsqrt = vol * std::sqrt(maturity);
     double d1 = (std::log(spot / strike) + (rate - dividend_yield + 0.5 * vol * vol) * maturity) / vsqrt;
     double d2 = d1 - vsqrt;
-    double df_r = std::exp(-rate * maturity);
+    if (is_call) {
+        return fwd_spot * norm_cdf(d1) - fwd_strike * norm_cdf(d2);
+    }
+    return fwd_strike * norm_cdf(-d2) - fwd_spot * norm_cdf(-d1);
+}
+
+inline void black_scholes_greeks_one(
+    double spot,
+    double strike,
+    double maturity,
+    double rate,
+    double dividend_yield,
+    double vol,
+    bool is_call,
+    double* out,
+    std::ptrdiff_t stride
+) {
     double df_q = std::exp(-dividend_yield * maturity);
-    if (option_type == "call") {
-        return spot * df_q * norm_cdf(d1) - strike * df_r * norm_cdf(d2);
+    double fwd_spot = spot * df_q;
+    double fwd_strike = strike * std::exp(-rate * maturity);
+    if (maturity <= 0.0 || vol <= 0.0) {
+        double forward_value = fwd_spot - fwd_strike;
+        double intrinsic = is_call ? forward_value : -forward_value;
+        out[0] = intrinsic > 0.0 ? intrinsic : 0.0;
+        if (is_call) {
+            out[stride] = forward_value > 0.0 ? df_q : 0.0;
+        } else {
+            out[stride] = forward_value < 0.0 ? -df_q : 0.0;
+        }
+        for (int k = 2; k < 6; ++k) {
+            out[k * stride] = 0.0;
+        }
+        return;
+    }
+    double sqrt_t = std::sqrt(maturity);
+    double vsqrt = vol * sqrt_t;
+    double d1 = (std::log(spot / strike) + (rate - dividend_yield + 0.5 * vol * vol) * maturity) / vsqrt;
+    double d2 = d1 - vsqrt;
+    double pdf = norm_pdf(d1);
+    double nd1 = norm_cdf(d1);
+    double nd2 = norm_cdf(d2);
+    double decay = -(fwd_spot * pdf * vol) / (2.0 * sqrt_t);
+    if (is_call) {
+        out[0] = fwd_spot * nd1 - fwd_strike * nd2;
+        out[stride] = df_q * nd1;
+        out[4 * stride] = decay - rate * fwd_strike * nd2 + dividend_yield * fwd_spot * nd1;
+        out[5 * stride] = fwd_strike * maturity * nd2;
+    } else {
+        out[0] = fwd_strike * (1.0 - nd2) - fwd_spot * (1.0 - nd1);
+        out[stride] = df_q * (nd1 - 1.0);
+        out[4 * stride] = decay + rate * fwd_strike * (1.0 - nd2) - dividend_yield * fwd_spot * (1.0 - nd1);
+        out[5 * stride] = -fwd_strike * maturity * (1.0 - nd2);
+    }
+    out[2 * stride] = df_q * pdf / (spot * vsqrt);
+    out[3 * stride] = fwd_spot * pdf * sqrt_t;
+}
+
+inline double black_76_price_one(
+    double forward,
+    double strike,
+    double maturity,
+    double discount_rate,
+    double vol,
+    bool is_call
+) {
+    if (maturity <= 0.0 || vol <= 0.0) {
+        double intrinsic = is_call ? forward - strike : strike - forward;
+        return intrinsic > 0.0 ? intrinsic : 0.0;
+    }
+    double vsqrt = vol * std::sqrt(maturity);
+    double d1 = (std::log(forward / strike) + 0.5 * vol * vol * maturity) / vsqrt;
+    double d2 = d1 - vsqrt;
+    double df = std::exp(-discount_rate * maturity);
+    if (is_call) {
+        return df * (forward * norm_cdf(d1) - strike * norm_cdf(d2));
+    }
+    return df * (strike * norm_cdf(-d2) - forward * norm_cdf(-d1));
+}
+
+double black_scholes_price(
+    double spot,
+    double strike,
+    double maturity,
+    double rate,
+    double dividend_yield,
+    double vol,
+    const std::string& option_type
+) {
+    return black_scholes_price_one(spot, strike, maturity, rate, dividend_yield, vol, option_type == "call");
+}
+
+std::ptrdiff_t checked_size(std::initializer_list<py::ssize_t> sizes, py::ssize_t expected) {
+    for (py::ssize_t size : sizes) {
+        if (size != expected) {
+            throw std::invalid_argument("all batch inputs and outputs must have the same length");
+        }
+    }
+    return static_cast<std::ptrdiff_t>(expected);
+}
+
+void black_scholes_price_batch(
+    const DoubleArray& spot,
+    const DoubleArray& strike,
+    const DoubleArray& maturity,
+    const DoubleArray& rate,
+    const DoubleArray& dividend_yield,
+    const DoubleArray& vol,
+    const MaskArray& is_call,
+    DoubleArray& out
+) {
+    std::ptrdiff_t n = checked_size(
+        {strike.size(), maturity.size(), rate.size(), dividend_yield.size(), vol.size(), is_call.size(), out.size()},
+        spot.size()
+    );
+    const double* s = spot.data();
+    const double* k = strike.data();
+    const double* t = maturity.data();
+    const double* r = rate.data();
+    const double* q = dividend_yield.data();
+    const double* v = vol.data();
+    const bool* c = is_call.data();
+    double* o = out.mutable_data();
+    py::gil_scoped_release release;
+#pragma omp parallel for schedule(static)
+    for (std::ptrdiff_t i = 0; i < n; ++i) {
+        o[i] = black_scholes_price_one(s[i], k[i], t[i], r[i], q[i], v[i], c[i]);
+    }
+}
+
+void black_scholes_greeks_batch(
+    const DoubleArray& spot,
+    const DoubleArray& strike,
+    const DoubleArray& maturity,
+    const DoubleArray& rate,
+    const DoubleArray& dividend_yield,
+    const DoubleArray& vol,
+    const MaskArray& is_call,
+    DoubleArray& out
+) {
+    std::ptrdiff_t n = checked_size(
+        {strike.size(), maturity.size(), rate.size(), dividend_yield.size(), vol.size(), is_call.size()},
+        spot.size()
+    );
+    if (out.ndim() != 2 || out.shape(0) != 6 || out.shape(1) != n) {
+        throw std::invalid_argument("greeks output must have shape (6, n)");
+    }
+    const double* s = spot.data();
+    const double* k = strike.data();
+    const double* t = maturity.data();
+    const double* r = rate.data();
+    const double* q = dividend_yield.data();
+    const double* v = vol.data();
+    const bool* c = is_call.data();
+    double* o = out.mutable_data();
+    py::gil_scoped_release release;
+#pragma omp parallel for schedule(static)
+    for (std::ptrdiff_t i = 0; i < n; ++i) {
+        black_scholes_greeks_one(s[i], k[i], t[i], r[i], q[i], v[i], c[i], o + i, n);
+    }
+}
+
+void black_76_price_batch(
+    const DoubleArray& forward,
+    const DoubleArray& strike,
+    const DoubleArray& maturity,
+    const DoubleArray& discount_rate,
+    const DoubleArray& vol,
+    const MaskArray& is_call,
+    DoubleArray& out
+) {
+    std::ptrdiff_t n = checked_size(
+        {strike.size(), maturity.size(), discount_rate.size(), vol.size(), is_call.size(), out.size()},
+        forward.size()
+    );
+    const double* f = forward.data();
+    const double* k = strike.data();
+    const double* t = maturity.data();
+    const double* r = discount_rate.data();
+    const double* v = vol.data();
+    const bool* c = is_call.data();
+    double* o = out.mutable_data();
+    py::gil_scoped_release release;
+#pragma omp parallel for schedule(static)
+    for (std::ptrdiff_t i = 0; i < n; ++i) {
+        o[i] = black_76_price_one(f[i], k[i], t[i], r[i], v[i], c[i]);
     }
-    return strike * df_r * norm_cdf(-d2) - spot * df_q * norm_cdf(-d1);
 }
 
 PYBIND11_MODULE(bspricer_cpp, m) {
     m.doc() = "BSpricer C++ extension";
     m.def("black_scholes_price", &black_scholes_price, "Black-Scholes price");
+    m.def(
+        "black_scholes_price_batch",
+        &black_scholes_price_batch,
+        "Black-Scholes prices written into a caller-provided float64 buffer",
+        py::arg("spot").noconvert(),
+        py::arg("strike").noconvert(),
+        py::arg("maturity").noconvert(),
+        py::arg("rate").noconvert(),
+        py::arg("dividend_yield").noconvert(),
+        py::arg("vol").noconvert(),
+        py::arg("is_call").noconvert(),
+        py::arg("out").noconvert()
+    );
+    m.def(
+        "black_scholes_greeks_batch",
+        &black_scholes_greeks_batch,
+        "Black-Scholes price, delta, gamma, vega, theta, rho written into a (6, n) float64 buffer",
+        py::arg("spot").noconvert(),
+        py::arg("strike").noconvert(),
+        py::arg("maturity").noconvert(),
+        py::arg("rate").noconvert(),
+        py::arg("dividend_yield").noconvert(),
+        py::arg("vol").noconvert(),
+        py::arg("is_call").noconvert(),
+        py::arg("out").noconvert()
+    );
+    m.def(
+        "black_76_price_batch",
+        &black_76_price_batch,
+        "Black-76 prices written into a caller-provided float64 buffer",
+        py::arg("forward").noconvert(),
+        py::arg("strike").noconvert(),
+        py::arg("maturity").noconvert(),
+        py::arg("discount_rate").noconvert(),
+        py::arg("vol").noconvert(),
+        py::arg("is_call").noconvert(),
+        py::arg("out").noconvert()
+    );
 }
@@ -1,4 +1,9 @@
-from bspricer.models.black_scholes import price
+import numpy as np
+import pytest
+
+from bspricer.models.black_76 import price_many as black_76_price_many
+from bspricer.models.black_scholes import greeks, greeks_many, price, price_and_greeks, price_many
+from bspricer.performance.numba_kernels import black_76_price_numba, bs_greeks_numba, bs_price_numba, numba_available
 
 
 def test_black_scholes_call_price():
@@ -12,3 +17,60 @@ def test_black_scholes_call_price():
         option_type="call",
     )
     assert abs(value - 10.4506) < 1e-3
+
+
+def test_price_many_matches_scalar_price():
+    strikes = np.array([80.0, 100.0, 120.0])
+    is_call = np.array([True, False, True])
+    values = price_many(100.0, strikes, 1.0, 0.05, 0.01, 0.2, is_call)
+    batch_greeks = greeks_many(100.0, strikes, 1.0, 0.05, 0.01, 0.2, is_call)
+    for i, strike in enumerate(strikes):
+        kind = "call" if is_call[i] else "put"
+        assert abs(values[i] - price(100.0, strike, 1.0, 0.05, 0.01, 0.2, kind)) < 1e-12
+        for name, value in greeks(100.0, strike, 1.0, 0.05, 0.01, 0.2, kind).items():
+            assert abs(batch_greeks[name][i] - value) < 1e-10
+
+
+def test_price_and_greeks_second_order_match_finite_differences():
+    args = dict(spot=105.0, strike=100.0, maturity=0.75, rate=0.04, dividend_yield=0.02, vol=0.25)
+    h = 1e-4
+    for kind in ("call", "put"):
+        fused = price_and_greeks(**args, option_type=kind)
+        assert abs(fused["price"] - price(**args, option_type=kind)) < 1e-12
+        for name, value in greeks(**args, option_type=kind).items():
+            assert abs(fused[name] - value) < 1e-12
+
+        def bumped(**shift):
+            return price_and_greeks(**{**args, **shift}, option_type=kind)
+
+        vol_up, vol_dn = bumped(vol=args["vol"] + h), bumped(vol=args["vol"] - h)
+        spot_up, spot_dn = bumped(spot=args["spot"] + h), bumped(spot=args["spot"] - h)
+        mat_up, mat_dn = bumped(maturity=args["maturity"] + h), bumped(maturity=args["maturity"] - h)
+        assert abs(fused["vanna"] - (vol_up["delta"] - vol_dn["delta"]) / (2 * h)) < 1e-5
+        assert abs(fused["volga"] - (vol_up["vega"] - vol_dn["vega"]) / (2 * h)) < 1e-4
+        assert abs(fused["charm"] + (mat_up["delta"] - mat_dn["delta"]) / (2 * h)) < 1e-5
+        assert abs(fused["theta"] + (mat_up["price"] - mat_dn["price"]) / (2 * h)) < 1e-5
+        batch = price_and_greeks(
+            [args["spot"]] * 2, args["strike"], args["maturity"], args["rate"],
+            args["dividend_yield"], args["vol"], kind,
+        )
+        for name, value in fused.items():
+            assert abs(batch[name][1] - value) < 1e-10
+
+
+def test_numba_batch_kernels_match_numpy():
+    if not numba_available():
+        pytest.skip("Numba is not available")
+    strikes = np.array([[80.0, 100.0, 120.0]])
+    maturities = np.array([[0.0], [0.5], [2.0]])
+    is_call = np.array([True, False, True])
+    expected = price_many(100.0, strikes, maturities, 0.03, 0.01, 0.2, is_call)
+    assert np.allclose(bs_price_numba(100.0, strikes, maturities, 0.03, 0.01, 0.2, is_call), expected, atol=1e-12)
+    batch = bs_greeks_numba(100.0, strikes, maturities, 0.03, 0.01, 0.2, is_call)
+    for name, value in greeks_many(100.0, strikes, maturities, 0.03, 0.01, 0.2, is_call).items():
+        assert np.allclose(batch[name], value, atol=1e-12)
+    assert np.allclose(
+        black_76_price_numba(0.03, strikes / 4000.0, maturities, 0.02, 0.2, is_call),
+        black_76_price_many(0.03, strikes / 4000.0, maturities, 0.02, 0.2, is_call),
+        atol=1e-14,
+    )
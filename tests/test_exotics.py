@@ -0,0 +1,72 @@
+import math
+
+from fastapi.testclient import TestClient
+
+from bspricer.api.main import app
+from bspricer.models.barrier import price as barrier_price
+from bspricer.models.black_scholes import price as bs_price
+from bspricer.models.digital import price as digital_price
+
+
+def test_barrier_in_out_parity_and_digital_limits():
+    market = dict(spot=100.0, strike=100.0, maturity=1.0, rate=0.03, dividend_yield=0.01, vol=0.25)
+    vanilla = bs_price(**market, option_type="put")
+    knock_in = barrier_price(**market, barrier=85.0, barrier_type="down-and-in", option_type="put")
+    knock_out = barrier_price(**market, barrier=85.0, barrier_type="down-and-out", option_type="put")
+    assert abs(knock_in + knock_out - vanilla) < 1e-12
+    assert abs(barrier_price(**market, barrier=500.0, barrier_type="up-and-out") - bs_price(**market)) < 1e-6
+    call = digital_price(**market, payout=2.0)
+    put = digital_price(**market, payout=2.0, option_type="put")
+    assert abs(call + put - 2.0 * math.exp(-0.03)) < 1e-12
+
+
+def test_api_auto_engine_prefers_closed_forms():
+    client = TestClient(app)
+    digital = {
+        "instrument": "digital_option", "spot": 100.0, "strike": 100.0, "maturity": 1.0, "rate": 0.03, "vol": 0.2,
+    }
+    asian = {
+        "instrument": "asian_option", "spot": 100.0, "strike": 100.0, "maturity": 1.0, "rate": 0.03, "vol": 0.2,
+    }
+    response = client.post("/price", json={"request": digital}).json()
+    assert response["engine"] == "analytic"
+    assert abs(response["price"] - digital_price(100.0, 100.0, 1.0, 0.03, 0.0, 0.2)) < 1e-12
+    batch = client.post(
+        "/batch", json={"requests": [asian, dict(asian, average="geometric")], "n_paths": 2000, "n_steps": 12}
+    ).json()
+    assert batch["engines"] == ["mc", "analytic"]
+    assert client.post("/price", json={"request": digital, "engine": "mc", "n_paths": 2000}).json()["engine"] == "mc"
+
+
+def test_api_barrier_engines_agree_on_discrete_monitoring():
+    client = TestClient(app)
+    barrier = {
+        "instrument": "barrier_option", "spot": 100.0, "strike": 100.0, "maturity": 1.0, "rate": 0.03, "vol": 0.2,
+        "barrier": 130.0, "barrier_type": "up-and-out",
+    }
+    # Both engines price the 252 daily monitoring dates, not the continuous barrier.
+    auto = client.post("/price", json={"request": barrier}).json()
+    mc = client.post("/price", json={"request": barrier, "engine": "mc", "n_paths": 100000, "seed": 3}).json()
+    assert auto["engine"] == "analytic" and mc["engine"] == "mc"
+    assert abs(auto["price"] - mc["price"]) < 0.06  # about 4 MC standard errors
+    assert auto["price"] - barrier_price(100.0, 100.0, 1.0, 0.03, 0.0, 0.2, 130.0, "up-and-out") > 0.1
+
+
+def test_api_rejects_unavailable_engines():
+    client = TestClient(app)
+    asian = {
+        "instrument": "asian_option", "spot": 100.0, "strike": 100.0, "maturity": 1.0, "rate": 0.03, "vol": 0.2,
+    }
+    equity = {
+        "instrument": "equity_option", "spot": 100.0, "strike": 100.0, "maturity": 1.0, "rate": 0.03, "vol": 0.2,
+    }
+    response = client.post("/price", json={"request": asian, "engine": "analytic"})
+    assert response.status_code == 422
+    assert "closed-form" in response.json()["detail"]
+    assert client.post("/price", json={"request": equity, "engine": "mc"}).json()["engine"] == "analytic"
+    assert client.post("/price", json={"request": equity, "engine": "analytic"}).json()["engine"] == "analytic"
+    # Vanillas are always analytic, so an "mc" batch mixing them with exotics prices item by item.
+    batch = client.post("/batch", json={"requests": [equity, asian], "engine": "mc", "n_paths": 2000, "n_steps": 12})
+    assert batch.status_code == 200
+    assert batch.json()["engines"] == ["analytic", "mc"]
+    assert client.post("/batch", json={"requests": [equity, asian], "engine": "analytic"}).status_code == 422
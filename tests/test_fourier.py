@@ -0,0 +1,20 @@
+import numpy as np
+
+from bspricer.models import black_scholes_cf, bs_price_many, heston_cf
+from bspricer.pricing import price_fft
+
+
+def test_fft_chain_matches_black_scholes_and_heston():
+    strikes = np.linspace(50.0, 200.0, 200)
+    maturities = np.array([0.1, 0.5, 1.0, 2.0])
+    exact = bs_price_many(100.0, strikes[None, :], maturities[:, None], 0.03, 0.01, 0.2, "put")
+    fft = price_fft(black_scholes_cf(0.03, 0.01, 0.2), 100.0, strikes, maturities, 0.03, 0.01, "put")
+    assert fft.shape == (4, 200)
+    assert np.abs(fft - exact).max() < 1e-4
+    # Vanishing vol-of-vol with v0 = theta collapses Heston to Black-Scholes.
+    flat = heston_cf(0.03, 0.01, 0.04, 1.5, 0.04, 1e-5, -0.7)
+    assert np.abs(price_fft(flat, 100.0, strikes, maturities, 0.03, 0.01, "put") - exact).max() < 1e-3
+    # Reference: Gil-Pelaez quadrature.
+    heston = heston_cf(0.0, 0.0, 0.04, 1.5, 0.04, 0.3, -0.7)
+    calls = price_fft(heston, 100.0, np.array([90.0, 100.0, 110.0]), 1.0, 0.0)
+    assert np.abs(calls - np.array([13.810205, 7.540267, 3.324675])).max() < 1e-5
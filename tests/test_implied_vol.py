@@ -0,0 +1,41 @@
+import numpy as np
+
+from bspricer.calibration.implied_vol import implied_vol_many, implied_vol_newton
+from bspricer.calibration.iv_table import ImpliedVolTable
+from bspricer.models.black_scholes import price, price_many
+
+
+def test_implied_vol_newton_recovers_vol():
+    target = price(100.0, 110.0, 0.5, 0.02, 0.0, 0.3, "call")
+    assert abs(implied_vol_newton(target, 100.0, 110.0, 0.5, 0.02, 0.0, "call") - 0.3) < 1e-5
+
+
+def test_implied_vol_many_recovers_chain_and_flags_bad_quotes():
+    strikes = np.linspace(50.0, 200.0, 61)
+    maturities = np.array([[0.05], [0.5], [2.0]])
+    vols = 0.15 + 0.4 * np.abs(np.log(strikes / 100.0))
+    is_call = strikes >= 100.0
+    quotes = price_many(100.0, strikes, maturities, 0.03, 0.01, vols, is_call)
+    result = implied_vol_many(quotes, 100.0, strikes, maturities, 0.03, 0.01, is_call)
+    live = quotes > 1e-8
+    assert result["converged"][live].all()
+    assert np.max(np.abs(result["vol"] - vols)[live]) < 1e-7
+
+    bad = implied_vol_many(np.array([-1.0, 150.0]), 100.0, 100.0, 1.0, 0.03, 0.0, "call")
+    assert not bad["converged"].any()
+    assert np.isnan(bad["vol"]).all()
+
+
+def test_implied_vol_table_round_trip(tmp_path):
+    ImpliedVolTable.build(n_moneyness=81, n_price=161).save(tmp_path / "iv_table")
+    table = ImpliedVolTable.load(tmp_path / "iv_table")
+    assert isinstance(table.log_total_vol, np.memmap)
+
+    strikes = np.linspace(60.0, 160.0, 41)
+    maturities = np.array([[0.1], [1.0], [3.0]])
+    vols = 0.12 + 0.5 * np.abs(np.log(strikes / 100.0))
+    is_call = strikes >= 100.0
+    quotes = price_many(100.0, strikes, maturities, 0.03, 0.01, vols, is_call)
+    result = table.implied_vol(quotes, 100.0, strikes, maturities, 0.03, 0.01, is_call)
+    live = quotes > 1e-6
+    assert np.max(np.abs(result - vols)[live]) < 1e-7
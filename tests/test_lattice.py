@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from bspricer.instruments import EquityOption, ExerciseStyle, FXOption, OptionType
+from bspricer.models.black_scholes import price_and_greeks
+from bspricer.pricing import (
+    analytics,
+    greeks_equity_option,
+    greeks_fx_option,
+    price_equity_option,
+    price_equity_option_lattice,
+    price_fx_option,
+    price_lattice,
+)
+
+
+def test_bbsr_lattice_chain_matches_references():
+    market = dict(spot=100.0, maturity=1.0, rate=0.05, dividend_yield=0.02, vol=0.25)
+    strikes = np.linspace(80.0, 120.0, 9)
+    european = price_lattice(strike=strikes, option_type="put", american=False, **market)
+    exact = price_and_greeks(strike=strikes, option_type="put", **market)
+    for name in ("price", "delta", "gamma"):
+        assert np.abs(european[name] - exact[name]).max() < 2e-3
+    # Reference: BBSR with 4096 steps.
+    american = price_lattice(strike=100.0, option_type="put", **market)
+    assert abs(american["price"] - 8.56524) < 2e-3
+    assert abs(american["delta"] + 0.41903) < 1e-3
+
+
+def test_american_vanillas_route_to_lattice():
+    equity = EquityOption(100.0, 100.0, 1.0, 0.05, 0.02, 0.25, OptionType.PUT, ExerciseStyle.AMERICAN)
+    fx = FXOption(100.0, 100.0, 1.0, 0.05, 0.02, 0.25, OptionType.PUT, ExerciseStyle.AMERICAN)
+    batch = price_equity_option([EquityOption(100.0, 100.0, 1.0, 0.05, 0.02, 0.25, OptionType.PUT), equity])
+    assert batch[1] > batch[0] + 0.3
+    assert abs(price_fx_option(fx) - batch[1]) < 1e-12
+    assert abs(price_equity_option(equity) - batch[1]) < 1e-12
+
+
+def test_lattice_expired_trades_and_step_validation():
+    expired = EquityOption(100.0, 90.0, 0.0, 0.05, 0.02, 0.25, OptionType.PUT, ExerciseStyle.AMERICAN)
+    assert price_equity_option(expired) == 0.0
+    result = price_lattice(spot=80.0, strike=90.0, maturity=0.0, rate=0.05, dividend_yield=0.0, vol=0.2, option_type="put")
+    assert result == {"price": 10.0, "delta": -1.0, "gamma": 0.0}
+    market = dict(spot=100.0, strike=100.0, maturity=1.0, rate=0.05, dividend_yield=0.02, vol=0.25)
+    assert price_lattice(**market, steps=8)["price"] > 0.0
+    with pytest.raises(ValueError, match="at least 8"):
+        price_lattice(**market, steps=4)
+
+
+def test_american_greeks_come_off_the_tree():
+    put = EquityOption(100.0, 100.0, 1.0, 0.08, 0.0, 0.25, OptionType.PUT, ExerciseStyle.AMERICAN)
+    tree = price_equity_option_lattice(put, greeks=True)
+    greeks = greeks_equity_option(put)
+    assert greeks == {"delta": tree["delta"], "gamma": tree["gamma"]}
+    european = greeks_equity_option(EquityOption(100.0, 100.0, 1.0, 0.08, 0.0, 0.25, OptionType.PUT))
+    assert greeks["delta"] < european["delta"] - 0.03
+    # The tree gives no vega, theta or rho: asking for them fails instead of returning European values.
+    with pytest.raises(KeyError):
+        greeks["vega"]
+    batch = greeks_equity_option([EquityOption(100.0, 100.0, 1.0, 0.08, 0.0, 0.25, OptionType.PUT), put])
+    assert set(batch) == {"delta", "gamma"}
+    assert batch["delta"][0] == pytest.approx(european["delta"])
+    assert batch["delta"][1] == pytest.approx(tree["delta"])
+    fx = FXOption(100.0, 100.0, 1.0, 0.08, 0.0, 0.25, OptionType.PUT, ExerciseStyle.AMERICAN)
+    assert greeks_fx_option(fx) == greeks
+
+
+def test_american_pde_fallback_prices_expired_trades(monkeypatch):
+    monkeypatch.setattr(analytics, "numba_available", lambda: False)
+    expired = EquityOption(80.0, 90.0, 0.0, 0.05, 0.02, 0.25, OptionType.PUT, ExerciseStyle.AMERICAN)
+    live = EquityOption(100.0, 100.0, 1.0, 0.05, 0.02, 0.25, OptionType.PUT, ExerciseStyle.AMERICAN)
+    assert price_equity_option(expired) == 10.0
+    assert greeks_equity_option(expired) == {"delta": -1.0, "gamma": 0.0}
+    assert price_equity_option([expired, live])[1] == pytest.approx(8.56524, abs=5e-3)
@@ -1,4 +1,37 @@
-from bspricer.pricing.monte_carlo import price_asian_option_mc
+import math
+
+import numpy as np
+import pytest
+
+from bspricer.config import MonteCarloSettings
+from bspricer.models.barrier import price as barrier_price
+from bspricer.models.black_scholes import price as bs_price
+from bspricer.models.digital import price as digital_price
+from bspricer.models.geometric_asian import price as geometric_asian_price
+from bspricer.performance.numba_kernels import numba_available
+from bspricer.pricing import (
+    AsianPayoff,
+    BarrierPayoff,
+    BasketPayoff,
+    BestOfPayoff,
+    DigitalPayoff,
+    WorstOfPayoff,
+    bump_greeks_mc,
+    correlation_factor,
+    greeks_asian_option_mc,
+    greeks_digital_option_mc,
+    price_mlmc,
+    price_multi_asset_mc,
+    price_payoffs_mc,
+)
+from bspricer.pricing.monte_carlo import (
+    greeks_barrier_option_mc,
+    price_asian_option_mc,
+    price_barrier_option_mc,
+    price_digital_option_mc,
+    simulate_gbm_paths,
+)
+from bspricer.pricing.qmc import sobol_available
 
 
 def test_asian_mc_positive_price():
@@ -15,3 +48,320 @@ def test_asian_mc_positive_price():
         seed=42,
     )
     assert value > 0.0
+
+
+def test_streaming_pricers_match_full_path_matrix():
+    paths = simulate_gbm_paths(100.0, 0.03, 0.01, 0.2, 1.0, 50, 5000, seed=7)
+    discount = math.exp(-0.03)
+    expected_asian = discount * np.mean(np.maximum(paths[:, 1:].mean(axis=1) - 100.0, 0.0))
+    expected_barrier = discount * np.mean(np.maximum(paths[:, -1] - 100.0, 0.0) * (paths.max(axis=1) < 120.0))
+    settings = MonteCarloSettings(chunk_size=777)
+    common = dict(spot=100.0, strike=100.0, maturity=1.0, rate=0.03, dividend_yield=0.01, vol=0.2)
+    asian = price_asian_option_mc(**common, n_paths=5000, steps=50, seed=7, settings=settings)
+    barrier = price_barrier_option_mc(
+        **common, barrier=120.0, barrier_type="up-and-out", n_paths=5000, steps=50, seed=7, settings=settings
+    )
+    assert abs(asian - expected_asian) < 1e-10
+    assert abs(barrier - expected_barrier) < 1e-10
+
+
+def test_sobol_bridge_beats_pseudo_random_error():
+    if not sobol_available():
+        pytest.skip("SciPy is not available")
+    common = dict(spot=100.0, strike=100.0, maturity=1.0, rate=0.03, dividend_yield=0.0, vol=0.2, n_paths=4096, steps=32)
+    qmc = price_asian_option_mc(**common, seed=1, settings=MonteCarloSettings(sampler="sobol"), detailed=True)
+    pseudo = price_asian_option_mc(**common, seed=1, detailed=True)
+    assert qmc.n_paths == 4096
+    assert qmc.stderr < pseudo.stderr / 5.0
+    assert abs(qmc.price - pseudo.price) < 4.0 * pseudo.stderr
+
+
+def test_antithetic_and_geometric_control_variate_reduce_error():
+    common = dict(spot=100.0, strike=100.0, maturity=1.0, rate=0.03, dividend_yield=0.01, vol=0.2, n_paths=20000, steps=50)
+    plain = price_asian_option_mc(**common, seed=2, detailed=True)
+    antithetic = price_asian_option_mc(**common, seed=2, settings=MonteCarloSettings(antithetic=True), detailed=True)
+    controlled = price_asian_option_mc(**common, seed=2, control_variate=True, detailed=True)
+    assert antithetic.n_paths == 20000
+    assert antithetic.variance_reduction > 1.2
+    assert controlled.variance_reduction > 100.0
+    assert abs(controlled.price - plain.price) < 4.0 * plain.stderr
+
+
+def test_parallel_workers_are_bit_identical():
+    common = dict(spot=100.0, strike=100.0, maturity=1.0, rate=0.03, dividend_yield=0.01, vol=0.2, n_paths=10000, steps=20)
+    serial = price_asian_option_mc(**common, seed=4, settings=MonteCarloSettings(chunk_size=1024, workers=1), detailed=True)
+    parallel = price_asian_option_mc(**common, seed=4, settings=MonteCarloSettings(chunk_size=1024, workers=4), detailed=True)
+    assert serial == parallel
+    paths_serial = simulate_gbm_paths(100.0, 0.03, 0.0, 0.2, 1.0, 10, 40000, seed=3, workers=1)
+    paths_parallel = simulate_gbm_paths(100.0, 0.03, 0.0, 0.2, 1.0, 10, 40000, seed=3, workers=3)
+    assert np.array_equal(paths_serial, paths_parallel)
+    assert price_asian_option_mc(**common, seed=4, settings=MonteCarloSettings(chunk_size=1024), detailed=True) == serial
+    assert np.array_equal(simulate_gbm_paths(100.0, 0.03, 0.0, 0.2, 1.0, 10, 40000, seed=3), paths_serial)
+
+
+def test_adaptive_mc_stops_at_target_stderr():
+    common = dict(spot=100.0, strike=100.0, maturity=1.0, rate=0.03, dividend_yield=0.01, vol=0.2, steps=20)
+    settings = MonteCarloSettings(chunk_size=2048, target_stderr=0.05)
+    result = price_asian_option_mc(**common, n_paths=1_000_000, seed=5, settings=settings, detailed=True)
+    assert result.stderr <= 0.05
+    assert result.n_paths < 1_000_000
+    low, high = result.confidence_interval()
+    assert low < result.price < high
+    capped = price_asian_option_mc(
+        **common, n_paths=4096, seed=5, settings=MonteCarloSettings(chunk_size=2048, target_stderr=1e-6), detailed=True
+    )
+    assert capped.n_paths == 4096
+    timed = price_asian_option_mc(
+        **common, n_paths=1_000_000, seed=5, settings=MonteCarloSettings(max_seconds=0.0), detailed=True
+    )
+    assert timed.n_paths == 16384
+    with pytest.raises(ValueError):
+        price_asian_option_mc(**common, n_paths=4096, settings=MonteCarloSettings(sampler="sobol", max_seconds=1.0))
+
+
+def test_multi_payoff_pricing_matches_single_pricers():
+    market = dict(spot=100.0, maturity=1.0, rate=0.03, dividend_yield=0.01, vol=0.2)
+    run = dict(n_paths=4000, steps=30, seed=3)
+    specs = [AsianPayoff(95.0, "put"), BarrierPayoff(100.0, 120.0, "up-and-out"), DigitalPayoff(105.0, 2.0)]
+    prices = price_payoffs_mc(specs, **market, **run)
+    expected = [
+        price_asian_option_mc(strike=95.0, option_type="put", **market, **run),
+        price_barrier_option_mc(strike=100.0, barrier=120.0, barrier_type="up-and-out", **market, **run),
+        price_digital_option_mc(strike=105.0, payout=2.0, **market, **run),
+    ]
+    assert np.allclose(prices, expected, rtol=0.0, atol=1e-12)
+
+
+def test_barrier_corrections_remove_discrete_monitoring_bias():
+    common = dict(
+        spot=100.0, strike=100.0, maturity=1.0, rate=0.03, dividend_yield=0.01, vol=0.2,
+        barrier=120.0, barrier_type="up-and-out", n_paths=20000, seed=1, detailed=True,
+    )
+    exact = barrier_price(100.0, 100.0, 1.0, 0.03, 0.01, 0.2, 120.0, "up-and-out", "call")
+    coarse = price_barrier_option_mc(**common, steps=8)
+    bridge = price_barrier_option_mc(**common, steps=8, barrier_correction="bridge")
+    assert abs(bridge.price - exact) < 4.0 * bridge.stderr + 0.02
+    # BGK is an asymptotic shift: at 8 steps it removes most of the bias, at 64 nearly all of it.
+    coarse_bgk = price_barrier_option_mc(**common, steps=8, barrier_correction="bgk")
+    fine_bgk = price_barrier_option_mc(**common, steps=64, barrier_correction="bgk")
+    assert abs(coarse_bgk.price - exact) < 0.3 * (coarse.price - exact)
+    assert abs(fine_bgk.price - exact) < 4.0 * fine_bgk.stderr + 0.03
+    assert coarse.price - exact > 10.0 * coarse.stderr
+
+
+def test_in_simulation_greeks():
+    market = dict(spot=100.0, strike=100.0, maturity=1.0, rate=0.03, dividend_yield=0.01, vol=0.2)
+    run = dict(n_paths=20000, steps=20, seed=1)
+    greeks = greeks_asian_option_mc(**market, **run)
+    bumped = dict(market, spot=100.5)
+    dropped = dict(market, spot=99.5)
+    fd_delta = (price_asian_option_mc(**bumped, **run) - price_asian_option_mc(**dropped, **run)) / 1.0
+    assert abs(greeks["price"] - price_asian_option_mc(**market, **run)) < 1e-12
+    assert abs(greeks["delta"] - fd_delta) < 1e-3
+
+    digital = greeks_digital_option_mc(**market, **run, detailed=True)
+    # Closed-form digital delta by central differences.
+    h = 1e-4
+    expected_delta = (digital_price(**dict(market, spot=100.0 + h)) - digital_price(**dict(market, spot=100.0 - h))) / (2.0 * h)
+    assert abs(digital["delta"].price - expected_delta) < 4.0 * digital["delta"].stderr
+
+
+def test_barrier_likelihood_ratio_greeks_match_closed_form_differences():
+    market = dict(strike=100.0, maturity=1.0, rate=0.03, dividend_yield=0.01)
+    steps = 50
+    for barrier, barrier_type in ((90.0, "down-and-out"), (85.0, "down-and-in")):
+        # The paths monitor the barrier on the 50 dates, which the closed form matches with the
+        # barrier moved away by exp(0.5826 vol sqrt(dt)) (Broadie-Glasserman-Kou).
+        def price(spot: float, vol: float) -> float:
+            shifted = barrier * math.exp(-0.5826 * vol * math.sqrt(1.0 / steps))
+            return barrier_price(spot, vol=vol, barrier=shifted, barrier_type=barrier_type, **market)
+
+        h = 1e-4
+        expected = {
+            "delta": (price(100.0 + h, 0.2) - price(100.0 - h, 0.2)) / (2.0 * h),
+            "vega": (price(100.0, 0.2 + h) - price(100.0, 0.2 - h)) / (2.0 * h),
+        }
+        greeks = greeks_barrier_option_mc(
+            spot=100.0, vol=0.2, barrier=barrier, barrier_type=barrier_type, **market,
+            n_paths=20000, steps=steps, seed=2, detailed=True,
+        )
+        for name, value in expected.items():
+            assert abs(greeks[name].price - value) < 4.0 * greeks[name].stderr
+
+
+def test_bump_greeks_use_common_random_numbers():
+    market = dict(spot=100.0, maturity=1.0, rate=0.03, dividend_yield=0.01, vol=0.2)
+    run = dict(n_paths=10000, steps=20, seed=1)
+    bumped = bump_greeks_mc(AsianPayoff(100.0), **market, **run)
+    pathwise = greeks_asian_option_mc(strike=100.0, **market, **run)
+    assert abs(bumped["price"] - pathwise["price"]) < 1e-12
+    for name in ("delta", "vega", "rho"):
+        assert abs(bumped[name] - pathwise[name]) < 2e-3 * abs(pathwise[name])
+    assert bumped["gamma"] > 0.0
+    assert bumped["theta"] < 0.0
+
+
+def test_bump_greeks_of_discontinuous_payoffs_match_closed_forms():
+    market = dict(spot=100.0, maturity=1.0, rate=0.03, dividend_yield=0.01, vol=0.2)
+
+    def central(price, h):
+        # Closed-form greeks by central differences in (spot, vol, rate).
+        return {
+            "delta": (price(100.0 + h, 0.2, 0.03) - price(100.0 - h, 0.2, 0.03)) / (2.0 * h),
+            "vega": (price(100.0, 0.2 + h, 0.03) - price(100.0, 0.2 - h, 0.03)) / (2.0 * h),
+            "rho": (price(100.0, 0.2, 0.03 + h) - price(100.0, 0.2, 0.03 - h)) / (2.0 * h),
+        }
+
+    cases = [
+        (
+            DigitalPayoff(100.0), 1, None,
+            central(lambda s, v, r: digital_price(s, 100.0, 1.0, r, 0.01, v), 1e-5),
+        ),
+        (
+            BarrierPayoff(100.0, 120.0, "up-and-out"), 50, "bridge",
+            central(lambda s, v, r: barrier_price(s, 100.0, 1.0, r, 0.01, v, 120.0, "up-and-out"), 1e-5),
+        ),
+    ]
+    for payoff, steps, correction, exact in cases:
+        bumped = bump_greeks_mc(
+            payoff, **market, n_paths=20000, steps=steps, seed=3, barrier_correction=correction, detailed=True
+        )
+        for name, value in exact.items():
+            assert abs(bumped[name].price - value) < 4.0 * bumped[name].stderr
+        # The scaled bumps keep the paired-difference noise well below the greek itself.
+        assert bumped["rho"].stderr < 0.35 * abs(exact["rho"])
+        assert bumped["vega"].stderr < 0.1 * abs(exact["vega"])
+
+
+def test_numba_kernel_backend_matches_numpy_engine():
+    if not numba_available():
+        pytest.skip("Numba is not available")
+    numba = pytest.importorskip("numba")
+    common = dict(spot=100.0, strike=100.0, maturity=1.0, rate=0.03, dividend_yield=0.01, vol=0.2, n_paths=20000, steps=50)
+    kernel = MonteCarloSettings(backend="numba")
+    asian = price_asian_option_mc(**common, seed=9, settings=kernel, detailed=True)
+    assert asian == price_asian_option_mc(**common, seed=9, settings=kernel, detailed=True)
+    reference = price_asian_option_mc(**common, seed=9, detailed=True)
+    assert abs(asian.price - reference.price) < 4.0 * math.hypot(asian.stderr, reference.stderr)
+    barrier = dict(common, barrier=120.0, barrier_type="up-and-out")
+    fast = price_barrier_option_mc(**barrier, seed=9, settings=kernel, detailed=True)
+    slow = price_barrier_option_mc(**barrier, seed=9, detailed=True)
+    assert abs(fast.price - slow.price) < 4.0 * math.hypot(fast.stderr, slow.stderr)
+    with pytest.raises(ValueError):
+        price_asian_option_mc(**common, settings=kernel, control_variate=True)
+    # The reduction order is fixed, so the price is bit-identical for any thread count.
+    threads = numba.get_num_threads()
+    try:
+        numba.set_num_threads(1)
+        single = price_barrier_option_mc(**barrier, seed=9, settings=kernel, detailed=True)
+    finally:
+        numba.set_num_threads(threads)
+    assert single == fast
+    # Entry points without a kernel reject the backend instead of silently running NumPy.
+    market = dict(spot=100.0, maturity=1.0, rate=0.03, dividend_yield=0.01, vol=0.2)
+    with pytest.raises(ValueError):
+        greeks_barrier_option_mc(**barrier, settings=kernel)
+    with pytest.raises(ValueError):
+        bump_greeks_mc(AsianPayoff(100.0), **market, n_paths=1000, steps=10, settings=kernel)
+    with pytest.raises(ValueError):
+        price_payoffs_mc([AsianPayoff(100.0)], **market, n_paths=1000, steps=10, settings=kernel)
+    with pytest.raises(ValueError):
+        price_mlmc(AsianPayoff(100.0), **market, settings=kernel)
+
+
+def test_mlmc_meets_tolerance_against_closed_forms():
+    market = dict(spot=100.0, maturity=1.0, rate=0.05, dividend_yield=0.02, vol=0.25)
+    result = price_mlmc(BarrierPayoff(100.0, 130.0, "up-and-out"), tolerance=0.02, seed=1, **market)
+    exact = barrier_price(strike=100.0, barrier=130.0, barrier_type="up-and-out", **market)
+    assert result.stderr < 0.02
+    assert abs(result.price - exact) < 0.05
+    # Asians target continuous averaging: 1024 fixings, less the geometric closed form's gap between
+    # 1024 fixings and continuous averaging, estimate that limit.
+    asian = price_mlmc(AsianPayoff(100.0), tolerance=0.01, seed=1, **market)
+    fixed = price_asian_option_mc(strike=100.0, **market, n_paths=20000, steps=1024, seed=1, control_variate=True)
+    gap = geometric_asian_price(strike=100.0, **market, steps=1024) - geometric_asian_price(strike=100.0, **market)
+    assert abs(asian.price - (fixed - gap)) < 0.02
+    for settings in (MonteCarloSettings(antithetic=True), MonteCarloSettings(dtype="float32"), MonteCarloSettings(workers=2)):
+        with pytest.raises(ValueError, match="does not support"):
+            price_mlmc(AsianPayoff(100.0), settings=settings, **market)
+
+
+def test_importance_sampling_rare_digital():
+    market = dict(spot=100.0, strike=160.0, maturity=1.0, rate=0.03, dividend_yield=0.0, vol=0.2)
+    plain = price_digital_option_mc(**market, n_paths=20000, steps=12, seed=1, detailed=True)
+    shifted = price_digital_option_mc(
+        **market, n_paths=20000, steps=12, seed=1, detailed=True,
+        settings=MonteCarloSettings(importance_sampling=True),
+    )
+    assert shifted.stderr < 0.25 * plain.stderr
+    assert shifted.variance_reduction > 10.0
+    assert abs(shifted.price - digital_price(**market)) < 4.0 * shifted.stderr
+
+
+def test_importance_sampling_knock_in_stderr_covers_closed_form():
+    market = dict(spot=100.0, maturity=1.0, rate=0.03, dividend_yield=0.01, vol=0.2)
+    settings = MonteCarloSettings(importance_sampling=True)
+    for strike, barrier, barrier_type, option_type in ((110.0, 75.0, "down-and-in", "call"), (90.0, 140.0, "up-and-in", "put")):
+        option = dict(strike=strike, barrier=barrier, barrier_type=barrier_type, option_type=option_type)
+        exact = barrier_price(**market, **option)
+        runs = [
+            price_barrier_option_mc(
+                **market, **option, n_paths=20000, steps=32, seed=seed, settings=settings,
+                barrier_correction="bridge", detailed=True,
+            )
+            for seed in range(20)
+        ]
+        z = np.array([(run.price - exact) / run.stderr for run in runs])
+        # The reported stderr must describe the real error across seeds, not just shrink.
+        assert np.sum(np.abs(z) > 3.0) <= 1
+        assert abs(z.mean()) < 0.6
+        assert 0.6 < z.std() < 1.5
+        assert min(run.variance_reduction for run in runs) > 50.0
+
+
+def test_multi_asset_best_of_matches_margrabe():
+    spots, dividends, vols, rho = [100.0, 95.0], [0.01, 0.02], [0.2, 0.3], 0.4
+    correlation = np.array([[1.0, rho], [rho, 1.0]])
+    best, worst = price_multi_asset_mc(
+        [BestOfPayoff(0.0), WorstOfPayoff(110.0, "put")], spots, 1.0, 0.03, dividends, vols, correlation,
+        n_paths=100000, seed=2, detailed=True,
+    )
+    # max(S1, S2) = S2 + max(S1 - S2, 0): Margrabe's exchange option, a Black-Scholes call on S1
+    # struck at S2 with S2's yield as the rate and the spread vol.
+    s = math.sqrt(vols[0] ** 2 + vols[1] ** 2 - 2.0 * rho * vols[0] * vols[1])
+    exchange = bs_price(spots[0], spots[1], 1.0, dividends[1], dividends[0], s, "call")
+    assert abs(best.price - spots[1] * math.exp(-dividends[1]) - exchange) < 4.0 * best.stderr
+    assert worst.price > 0.0
+    assert correlation_factor(correlation) is correlation_factor(correlation.copy())
+
+
+def test_multi_asset_basket_and_worst_of_against_closed_forms():
+    # Identical, (almost) perfectly correlated assets: the basket is the single asset.
+    twins = np.array([[1.0, 0.999999], [0.999999, 1.0]])
+    basket, single = price_multi_asset_mc(
+        [BasketPayoff(100.0, (0.5, 0.5))], 100.0, 1.0, 0.03, 0.01, 0.2, twins, n_paths=50000, seed=4, detailed=True
+    ) + price_multi_asset_mc(
+        [BasketPayoff(100.0, (1.0,))], 100.0, 1.0, 0.03, 0.01, 0.2, np.eye(1), n_paths=50000, seed=4, detailed=True
+    )
+    expected = bs_price(100.0, 100.0, 1.0, 0.03, 0.01, 0.2, "call")
+    assert abs(basket.price - expected) < 4.0 * basket.stderr
+    assert abs(single.price - expected) < 4.0 * single.stderr
+
+    # Per path max(S1, S2) + min(S1, S2) = S1 + S2, so best-of + worst-of calls = the two vanilla calls,
+    # and the zero-strike worst-of is the two forwards less the zero-strike best-of.
+    spots, dividends, vols, rho = [100.0, 95.0], [0.01, 0.02], [0.2, 0.3], 0.4
+    correlation = np.array([[1.0, rho], [rho, 1.0]])
+    best, worst, best_zero, worst_zero = price_multi_asset_mc(
+        [BestOfPayoff(100.0), WorstOfPayoff(100.0), BestOfPayoff(0.0), WorstOfPayoff(0.0)],
+        spots, 1.0, 0.03, dividends, vols, correlation, n_paths=100000, seed=5, detailed=True,
+    )
+    calls = sum(bs_price(s, 100.0, 1.0, 0.03, q, v, "call") for s, q, v in zip(spots, dividends, vols))
+    assert abs(best.price + worst.price - calls) < 4.0 * (best.stderr + worst.stderr)
+    s = math.sqrt(vols[0] ** 2 + vols[1] ** 2 - 2.0 * rho * vols[0] * vols[1])
+    exchange = bs_price(spots[0], spots[1], 1.0, dividends[1], dividends[0], s, "call")
+    forwards = sum(spot * math.exp(-q) for spot, q in zip(spots, dividends))
+    assert abs(worst_zero.price - (forwards - spots[1] * math.exp(-dividends[1]) - exchange)) < 4.0 * worst_zero.stderr
+    assert best_zero.price > worst_zero.price > worst.price
+
+    with pytest.raises(ValueError):
+        price_multi_asset_mc([BestOfPayoff(100.0)], [100.0, 95.0, 90.0], 1.0, 0.03, 0.0, 0.2, correlation)
@@ -0,0 +1,32 @@
+import numpy as np
+
+from bspricer.instruments import BarrierOption, BarrierType, EquityOption, ExerciseStyle, OptionType
+from bspricer.models.barrier import price as barrier_price
+from bspricer.models.black_scholes import price_and_greeks
+from bspricer.pricing import price_barrier_option_pde, price_equity_option_pde, price_pde
+
+
+def test_pde_matches_closed_forms_on_one_grid():
+    market = dict(spot=100.0, maturity=1.0, rate=0.05, dividend_yield=0.02, vol=0.25)
+    strikes = np.linspace(80.0, 120.0, 9)
+    grid = price_pde(strike=strikes, option_type="put", **market)
+    exact = price_and_greeks(strike=strikes, option_type="put", **market)
+    for name in ("price", "delta", "gamma"):
+        assert np.abs(grid[name] - exact[name]).max() < 2e-3
+    for barrier_type, barrier in (("up-and-out", 130.0), ("down-and-in", 85.0)):
+        option = BarrierOption(strike=100.0, barrier=barrier, barrier_type=BarrierType(barrier_type), **market)
+        closed = barrier_price(strike=100.0, barrier=barrier, barrier_type=barrier_type, **market)
+        assert abs(price_barrier_option_pde(option) - closed) < 1e-3
+
+
+def test_american_equity_options_on_pde():
+    market = dict(spot=100.0, strike=100.0, maturity=1.0, rate=0.05, dividend_yield=0.02, vol=0.25)
+    european = EquityOption(**market, option_type=OptionType.PUT)
+    american = EquityOption(**market, option_type=OptionType.PUT, exercise=ExerciseStyle.AMERICAN)
+    prices = price_equity_option_pde([european, american])
+    # Reference: 5000-step CRR tree.
+    assert abs(prices[1] - 8.5650) < 2e-3
+    assert prices[1] > prices[0] + 0.3
+    call = dict(market, dividend_yield=0.0)
+    no_dividend = price_equity_option_pde(EquityOption(**call, exercise=ExerciseStyle.AMERICAN))
+    assert abs(no_dividend - price_equity_option_pde(EquityOption(**call))) < 1e-3
@@ -0,0 +1,22 @@
+import numpy as np
+
+from bspricer.models.black_scholes import price_and_greeks
+from bspricer.performance.benchmarks import run_precision_check
+from bspricer.performance.cpp_wrapper import black_scholes_greeks_batch_cpp, black_scholes_price_batch_cpp
+
+
+def test_cpp_batch_writes_into_caller_buffer():
+    strikes = np.linspace(80.0, 120.0, 9)
+    out = np.empty_like(strikes)
+    result = black_scholes_price_batch_cpp(100.0, strikes, 1.0, 0.03, 0.01, 0.2, "put", out=out)
+    greeks = black_scholes_greeks_batch_cpp(100.0, strikes, 1.0, 0.03, 0.01, 0.2, "put")
+    expected = price_and_greeks(100.0, strikes, 1.0, 0.03, 0.01, 0.2, "put")
+    assert result is out
+    assert np.allclose(out, expected["price"], atol=1e-12)
+    for name, value in greeks.items():
+        assert np.allclose(value, expected[name], atol=1e-12)
+
+
+def test_float32_paths_stay_within_monte_carlo_noise():
+    for row in run_precision_check(n_paths=20000, steps=50).values():
+        assert row["abs_diff"] < 1e-3 * row["stderr"]
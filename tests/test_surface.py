@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from bspricer.calibration.surface import SviParams, VolSurface
+from bspricer.instruments.vanilla import EquityOption
+from bspricer.models.black_scholes import price_many
+from bspricer.pricing.analytics import price_equity_option
+
+
+def _synthetic_quotes(spot, rate, dividend_yield, slices):
+    frames = []
+    for maturity, params in slices.items():
+        strikes = np.linspace(60.0, 160.0, 41)
+        log_moneyness = np.log(strikes / spot) - (rate - dividend_yield) * maturity
+        vols = np.sqrt(params.total_variance(log_moneyness) / maturity)
+        is_call = log_moneyness >= 0.0
+        frames.append(
+            pd.DataFrame(
+                {
+                    "maturity": maturity,
+                    "strike": strikes,
+                    "option_type": np.where(is_call, "call", "put"),
+                    "price": price_many(spot, strikes, maturity, rate, dividend_yield, vols, is_call),
+                }
+            )
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+def test_svi_surface_recovers_slices_and_feeds_pricer():
+    slices = {
+        0.25: SviParams(0.01, 0.1, -0.4, 0.0, 0.1),
+        1.0: SviParams(0.03, 0.12, -0.5, 0.05, 0.2),
+    }
+    quotes = _synthetic_quotes(100.0, 0.03, 0.01, slices)
+    surface = VolSurface.calibrate(quotes, 100.0, 0.03, 0.01, workers=2)
+    warm = VolSurface.calibrate(quotes, 100.0, 0.03, 0.01, previous=surface)
+    strikes = np.linspace(70.0, 150.0, 9)
+    for maturity, params in slices.items():
+        log_moneyness = np.log(strikes / 100.0) - 0.02 * maturity
+        expected = np.sqrt(params.total_variance(log_moneyness) / maturity)
+        assert np.max(np.abs(surface.vol(strikes, maturity) - expected)) < 1e-4
+        assert np.max(np.abs(warm.vol(strikes, maturity) - expected)) < 1e-4
+
+    option = EquityOption(spot=100.0, strike=110.0, maturity=1.0, rate=0.03, dividend_yield=0.01, vol=0.0)
+    batch = price_equity_option([option, option], surface=surface)
+    assert abs(price_equity_option(option, surface=surface) - batch[0]) < 1e-10
+    assert batch[1] > 0.0